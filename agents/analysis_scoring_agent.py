@@ -2,13 +2,39 @@
 Analysis & Scoring Agent - Resume-Job Fit Expert
 """
 import logging
+import os
 
 from agents.prompts.analysis_scoring_agent import prompts as ase_prompts
 from graphs.state import ResumeAnalyzerState
+from utils.circuit_breaker import CircuitOpenError
+from utils.deadline import DeadlineExceeded, has_time_for_llm, mark_skipped, remaining_seconds
 from utils.llm_helper import call_llm_with_structured_output
+from utils.logging_config import log_payload
+from utils.model_router import model_router
+from utils.semantic_matcher import semantic_matcher
 
 logger = logging.getLogger(__name__)
 
+# "llm" (default) or "local": score by keyword matching (see SEMANTIC_MATCHING) with no LLM call
+SCORING_MODE = os.getenv("SCORING_MODE", "llm").lower()
+
+
+def _score_locally(state: ResumeAnalyzerState, reason: str):
+    """Deterministic keyword scoring (near-synonyms too with SEMANTIC_MATCHING) used when the LLM stage doesn't run"""
+    scores = semantic_matcher.local_score(state.get("resume_keywords", []), state.get("target_keywords", []))
+    state["matched_keywords"] = scores["matched_keywords"]
+    state["missing_keywords"] = scores["missing_keywords"]
+    state["match_score"] = scores["match_score"]
+    notes = f"Scored locally by keyword matching ({reason})"
+    if scores["fuzzy_matches"]:
+        notes += "; near-synonym matches: " + ", ".join(
+            f"{target} ~ {resume}" for target, resume in scores["fuzzy_matches"].items()
+        )
+    state["confidence_notes"] = notes
+    state["recommendations"] = []
+    state["current_step"] = "analyze_and_score"
+
+
 def analyze_and_score(state: ResumeAnalyzerState) -> ResumeAnalyzerState:
     """
     Node 3: Analyze keywords, calculate match score, generate recommendations
@@ -23,9 +49,12 @@ def analyze_and_score(state: ResumeAnalyzerState) -> ResumeAnalyzerState:
     Returns:
         ResumeAnalyzerState: Updated state
     """
-    logger.info("="*50)
-    logger.info("Analysis Scoring Agent")
-    logger.info("="*50)
+    logger.debug("Analysis Scoring Agent started")
+    
+    if SCORING_MODE == "local":
+        _score_locally(state, "SCORING_MODE=local")
+        logger.info("Match score: %.2f (local scoring)", state["match_score"])
+        return state
     
     try:
         resume_keywords = state.get("resume_keywords", [])
@@ -37,13 +66,24 @@ Resume Keywords: {resume_keywords}
 Target Keywords: {target_keywords}
 """
         
-        logger.info("Calling LLM for analysis and scoring")
+        if not has_time_for_llm(state):
+            raise DeadlineExceeded("not enough time left before the deadline")
+        
+        logger.debug("Calling LLM for analysis and scoring")
         # LLM call for analysis and scoring
+        route = model_router.select("analyze_and_score")
+        usage = {}
         llm_response = call_llm_with_structured_output(
             system_prompt=ase_prompts.ANALYSIS_PROMPT,
             user_input=user_input,
-            temperature=0.0
+            model=route.model,
+            temperature=0.0,
+            base_url=route.base_url,
+            usage=usage,
+            timeout=remaining_seconds(state)
         )
+        state["node_models"] = {**state.get("node_models", {}), "analyze_and_score": route.label}
+        state["llm_usage"] = {**state.get("llm_usage", {}), "analyze_and_score": usage}
         
         # Update state
         state["matched_keywords"] = llm_response.get("matched_keywords", [])
@@ -53,14 +93,33 @@ Target Keywords: {target_keywords}
         state["recommendations"] = llm_response.get("recommendations", [])
         state["current_step"] = "analyze_and_score"
         
-        logger.info(f"Match score: {state['match_score']:.2%}")
-        logger.info(f"Matched keywords ({len(state['matched_keywords'])}): {state['matched_keywords']}")
-        logger.info(f"Missing keywords ({len(state['missing_keywords'])}): {state['missing_keywords']}")
-        logger.info(f"Generated {len(state['recommendations'])} recommendations")
-        logger.debug(f"Confidence notes: {state['confidence_notes']}")
+        logger.info(
+            "Match score: %.2f, matched: %d, missing: %d, recommendations: %d",
+            state["match_score"],
+            len(state["matched_keywords"]),
+            len(state["missing_keywords"]),
+            len(state["recommendations"])
+        )
+        log_payload(
+            logger,
+            "scored_keywords",
+            "Matched keywords: %s | Missing keywords: %s | Confidence notes: %s",
+            state["matched_keywords"],
+            state["missing_keywords"],
+            state["confidence_notes"]
+        )
+        
+    except DeadlineExceeded as e:
+        mark_skipped(state, "analyze_and_score", str(e))
+        _score_locally(state, "deadline reached")
+        
+    except CircuitOpenError as e:
+        mark_skipped(state, "analyze_and_score", str(e))
+        state["degraded"] = True
+        _score_locally(state, "LLM backend unavailable")
         
     except Exception as e:
-        logger.error(f"Error in analyze_and_score node: {str(e)}", exc_info=True)
+        logger.error("Error in analyze_and_score node: %s", e, exc_info=True)
         error_msg = f"Analysis and scoring error: {str(e)}"
         state["errors"] = state.get("errors", []) + [error_msg]
         state["matched_keywords"] = []
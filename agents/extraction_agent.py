@@ -5,7 +5,14 @@ import logging
 
 from agents.prompts.extraction_agent import prompts as ea_prompts
 from graphs.state import ResumeAnalyzerState
+from utils.circuit_breaker import CircuitOpenError
+from utils.deadline import DeadlineExceeded, has_time_for_llm, mark_skipped, remaining_seconds
+from utils.extraction_packer import extraction_packer
 from utils.llm_helper import call_llm_with_structured_output
+from utils.logging_config import log_payload
+from utils.model_router import model_router
+from utils.prompt_builder import job_then_resume
+from utils.skill_lexicon import extract_skills
 
 logger = logging.getLogger(__name__)
 
@@ -24,30 +31,44 @@ def extract_keywords(state: ResumeAnalyzerState) -> ResumeAnalyzerState:
         ResumeAnalyzerState: Updated state
     """
 
-    logger.info("="*50)
-    logger.info("Extraction Agent")
-    logger.info("="*50)
+    logger.debug("Extraction Agent started")
     
     try:
         resume_text = state.get("resume_text", "")
         job_description = state.get("job_description", "")
         
-        # Prepare user input
-        user_input = f"""
-Resume Text:
-{resume_text}
-
-Job Description:
-{job_description if job_description else "(No job description provided)"}
-"""
+        # Prepare user input (job description first so batch runs share a cacheable prefix)
+        user_input = job_then_resume(resume_text, job_description)
+        
+        if not has_time_for_llm(state):
+            raise DeadlineExceeded("not enough time left before the deadline")
         
-        logger.info("Calling LLM for keyword extraction")
+        logger.debug("Calling LLM for keyword extraction")
         # LLM call for keyword extraction
-        llm_response = call_llm_with_structured_output(
-            system_prompt=ea_prompts.EXTRACTION_PROMPT,
-            user_input=user_input,
-            temperature=0.0
+        route = model_router.select("extract_keywords")
+        usage = {}
+        # Short resumes may share one call with concurrent ones (EXTRACTION_PACKING)
+        llm_response = extraction_packer.extract(
+            ea_prompts.PACKED_EXTRACTION_PROMPT,
+            resume_text,
+            job_description,
+            route,
+            timeout=remaining_seconds(state)
         )
+        if llm_response is not None:
+            usage = llm_response.pop("usage")
+        else:
+            llm_response = call_llm_with_structured_output(
+                system_prompt=ea_prompts.EXTRACTION_PROMPT,
+                user_input=user_input,
+                model=route.model,
+                temperature=0.0,
+                base_url=route.base_url,
+                usage=usage,
+                timeout=remaining_seconds(state)
+            )
+        state["node_models"] = {**state.get("node_models", {}), "extract_keywords": route.label}
+        state["llm_usage"] = {**state.get("llm_usage", {}), "extract_keywords": usage}
         
         # Update state
         state["resume_keywords"] = llm_response.get("resume_keywords", [])
@@ -55,14 +76,48 @@ Job Description:
         state["extraction_notes"] = llm_response.get("extraction_notes", "")
         state["current_step"] = "extract_keywords"
         
-        logger.info(f"Extracted {len(state['resume_keywords'])} resume keywords: {state['resume_keywords'][:5]}...")
-        logger.info(f"Extracted {len(state['target_keywords'])} target keywords: {state['target_keywords'][:5]}...")
-        logger.info(f"Extraction notes: {state['extraction_notes']}")
+        logger.info(
+            "Extracted %d resume keywords, %d target keywords",
+            len(state["resume_keywords"]),
+            len(state["target_keywords"])
+        )
+        log_payload(
+            logger,
+            "extracted_keywords",
+            "Resume keywords: %s | Target keywords: %s | Notes: %s",
+            state["resume_keywords"],
+            state["target_keywords"],
+            state["extraction_notes"]
+        )
+        
+    except DeadlineExceeded as e:
+        # Nothing to score without keywords; downstream stages fall through on empty lists
+        mark_skipped(state, "extract_keywords", str(e))
+        state["errors"] = state.get("errors", []) + [f"Keyword extraction skipped: {str(e)}"]
+        state["extraction_failed"] = True
+        state["resume_keywords"] = []
+        state["target_keywords"] = []
+        state["extraction_notes"] = "Skipped: deadline reached"
+        
+    except CircuitOpenError as e:
+        # Fall back to the built-in skill lexicon; coarser, but still scorable
+        mark_skipped(state, "extract_keywords", str(e))
+        state["degraded"] = True
+        state["resume_keywords"] = extract_skills(state.get("resume_text", ""))
+        state["target_keywords"] = extract_skills(state.get("job_description", ""))
+        state["extraction_notes"] = "Extracted locally from the skill lexicon (LLM backend unavailable)"
+        state["current_step"] = "extract_keywords"
+        logger.info(
+            "Lexicon extraction: %d resume keywords, %d target keywords",
+            len(state["resume_keywords"]),
+            len(state["target_keywords"])
+        )
         
     except Exception as e:
-        logger.error(f"Error in extract_keywords node: {str(e)}", exc_info=True)
+        logger.error("Error in extract_keywords node: %s", e, exc_info=True)
         error_msg = f"Keyword extraction error: {str(e)}"
         state["errors"] = state.get("errors", []) + [error_msg]
+        state["extraction_failed"] = True
         state["resume_keywords"] = []
         state["target_keywords"] = []
         state["extraction_notes"] = error_msg
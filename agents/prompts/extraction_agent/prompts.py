@@ -1,4 +1,4 @@
-EXTRACTION_PROMPT = """You are the Extraction Agent, an expert at identifying technical skills and keywords from resumes and job descriptions.
+_EXTRACTION_RULES = """You are the Extraction Agent, an expert at identifying technical skills and keywords from resumes and job descriptions.
 
 Task: Extract all relevant technical skills, tools, frameworks, and keywords.
 
@@ -32,21 +32,9 @@ NO HALLUCINATION RULES:
 - DO NOT add related technologies that aren't mentioned (e.g., don't add "Docker" just because "Kubernetes" is mentioned)
 - If uncertain whether something is mentioned, DO NOT extract it
 
-Inputs:
-1. Resume Text - all of the extracted keywords will be inside the resume_keywords list.
-2. Job Description - all of the extracted keywords will be inside the target_keywords list.
-
-Return a JSON object:
-{{
-  "resume_keywords": [<list of keywords>],
-  "target_keywords": [<list of keywords>],
-  "extraction_notes": "Brief notes on extraction quality or edge cases found"
-}}
+"""
 
-Rules for output format:
-- Do not include comments in the JSON format.
-
-Examples of CORRECT extraction:
+_EXTRACTION_EXAMPLES = """Examples of CORRECT extraction:
 - "experienced with C++" → extract "C++"
 - "Node.js and Express" → extract "Node.js", "Express"
 - "SQL databases like PostgreSQL" → extract "SQL", "PostgreSQL"
@@ -64,4 +52,42 @@ Examples of INCORRECT (avoid):
 - "Kubernetes" mentioned → DO NOT add "Docker" unless explicitly mentioned (no hallucination)
 
 IMPORTANT: If job_description is empty, extract target_keywords as an empty list.
-"""
\ No newline at end of file
+"""
+EXTRACTION_PROMPT = _EXTRACTION_RULES + """Inputs:
+1. Resume Text - all of the extracted keywords will be inside the resume_keywords list.
+2. Job Description - all of the extracted keywords will be inside the target_keywords list.
+
+Return a JSON object:
+{{
+  "resume_keywords": [<list of keywords>],
+  "target_keywords": [<list of keywords>],
+  "extraction_notes": "Brief notes on extraction quality or edge cases found"
+}}
+
+Rules for output format:
+- Do not include comments in the JSON format.
+
+""" + _EXTRACTION_EXAMPLES
+
+# Several resumes against one job description in a single call (see utils/extraction_packer.py)
+PACKED_EXTRACTION_PROMPT = _EXTRACTION_RULES + """Inputs:
+1. Job Description - all of the extracted keywords will be inside the target_keywords list.
+2. Several resumes, each under a "Resume <id>" heading - extract each resume's keywords separately,
+   using ONLY that resume's text, into resumes.<id>.resume_keywords.
+
+Return a JSON object:
+{{
+  "target_keywords": [<list of keywords>],
+  "resumes": {{
+    "<id>": {{
+      "resume_keywords": [<list of keywords>],
+      "extraction_notes": "Brief notes on extraction quality or edge cases found"
+    }}
+  }}
+}}
+
+Rules for output format:
+- Do not include comments in the JSON format.
+- Include every resume id exactly once, even if it has no keywords.
+
+""" + _EXTRACTION_EXAMPLES
@@ -0,0 +1,172 @@
+"""
+Benchmark: prompt prefix caching for a batch of resumes screened against one job
+
+Compares the old layout (resume first, job description second) with the
+cache-friendly layout from utils/prompt_builder.py (job description first) for
+the validate_input and extract_keywords calls.
+
+By default the provider cache is simulated: a prompt's cached part is its
+longest common prefix with any earlier prompt, counted only past 1024 tokens
+and in 128-token steps (OpenAI's documented rules), with tokens estimated as
+characters / 4. Prefill time is estimated from --prefill-ms-per-1k; cached
+tokens are treated as free. With --live the calls go to the configured
+endpoint and the measured latency and usage.prompt_tokens_details.cached_tokens
+are reported instead.
+
+Usage:
+    python -m benchmarks.bench_prefix_caching --resumes 200
+    python -m benchmarks.bench_prefix_caching --resumes 20 --live
+"""
+import argparse
+import os
+import random
+import time
+
+from agents.prompts.extraction_agent import prompts as ea_prompts
+from agents.prompts.resume_analyzer_agent import prompts as ra_prompts
+from utils.prompt_builder import NO_JOB_DESCRIPTION, job_then_resume
+
+CACHE_MIN_TOKENS = 1024
+CACHE_BLOCK_TOKENS = 128
+CHARS_PER_TOKEN = 4
+
+SKILLS = [
+    "Python", "Java", "Go", "Rust", "TypeScript", "React", "Django", "FastAPI", "Kubernetes",
+    "Docker", "Terraform", "AWS", "GCP", "Azure", "PostgreSQL", "MongoDB", "Redis", "Kafka",
+    "Spark", "Airflow", "PyTorch", "TensorFlow", "LangChain", "LangGraph", "CI/CD", "GraphQL",
+]
+
+
+def legacy_user_input(resume_text: str, job_description: str, node: str) -> str:
+    """User message as the nodes built it before the prompt builder (resume first)"""
+    if node == "validate_input":
+        return f"Resume Text:\n{resume_text}\n\nJob Description:\n{job_description}"
+    return f"""
+Resume Text:
+{resume_text}
+
+Job Description:
+{job_description if job_description else NO_JOB_DESCRIPTION}
+"""
+
+
+def job_first_user_input(resume_text: str, job_description: str, node: str) -> str:
+    """User message as the nodes build it now (job description first)"""
+    placeholder = "" if node == "validate_input" else NO_JOB_DESCRIPTION
+    return job_then_resume(resume_text, job_description, placeholder=placeholder)
+
+
+LAYOUTS = {"resume_first": legacy_user_input, "job_first": job_first_user_input}
+NODES = {"validate_input": ra_prompts.VALIDATOR_PROMPT, "extract_keywords": ea_prompts.EXTRACTION_PROMPT}
+
+
+def make_batch(n_resumes: int, seed: int):
+    """Generate one detailed job description and n synthetic resumes"""
+    rng = random.Random(seed)
+    job_lines = [
+        f"- {rng.randint(2, 8)}+ years with {skill}; you will own {skill} services end to end."
+        for skill in rng.sample(SKILLS, 18)
+    ]
+    job_description = "Senior Platform Engineer\n\nResponsibilities and requirements:\n" + "\n".join(job_lines * 3)
+    resumes = []
+    for i in range(n_resumes):
+        lines = [
+            f"Built and operated {skill} systems at Company{rng.randint(1, 500)} for {rng.randint(1, 9)} years."
+            for skill in rng.sample(SKILLS, 12)
+        ]
+        resumes.append(f"Candidate {i}\n" + "\n".join(lines * 2))
+    return job_description, resumes
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN
+
+
+def common_prefix_chars(a: str, b: str) -> int:
+    limit = min(len(a), len(b))
+    i = 0
+    while i < limit and a[i] == b[i]:
+        i += 1
+    return i
+
+
+def simulate(layout: str, node: str, job_description: str, resumes, prefill_ms_per_1k: float):
+    """Simulate provider prefix caching over one batch"""
+    system_prompt = NODES[node]
+    build = LAYOUTS[layout]
+    seen = []
+    prompt_tokens = cached_tokens = 0
+    for resume_text in resumes:
+        prompt = system_prompt + "\n" + build(resume_text, job_description, node)
+        tokens = estimate_tokens(prompt)
+        shared = max((common_prefix_chars(prompt, earlier) for earlier in seen), default=0)
+        shared_tokens = estimate_tokens(prompt[:shared])
+        cached = (shared_tokens // CACHE_BLOCK_TOKENS) * CACHE_BLOCK_TOKENS if shared_tokens >= CACHE_MIN_TOKENS else 0
+        prompt_tokens += tokens
+        cached_tokens += cached
+        # Later prompts can't share a longer prefix than the first few already establish
+        if len(seen) < 4:
+            seen.append(prompt)
+    prefill_ms = (prompt_tokens - cached_tokens) / 1000 * prefill_ms_per_1k
+    return prompt_tokens, cached_tokens, prefill_ms
+
+
+def run_live(layout: str, node: str, job_description: str, resumes):
+    """Send the batch to the configured endpoint and read cached tokens from usage"""
+    from utils.llm_helper import call_llm_with_structured_output
+
+    build = LAYOUTS[layout]
+    prompt_tokens = cached_tokens = 0
+    start = time.perf_counter()
+    for resume_text in resumes:
+        usage = {}
+        try:
+            call_llm_with_structured_output(
+                system_prompt=NODES[node],
+                user_input=build(resume_text, job_description, node),
+                usage=usage
+            )
+        except ValueError:
+            pass  # unparseable JSON still reports usage
+        prompt_tokens += usage.get("prompt_tokens", 0)
+        cached_tokens += usage.get("cached_tokens", 0)
+    return prompt_tokens, cached_tokens, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--resumes", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--prefill-ms-per-1k", type=float, default=25.0, help="Estimated prefill cost per 1k uncached tokens")
+    parser.add_argument("--live", action="store_true", help="Call the endpoint configured by OPENAI_API_BASE/OPENAI_MODEL")
+    args = parser.parse_args()
+
+    job_description, resumes = make_batch(args.resumes, args.seed)
+    mode = f"live ({os.getenv('OPENAI_MODEL', 'gpt-4o-mini')})" if args.live else "simulated"
+    print(f"resumes={args.resumes} job description ~{estimate_tokens(job_description)} tokens, {mode}")
+
+    for node in NODES:
+        results = {}
+        for layout in LAYOUTS:
+            if args.live:
+                results[layout] = run_live(layout, node, job_description, resumes)
+            else:
+                results[layout] = simulate(layout, node, job_description, resumes, args.prefill_ms_per_1k)
+
+        print(f"\n{node}")
+        for layout, (prompt_tokens, cached_tokens, elapsed_ms) in results.items():
+            ratio = cached_tokens / prompt_tokens if prompt_tokens else 0.0
+            label = "total latency" if args.live else "est. prefill"
+            print(
+                f"  {layout:<13} prompt={prompt_tokens:>9} cached={cached_tokens:>9} ({ratio:6.1%}) "
+                f"{label}={elapsed_ms / 1e3:8.2f}s"
+            )
+        before, after = results["resume_first"], results["job_first"]
+        print(
+            f"  savings: {after[1] - before[1]} more cached tokens, "
+            f"{(before[2] - after[2]) / 1e3:.2f}s less {'latency' if args.live else 'prefill'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark: the full analysis workflow with LLM calls replayed from cassettes
+
+Record once against a live endpoint, then replay as often as needed with no
+network access. Replay answers each call from data/cassettes (or --cassette-dir)
+and can sleep for the recorded latency (--latency-scale 1) to load-test the
+pipeline's concurrency, or skip it (--latency-scale 0) to profile local
+overhead alone. The synthetic resumes are generated from --seed, so the same
+arguments produce the same prompts; keep the model routing configuration
+unchanged between recording and replay, since cassettes are keyed by model.
+
+Usage:
+    python -m benchmarks.bench_replay --mode record --resumes 20
+    python -m benchmarks.bench_replay --mode replay --resumes 20 --concurrency 8 --latency-scale 1
+"""
+import argparse
+import random
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from services.resume_service import resume_analysis_service
+from utils.llm_cassette import LLM_CASSETTE_DIR, RECORD, REPLAY, llm_cassette
+
+SKILLS = [
+    "Python", "Java", "Go", "Rust", "TypeScript", "React", "Django", "FastAPI", "Kubernetes",
+    "Docker", "Terraform", "AWS", "GCP", "Azure", "PostgreSQL", "MongoDB", "Redis", "Kafka",
+    "Spark", "Airflow", "PyTorch", "TensorFlow", "LangChain", "LangGraph", "CI/CD", "GraphQL",
+]
+
+
+def make_batch(n_resumes: int, seed: int):
+    """Generate one job description and n synthetic resumes"""
+    rng = random.Random(seed)
+    job_description = "Senior Platform Engineer\n\nRequirements:\n" + "\n".join(
+        f"- {rng.randint(2, 8)}+ years with {skill}" for skill in rng.sample(SKILLS, 10)
+    )
+    resumes = []
+    for i in range(n_resumes):
+        lines = [
+            f"Built and operated {skill} systems at Company{rng.randint(1, 500)} for {rng.randint(1, 9)} years."
+            for skill in rng.sample(SKILLS, 8)
+        ]
+        resumes.append(f"Candidate {i}\n\nEXPERIENCE\n" + "\n".join(lines))
+    return job_description, resumes
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=[RECORD, REPLAY], default=REPLAY)
+    parser.add_argument("--resumes", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="Replay sleep as a multiple of the recorded latency")
+    parser.add_argument("--cassette-dir", default=LLM_CASSETTE_DIR)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    llm_cassette.configure(args.mode, args.cassette_dir, args.latency_scale)
+    job_description, resumes = make_batch(args.resumes, args.seed)
+
+    def analyze(resume_text: str):
+        start = time.perf_counter()
+        result = resume_analysis_service.analyze_resume(resume_text, job_description)
+        return time.perf_counter() - start, result
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        outcomes = list(pool.map(analyze, resumes))
+    wall = time.perf_counter() - start
+
+    latencies = [latency for latency, _ in outcomes]
+    failed = sum(1 for _, result in outcomes if result.get("errors"))
+    stats = llm_cassette.stats()
+    print(f"{args.mode}: {len(resumes)} resumes, concurrency {args.concurrency}, latency scale {args.latency_scale:g}")
+    print(f"  wall {wall:.2f}s, {len(resumes) / wall:.1f} resumes/s")
+    print(
+        f"  per resume: p50 {statistics.median(latencies) * 1e3:.1f} ms, "
+        f"p95 {percentile(latencies, 0.95) * 1e3:.1f} ms"
+    )
+    print(f"  results with errors: {failed}")
+    print(f"  cassettes: {stats['recorded']} recorded, {stats['replayed']} replayed, {stats['misses']} missing")
+
+
+if __name__ == "__main__":
+    main()
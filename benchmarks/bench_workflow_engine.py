@@ -0,0 +1,114 @@
+"""
+Benchmark: per-invocation overhead of the LangGraph workflow vs. the native executor
+
+Both engines run the same four node functions with every LLM call replaced by
+a canned response, so the timings are the engines' own overhead plus the
+nodes' local work (prompt building, parsing, scoring). Results of the two
+engines are also compared for equality. Choose an engine with WORKFLOW_ENGINE.
+
+Usage:
+    python -m benchmarks.bench_workflow_engine --invocations 2000
+"""
+import argparse
+import statistics
+import time
+from unittest import mock
+
+from agents import analysis_scoring_agent, extraction_agent, resume_analyzer_agent
+from graphs.workflow import build_native_workflow, build_resume_analyzer_graph
+
+RESUME = (
+    "Senior backend engineer with seven years building Python and Go services on AWS. "
+    "Designed Kubernetes deployments with Terraform, ran PostgreSQL and Redis in production, "
+    "and led a team of four engineers through a migration to event-driven microservices. "
+) * 3
+JOB_DESCRIPTION = "Backend engineer: Python, Kubernetes, AWS, PostgreSQL, Kafka, Terraform."
+
+CANNED = {
+    "validate_input": {"is_valid": True, "issues": [], "input_type": "job_description", "extraction_plan": "Extract skills"},
+    "extract_keywords": {
+        "resume_keywords": ["Python", "Go", "AWS", "Kubernetes", "Terraform", "PostgreSQL", "Redis"],
+        "target_keywords": ["Python", "Kubernetes", "AWS", "PostgreSQL", "Kafka", "Terraform"],
+        "extraction_notes": "Stubbed"
+    },
+    "analyze_and_score": {
+        "matched_keywords": ["Python", "Kubernetes", "AWS", "PostgreSQL", "Terraform"],
+        "missing_keywords": ["Kafka"],
+        "match_score": 0.83,
+        "confidence_notes": "Stubbed",
+        "recommendations": ["Mention Kafka experience"]
+    },
+}
+
+
+def stub_llm():
+    """Patch every node's LLM calls with instant canned responses"""
+    def structured(node):
+        return lambda system_prompt, user_input, **kwargs: dict(CANNED[node])
+
+    return [
+        mock.patch.object(resume_analyzer_agent, "call_llm_with_structured_output", structured("validate_input")),
+        mock.patch.object(resume_analyzer_agent, "call_llm_with_text_output", lambda *args, **kwargs: "Stubbed summary"),
+        mock.patch.object(extraction_agent, "call_llm_with_structured_output", structured("extract_keywords")),
+        mock.patch.object(analysis_scoring_agent, "call_llm_with_structured_output", structured("analyze_and_score")),
+    ]
+
+
+def initial_state():
+    return {
+        "resume_text": RESUME,
+        "job_description": JOB_DESCRIPTION,
+        "run_id": "bench",
+        "deadline": None,
+        "skipped_stages": [],
+        "degraded": False,
+        "errors": []
+    }
+
+
+def time_engine(engine, invocations: int):
+    """Per-invocation wall times in microseconds"""
+    timings = []
+    for _ in range(invocations):
+        start = time.perf_counter()
+        engine.invoke(initial_state())
+        timings.append((time.perf_counter() - start) * 1e6)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--invocations", type=int, default=2000)
+    parser.add_argument("--warmup", type=int, default=50)
+    args = parser.parse_args()
+
+    patches = stub_llm()
+    for patch in patches:
+        patch.start()
+    try:
+        engines = {
+            "langgraph": build_resume_analyzer_graph(checkpointer=None),
+            "native": build_native_workflow(),
+        }
+        results = {name: engine.invoke(initial_state()) for name, engine in engines.items()}
+        for engine in engines.values():
+            time_engine(engine, args.warmup)
+        timings = {name: time_engine(engine, args.invocations) for name, engine in engines.items()}
+    finally:
+        for patch in patches:
+            patch.stop()
+
+    print(f"invocations={args.invocations} (LLM stubbed)")
+    for name, values in timings.items():
+        print(
+            f"{name:>10}: mean {statistics.fmean(values):8.1f} us, "
+            f"p50 {statistics.median(values):8.1f} us, "
+            f"p95 {sorted(values)[int(0.95 * len(values))]:8.1f} us"
+        )
+    saved = statistics.fmean(timings["langgraph"]) - statistics.fmean(timings["native"])
+    print(f"native saves {saved:.1f} us per invocation ({statistics.fmean(timings['langgraph']) / statistics.fmean(timings['native']):.1f}x)")
+    print(f"identical results: {results['langgraph'] == results['native']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,31 @@
 """
 Simple CLI tool for Resume Analyzer API
+
+Usage:
+    python cli.py                 # start/reuse the API server and analyze data/payload.json
+    python cli.py run --input DIR_OR_JSONL [--job-description FILE] [--output results.jsonl]
+                                  # analyze many resumes in-process, without HTTP
+    python cli.py export --input results.jsonl --output results.parquet
+                                  # convert JSONL results to Parquet, streaming
 """
+import argparse
 import asyncio
 import json
 import subprocess
 import time
 import sys
+from pathlib import Path
 
 import httpx
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, MofNCompleteColumn, Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Server-side time budget for one analysis; the HTTP timeout adds headroom on top
+DEFAULT_DEADLINE_SECONDS = 120.0
+HTTP_TIMEOUT_MARGIN_SECONDS = 15.0
+
 
 def start_server():
     """Start the FastAPI server in the background"""
@@ -23,10 +36,6 @@ def start_server():
         [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", "8000"],
     )
     
-    # Wait for server to start
-    console.print("[yellow]Waiting for server to be ready...[/yellow]")
-    time.sleep(3)  # Give it a few seconds to start
-    
     return process
 
 
@@ -40,7 +49,35 @@ async def check_server_health():
         return False
 
 
-async def analyze_resume():
+async def check_server_ready():
+    """Check if server has finished warming up and can take traffic"""
+    try:
+        async with httpx.AsyncClient(timeout=5.0) as client:
+            response = await client.get("http://localhost:8000/ready")
+            return response.status_code == 200
+    except:
+        return False
+
+
+async def wait_until_ready(server_process=None, timeout=60.0):
+    """Poll /ready with short, growing intervals until the server is warm"""
+    console.print("[yellow]Waiting for server to be ready...[/yellow]")
+    start = time.monotonic()
+    delay = 0.05
+    
+    while time.monotonic() - start < timeout:
+        if server_process and server_process.poll() is not None:
+            return False
+        if await check_server_ready():
+            console.print(f"[green]✓ Server is ready! ({time.monotonic() - start:.2f}s)[/green]")
+            return True
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    
+    return False
+
+
+async def analyze_resume(deadline: float = DEFAULT_DEADLINE_SECONDS):
     """Send analysis request to the API"""
     # Load payload from payload.json
     console.print("\n[cyan]Loading payload from payload.json...[/cyan]")
@@ -50,7 +87,7 @@ async def analyze_resume():
     # Send request
     console.print("[yellow]Sending request to API...[/yellow]\n")
     
-    async with httpx.AsyncClient(timeout=300.0) as client:
+    async with httpx.AsyncClient(timeout=deadline + HTTP_TIMEOUT_MARGIN_SECONDS) as client:
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
@@ -61,6 +98,7 @@ async def analyze_resume():
             response = await client.post(
                 "http://localhost:8000/api/v1/resume-analyzer/analyze",
                 json=payload,
+                headers={"X-Deadline-Seconds": str(deadline)},
             )
             response.raise_for_status()
             result = response.json()
@@ -77,7 +115,7 @@ async def analyze_resume():
     console.print("\n[green]Results saved to results.json[/green]")
 
 
-async def main():
+async def main(deadline: float = DEFAULT_DEADLINE_SECONDS):
     """Main function"""
     server_process = None
     
@@ -88,24 +126,16 @@ async def main():
         if not is_running:
             # Start the server
             server_process = start_server()
-            
-            # Wait and verify server is ready
-            max_retries = 10
-            for i in range(max_retries):
-                if await check_server_health():
-                    console.print("[green]✓ Server is ready![/green]")
-                    break
-                if i < max_retries - 1:
-                    console.print(f"[yellow]Waiting for server... ({i+1}/{max_retries})[/yellow]")
-                    time.sleep(2)
-            else:
-                console.print("[red]Error: Server failed to start[/red]")
-                return
         else:
             console.print("[green]✓ Server is already running![/green]\n")
         
+        # Route the request as soon as the server reports warm state
+        if not await wait_until_ready(server_process):
+            console.print("[red]Error: Server failed to start[/red]")
+            return
+        
         # Run the analysis
-        await analyze_resume()
+        await analyze_resume(deadline)
         
     except FileNotFoundError:
         console.print("[red]Error: payload.json not found![/red]")
@@ -120,5 +150,186 @@ async def main():
             console.print("[green]✓ Server stopped[/green]")
 
 
+def load_checkpoint(checkpoint_path: Path) -> set:
+    """Load ids of items already written by a previous run"""
+    if not checkpoint_path.exists():
+        return set()
+    with open(checkpoint_path, 'r', encoding='utf-8') as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def iter_batch_items(input_path: Path, job_description: str):
+    """
+    Lazily yield {"id", "resume_text" | "path", "job_description"} work items
+    
+    A directory yields every supported resume file (id = relative path); a JSONL
+    file yields one item per line (id = "id" field or line number). A line that
+    isn't a JSON object yields {"id", "error"} so the rest of the batch still runs.
+    """
+    if input_path.is_dir():
+        from utils.file_parser import supported_extensions
+        extensions = supported_extensions()
+        for path in sorted(input_path.rglob("*")):
+            if path.is_file() and path.suffix.lower() in extensions:
+                yield {
+                    "id": str(path.relative_to(input_path)),
+                    "path": str(path),
+                    "job_description": job_description,
+                }
+        return
+    
+    with open(input_path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:
+                yield {"id": str(line_number), "error": f"Invalid JSONL record on line {line_number}: {e}"}
+                continue
+            yield {
+                "id": str(record.get("id", line_number)),
+                "resume_text": record.get("resume_text", ""),
+                "job_description": record.get("job_description", job_description),
+            }
+
+
+async def run_batch(args):
+    """Analyze a directory or JSONL file of resumes in-process, writing JSONL incrementally"""
+    # Imported here so the default HTTP mode stays light
+    from services.resume_service import resume_analysis_service
+    from utils.concurrency import iterate_in_thread, run_bounded
+    from utils.file_parser import parse_text_file
+    
+    input_path = Path(args.input)
+    output_path = Path(args.output)
+    checkpoint_path = Path(args.checkpoint or f"{args.output}.checkpoint")
+    errors_path = Path(args.errors or f"{args.output}.errors.jsonl")
+    
+    job_description = ""
+    if args.job_description:
+        jd_path = Path(args.job_description)
+        job_description = jd_path.read_text(encoding='utf-8') if jd_path.is_file() else args.job_description
+    
+    done = load_checkpoint(checkpoint_path)
+    if done:
+        console.print(f"[cyan]Resuming: {len(done)} items already completed[/cyan]")
+    
+    parquet_sink = None
+    if args.parquet:
+        from utils.columnar_sink import ParquetResultSink
+        parquet_sink = ParquetResultSink(args.parquet)
+        if done:
+            console.print(f"[yellow]{args.parquet} will hold only this run's results; use 'cli.py export' for all of {output_path}[/yellow]")
+    
+    pending_items = (item for item in iter_batch_items(input_path, job_description) if item["id"] not in done)
+    
+    async def analyze_item(item):
+        if "error" in item:
+            return {"id": item["id"], "success": False, "error": item["error"]}
+        try:
+            resume_text = item.get("resume_text")
+            if resume_text is None:
+                resume_text = await asyncio.to_thread(parse_text_file, item["path"])
+            result = await resume_analysis_service.analyze_resume_async(
+                resume_text, item["job_description"], deadline_seconds=args.deadline, lane=args.lane
+            )
+            return {"id": item["id"], **resume_analysis_service.format_result(result)}
+        except Exception as e:
+            return {"id": item["id"], "success": False, "error": str(e)}
+    
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    succeeded = failed = 0
+    start = time.monotonic()
+    
+    try:
+        # Failures are rewritten each run: they are retried, so older ones are stale
+        with open(output_path, 'a', encoding='utf-8') as output, \
+                open(checkpoint_path, 'a', encoding='utf-8') as checkpoint, \
+                open(errors_path, 'w', encoding='utf-8') as errors, \
+                Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    MofNCompleteColumn(),
+                    console=console,
+                ) as progress:
+            task = progress.add_task("Analyzing resumes...", total=None)
+            
+            async for record in run_bounded(iterate_in_thread(pending_items), analyze_item, args.concurrency):
+                # Items that raised go to the errors file and are not checkpointed, so
+                # they are retried on resume without duplicating ids in the output
+                if "error" in record:
+                    errors.write(json.dumps(record) + "\n")
+                    errors.flush()
+                    failed += 1
+                else:
+                    output.write(json.dumps(record) + "\n")
+                    output.flush()
+                    if parquet_sink:
+                        parquet_sink.write(record)
+                    checkpoint.write(record["id"] + "\n")
+                    checkpoint.flush()
+                    succeeded += 1
+                progress.advance(task)
+    finally:
+        if parquet_sink:
+            parquet_sink.close()
+    
+    elapsed = time.monotonic() - start
+    console.print(f"\n[green]✓ Batch complete: {succeeded} completed, {failed} failed in {elapsed:.1f}s[/green]")
+    console.print(f"[green]Results appended to {output_path}[/green]")
+    if failed:
+        console.print(f"[yellow]Failures written to {errors_path}; re-run to retry them[/yellow]")
+    if parquet_sink:
+        console.print(f"[green]Parquet results written to {args.parquet} ({parquet_sink.row_groups} row groups)[/green]")
+
+
+def export_batch(args):
+    """Convert a JSONL results file to Parquet without loading it into memory"""
+    from utils.columnar_sink import export_results, iter_jsonl_records
+    
+    start = time.monotonic()
+    count = export_results(iter_jsonl_records(args.input), args.output, args.row_group_size)
+    console.print(f"[green]✓ Exported {count} results to {args.output} in {time.monotonic() - start:.1f}s[/green]")
+
+
+def parse_args(argv=None):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Resume Analyzer CLI")
+    parser.add_argument(
+        "--deadline", type=float, default=None,
+        help=f"Time budget in seconds (default: {DEFAULT_DEADLINE_SECONDS:g} for the API request, none per resume for 'run')"
+    )
+    subparsers = parser.add_subparsers(dest="command")
+    
+    run_parser = subparsers.add_parser("run", help="Analyze many resumes in-process, without the HTTP server")
+    run_parser.add_argument("--input", required=True, help="Directory of resume files or JSONL of {id, resume_text, job_description}")
+    run_parser.add_argument("--job-description", help="Job description text or path to a file (default for all items)")
+    run_parser.add_argument("--output", default="data/results.jsonl", help="JSONL file results are appended to")
+    run_parser.add_argument("--checkpoint", help="Checkpoint file of completed ids (default: <output>.checkpoint)")
+    run_parser.add_argument("--errors", help="JSONL file of this run's failed items (default: <output>.errors.jsonl)")
+    run_parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent analyses")
+    # SUPPRESS keeps a --deadline given before the subcommand from being reset
+    run_parser.add_argument("--deadline", type=float, default=argparse.SUPPRESS, help="Optional time budget in seconds per resume")
+    run_parser.add_argument("--lane", choices=["interactive", "bulk"], default="bulk", help="Priority lane for the analyses")
+    run_parser.add_argument("--parquet", help="Also write this run's results to a Parquet file, in row groups as they finish")
+    
+    export_parser = subparsers.add_parser("export", help="Convert JSONL results to Parquet, streaming")
+    export_parser.add_argument("--input", default="data/results.jsonl", help="JSONL results file (from 'run')")
+    export_parser.add_argument("--output", default="data/results.parquet", help="Parquet file to write")
+    export_parser.add_argument("--row-group-size", type=int, default=None, help="Results per row group (default PARQUET_ROW_GROUP_SIZE)")
+    
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    cli_args = parse_args()
+    if cli_args.command == "run":
+        asyncio.run(run_batch(cli_args))
+    elif cli_args.command == "export":
+        export_batch(cli_args)
+    else:
+        asyncio.run(main(cli_args.deadline if cli_args.deadline is not None else DEFAULT_DEADLINE_SECONDS))
\ No newline at end of file
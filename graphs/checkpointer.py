@@ -0,0 +1,172 @@
+"""
+Persistent workflow checkpoints so failed runs resume from the last good node
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_ENABLED = os.getenv("CHECKPOINT_ENABLED", "true").lower() in ("1", "true", "yes")
+CHECKPOINT_DB_PATH = os.getenv("CHECKPOINT_DB_PATH", "data/checkpoints.sqlite")
+# Runs not checkpointed for this long are deleted (0 keeps them forever)
+CHECKPOINT_TTL_SECONDS = float(os.getenv("CHECKPOINT_TTL_SECONDS", "86400"))
+CHECKPOINT_PRUNE_INTERVAL_SECONDS = 300.0
+
+
+def create_checkpointer(db_path: str = CHECKPOINT_DB_PATH):
+    """
+    Open the SQLite checkpointer used to compile the workflow graph
+
+    Args:
+        db_path: SQLite database file
+
+    Returns:
+        SqliteSaver, or None if checkpointing is disabled or unavailable
+    """
+    if not CHECKPOINT_ENABLED:
+        return None
+
+    try:
+        from langgraph.checkpoint.sqlite import SqliteSaver
+    except ImportError:
+        logger.warning("langgraph-checkpoint-sqlite is not installed - workflow checkpointing disabled")
+        return None
+
+    Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+    # Nodes run in worker threads; SqliteSaver serializes access with its own lock
+    conn = sqlite3.connect(db_path, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    checkpointer = SqliteSaver(conn)
+    checkpointer.setup()
+    logger.info("Workflow checkpoints stored in %s", db_path)
+    return checkpointer
+
+
+def run_config(run_id: str) -> Dict[str, Any]:
+    """LangGraph config addressing one run's checkpoint thread"""
+    return {"configurable": {"thread_id": run_id}}
+
+
+class CheckpointRetention:
+    """
+    Delete checkpoint threads of runs idle for longer than a TTL
+
+    LangGraph's SQLite tables carry no timestamps, so the last time each run
+    was checkpointed is kept in a `run_activity` table in the same database.
+    Expired runs are pruned at most once per prune interval, from the thread
+    that records run activity.
+    """
+
+    def __init__(
+        self,
+        checkpointer,
+        ttl_seconds: float = CHECKPOINT_TTL_SECONDS,
+        prune_interval: float = CHECKPOINT_PRUNE_INTERVAL_SECONDS
+    ):
+        self.checkpointer = checkpointer
+        self.ttl_seconds = ttl_seconds
+        self.prune_interval = prune_interval
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self.pruned = 0
+        with checkpointer.cursor() as cur:
+            cur.execute("CREATE TABLE IF NOT EXISTS run_activity (thread_id TEXT PRIMARY KEY, updated_at REAL NOT NULL)")
+            # Runs stored before activity was tracked expire one TTL from now
+            cur.execute(
+                "INSERT OR IGNORE INTO run_activity SELECT DISTINCT thread_id, ? FROM checkpoints",
+                (time.time(),)
+            )
+
+    def touch(self, run_id: str):
+        """Record that a run is being checkpointed, pruning expired runs when due"""
+        now = time.time()
+        with self.checkpointer.cursor() as cur:
+            cur.execute(
+                "INSERT INTO run_activity VALUES (?, ?) "
+                "ON CONFLICT(thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+                (run_id, now)
+            )
+        with self._lock:
+            due = now - self._last_prune >= self.prune_interval
+            if due:
+                self._last_prune = now
+        if due:
+            self.prune(now)
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Delete every run last checkpointed more than ttl_seconds ago
+
+        Returns:
+            int: Number of runs deleted
+        """
+        if self.ttl_seconds <= 0:
+            return 0
+        cutoff = (now or time.time()) - self.ttl_seconds
+        with self.checkpointer.cursor() as cur:
+            expired = [(row[0],) for row in cur.execute("SELECT thread_id FROM run_activity WHERE updated_at < ?", (cutoff,))]
+            for table in ("writes", "checkpoints", "run_activity"):
+                cur.executemany(f"DELETE FROM {table} WHERE thread_id = ?", expired)
+        if expired:
+            logger.info("Pruned checkpoints of %d runs older than %.0fs", len(expired), self.ttl_seconds)
+        with self._lock:
+            self.pruned += len(expired)
+        return len(expired)
+
+
+def checkpoint_writer(snapshot) -> Optional[str]:
+    """Workflow node that produced a checkpoint, or None for input/start checkpoints"""
+    writes = (snapshot.metadata or {}).get("writes") or {}
+    writer = next(iter(writes), None)
+    return None if writer is None or writer.startswith("__") else writer
+
+
+def find_resume_point(graph, run_id: str) -> Optional[Tuple[Any, str]]:
+    """
+    Locate where a checkpointed run should pick up again
+
+    Walks the run's checkpoint chain from its latest input. Nodes record
+    failures (and deadline skips) in `errors` / `skipped_stages` rather than
+    raising, so the first node whose write grew either list is the one to
+    re-run, starting from the checkpoint before it. A run that stopped
+    mid-graph (exception or crash) continues from its last checkpoint.
+
+    Args:
+        graph: Compiled workflow graph with a checkpointer
+        run_id: Run identifier (checkpoint thread id)
+
+    Returns:
+        tuple: (StateSnapshot to resume from, node to re-run),
+               or None if the run completed without errors or skips
+    """
+    latest = graph.get_state(run_config(run_id))
+    if latest.next:
+        return latest, latest.next[0]
+
+    # Follow parent links from the latest checkpoint; earlier resumes leave forks in the history
+    by_id = {
+        snapshot.config["configurable"]["checkpoint_id"]: snapshot
+        for snapshot in graph.get_state_history(run_config(run_id))
+    }
+    chain = []
+    snapshot = latest
+    while snapshot is not None:
+        chain.append(snapshot)
+        if (snapshot.metadata or {}).get("source") == "input":
+            break
+        parent = snapshot.parent_config
+        snapshot = by_id.get(parent["configurable"]["checkpoint_id"]) if parent else None
+    chain.reverse()
+
+    def problems(values: Dict[str, Any]) -> int:
+        return len(values.get("errors", [])) + len(values.get("skipped_stages", []))
+
+    for previous, current in zip(chain, chain[1:]):
+        if problems(current.values) > problems(previous.values) and previous.next:
+            return previous, previous.next[0]
+    return None
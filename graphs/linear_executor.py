@@ -0,0 +1,58 @@
+"""
+Minimal in-process executor for the linear workflow (alternative to LangGraph)
+"""
+import logging
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from graphs.state import ResumeAnalyzerState
+
+logger = logging.getLogger(__name__)
+
+END = "__end__"
+STATE_KEYS = frozenset(ResumeAnalyzerState.__annotations__)
+
+Node = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class LinearWorkflow:
+    """
+    Run nodes in order in the calling thread, with optional exits after a node
+
+    Mirrors what the compiled LangGraph returns for this workflow: the result
+    holds the input state plus every node's writes, limited to the keys of
+    ResumeAnalyzerState. A router registered for a node picks what runs next;
+    anything other than the following node's name (e.g. END) stops the run.
+    One state dict is threaded through the nodes instead of being rebuilt
+    from channels at each step. There is no checkpointer, so runs can't be
+    resumed.
+    """
+
+    checkpointer = None
+
+    def __init__(self, nodes: List[Tuple[str, Node]], routers: Optional[Dict[str, Callable[[Dict[str, Any]], str]]] = None):
+        self.nodes = nodes
+        self.routers = routers or {}
+
+    def invoke(self, state: Dict[str, Any], config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Run the workflow on a copy of the input state
+
+        Args:
+            state: Initial workflow state
+            config: Accepted for call compatibility with the compiled graph; ignored
+
+        Returns:
+            Dict: Final state
+        """
+        state = dict(state)
+        for position, (name, node) in enumerate(self.nodes):
+            update = node(state)
+            if update is not state and update:
+                state.update(update)
+
+            router = self.routers.get(name)
+            if router is not None:
+                following = self.nodes[position + 1][0] if position + 1 < len(self.nodes) else END
+                if router(state) != following:
+                    break
+        return {key: value for key, value in state.items() if key in STATE_KEYS}
@@ -23,6 +23,7 @@ class ResumeAnalyzerState(TypedDict, total=False):
     resume_keywords: List[str]
     target_keywords: List[str]
     extraction_notes: str
+    extraction_failed: bool  # True if no keywords were extracted (LLM error or deadline reached)
     
     # Analysis (Analysis & Scoring Agent)
     matched_keywords: List[str]
@@ -36,5 +37,23 @@ class ResumeAnalyzerState(TypedDict, total=False):
     json_output: Dict[str, Any]
     
     # Control
+    run_id: str  # checkpoint thread id, used to resume a failed run
+    deadline: Optional[float]  # absolute epoch seconds; None means no time budget
+    skipped_stages: List[str]  # stages skipped or run locally (deadline reached or LLM circuit open)
+    degraded: bool  # True if any stage ran on the local fallback because the LLM circuit was open
     current_step: str
     errors: List[str]
+    node_models: Dict[str, str]  # node -> model (and endpoint) that served it
+    llm_usage: Dict[str, Dict[str, int]]  # node -> prompt/cached/completion token counts
+
+
+def keywords_reusable(state: Dict[str, Any]) -> bool:
+    """
+    Whether a finished run's keywords were extracted by the LLM and can be
+    reused without extracting again (not failed, skipped or lexicon fallback)
+    """
+    return (
+        state.get("is_valid", False)
+        and not state.get("extraction_failed", False)
+        and "extract_keywords" not in state.get("skipped_stages", [])
+    )
@@ -2,16 +2,24 @@
 LangGraph Workflow Definition for Resume Analyzer
 """
 import logging
-
-from langgraph.graph import StateGraph, END
+import os
+import threading
+import time
 
 from graphs.state import ResumeAnalyzerState
-from agents.resume_analyzer_agent import validate_input, format_output
-from agents.extraction_agent import extract_keywords
-from agents.analysis_scoring_agent import analyze_and_score
 
 logger = logging.getLogger(__name__)
 
+# Same value as langgraph.graph.END; defined here so importing this module does
+# not pull in langgraph, the agents and the OpenAI SDK before the graph is needed
+END = "__end__"
+
+# "langgraph" (default; supports checkpointing) or "native" (graphs/linear_executor.py)
+WORKFLOW_ENGINE = os.getenv("WORKFLOW_ENGINE", "langgraph").lower()
+
+_graph = None
+_graph_lock = threading.Lock()
+
 
 def should_continue(state: ResumeAnalyzerState) -> str:
     """
@@ -26,22 +34,52 @@ def should_continue(state: ResumeAnalyzerState) -> str:
     is_valid = state.get("is_valid", False)
     next_node = "extract_keywords" if is_valid else END
     
-    logger.info(f"Validation result: is_valid={is_valid}, next_node={next_node}")
+    logger.debug("Validation result: is_valid=%s, next_node=%s", is_valid, next_node)
     
     if not is_valid:
-        logger.warning(f"Workflow stopped due to validation failure: {state.get('validation_issues', [])}")
+        logger.warning("Workflow stopped due to validation failure: %s", state.get("validation_issues", []))
         return END
     
     return "extract_keywords"
 
 
-def build_resume_analyzer_graph() -> StateGraph:
+def workflow_nodes():
+    """
+    The workflow's node functions in execution order
+    
+    Nodes are wrapped so profiled requests get per-node timings (a no-op otherwise).
+    
+    Returns:
+        list: (node name, node function) pairs
+    """
+    from agents.resume_analyzer_agent import validate_input, format_output
+    from agents.extraction_agent import extract_keywords
+    from agents.analysis_scoring_agent import analyze_and_score
+    from utils.profiling import profiled_node
+    
+    return [
+        (name, profiled_node(name, node))
+        for name, node in (
+            ("validate_input", validate_input),
+            ("extract_keywords", extract_keywords),
+            ("analyze_and_score", analyze_and_score),
+            ("format_output", format_output),
+        )
+    ]
+
+
+def build_resume_analyzer_graph(checkpointer=None):
     """
     Build the Resume Analyzer LangGraph workflow
     
+    Args:
+        checkpointer: Optional LangGraph checkpointer; runs are then keyed by thread_id
+    
     Returns:
-        StateGraph: Compiled workflow graph
+        CompiledStateGraph: Compiled workflow graph
     """
+    from langgraph.graph import StateGraph
+    
     logger.info("Building Resume Analyzer workflow graph")
     
     # Create the graph
@@ -49,10 +87,8 @@ def build_resume_analyzer_graph() -> StateGraph:
     
     # Add nodes
     logger.debug("Adding nodes: validate_input, extract_keywords, analyze_and_score, format_output")
-    workflow.add_node("validate_input", validate_input)
-    workflow.add_node("extract_keywords", extract_keywords)
-    workflow.add_node("analyze_and_score", analyze_and_score)
-    workflow.add_node("format_output", format_output)
+    for name, node in workflow_nodes():
+        workflow.add_node(name, node)
     
     # Add edges
     logger.debug("Setting entry point: validate_input")
@@ -77,11 +113,62 @@ def build_resume_analyzer_graph() -> StateGraph:
     
     # Compile the graph
     logger.info("Compiling workflow graph")
-    compiled_graph = workflow.compile()
+    compiled_graph = workflow.compile(checkpointer=checkpointer)
     logger.info("Workflow graph compiled successfully")
     
     return compiled_graph
 
 
-# Create the compiled graph instance
-resume_analyzer_graph = build_resume_analyzer_graph()
+def build_native_workflow():
+    """
+    Build the same workflow on the minimal linear executor
+    
+    Runs the same node functions with the same should_continue exit and
+    returns the same result shape, without LangGraph's per-step channel
+    bookkeeping. Checkpointing (and so resuming runs) is not supported.
+    
+    Returns:
+        LinearWorkflow: Workflow exposing invoke() like the compiled graph
+    """
+    from graphs.linear_executor import LinearWorkflow
+    
+    logger.info("Building Resume Analyzer workflow on the native executor")
+    return LinearWorkflow(workflow_nodes(), routers={"validate_input": should_continue})
+
+
+def get_resume_analyzer_graph():
+    """
+    Return the workflow for the configured engine, building it on first use
+    
+    Returns:
+        CompiledStateGraph or LinearWorkflow: Shared workflow (see WORKFLOW_ENGINE)
+    """
+    global _graph
+    if _graph is None:
+        with _graph_lock:
+            if _graph is None:
+                start_time = time.perf_counter()
+                if WORKFLOW_ENGINE == "native":
+                    from graphs.checkpointer import CHECKPOINT_ENABLED
+                    if CHECKPOINT_ENABLED:
+                        logger.warning("WORKFLOW_ENGINE=native does not checkpoint runs; failed runs can't be resumed")
+                    _graph = build_native_workflow()
+                else:
+                    if WORKFLOW_ENGINE != "langgraph":
+                        logger.warning("Unknown WORKFLOW_ENGINE '%s'; using langgraph", WORKFLOW_ENGINE)
+                    from graphs.checkpointer import create_checkpointer
+                    _graph = build_resume_analyzer_graph(checkpointer=create_checkpointer())
+                logger.info("Workflow graph ready in %.3fs (imports + compile)", time.perf_counter() - start_time)
+    return _graph
+
+
+def is_graph_compiled() -> bool:
+    """Check whether the workflow graph has been built"""
+    return _graph is not None
+
+
+def __getattr__(name: str):
+    # Backwards compatible lazy access to the module-level graph instance
+    if name == "resume_analyzer_graph":
+        return get_resume_analyzer_graph()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
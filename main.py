@@ -1,20 +1,29 @@
 """
 FastAPI Main Application Entry Point
 """
+import time
+
+_import_start = time.perf_counter()
+
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
 from routers.resume_analyzer import router
+from services.document_service import document_parsing_service
+from services.resume_service import resume_analysis_service
+from utils.logging_config import configure_logging, stop_logging
+from utils.profiling import ProfilingMiddleware, profiling_enabled
+from utils.readiness import readiness
 
-# Set up logging for uvicorn
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    datefmt='%Y-%m-%d %H:%M:%S'
-)
+_import_seconds = time.perf_counter() - _import_start
+
+# Route logging through a background writer thread (see utils/logging_config.py)
+configure_logging()
 
 logger = logging.getLogger(__name__)
 
@@ -23,18 +32,20 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events"""
     # Startup
-    logger.info("=" * 100)
-    logger.info("Starting Resume Analyzer API")
-    logger.info("Application startup complete")
-    logger.info("API Documentation available at: /docs")
-    logger.info("=" * 100)
+    logger.info("Starting Resume Analyzer API - imports took %.3fs, docs at /docs", _import_seconds)
+    
+    # Warm heavy components in the background; /ready reports when they are done
+    warm_up_task = asyncio.create_task(asyncio.to_thread(resume_analysis_service.warm_up))
     
     yield
     
+    if not warm_up_task.done():
+        await asyncio.wait([warm_up_task])
+    
     # Shutdown
-    logger.info("=" * 100)
     logger.info("Shutting down Resume Analyzer API")
-    logger.info("=" * 100)
+    document_parsing_service.shutdown()
+    stop_logging()
 
 
 # Create FastAPI app
@@ -54,6 +65,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request profiling is only wired in when it can trigger (see utils/profiling.py)
+if profiling_enabled():
+    app.add_middleware(ProfilingMiddleware)
+
 # Include routers
 app.include_router(router)
 
@@ -73,4 +88,12 @@ async def root():
 async def health():
     """Health check endpoint"""
     logger.debug("GET /health - Health check")
-    return {"status": "healthy"}
\ No newline at end of file
+    return {"status": "healthy"}
+
+
+@app.get("/ready")
+async def ready():
+    """Readiness probe: 200 once the graph, LLM client and caches are warm, 503 before"""
+    logger.debug("GET /ready - Readiness check")
+    report = readiness.report()
+    return JSONResponse(status_code=200 if report["ready"] else 503, content=report)
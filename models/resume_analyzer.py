@@ -1,10 +1,15 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
+Lane = Literal["interactive", "bulk"]
+
 class ResumeAnalysisRequest(BaseModel):
     """Request model for resume analysis"""
     resume_text: str = Field(..., description="Resume text content")
     job_description: str = Field(default="", description="Job description or requirements")
+    run_id: Optional[str] = Field(default=None, description="Run identifier; retrying with the same id resumes the run")
+    deadline_seconds: Optional[float] = Field(default=None, gt=0, description="Time budget; stages that can't finish in time are skipped or scored locally")
+    lane: Lane = Field(default="interactive", description="Priority lane: interactive requests run ahead of queued bulk work")
 
 
 class ResumeAnalysisResponse(BaseModel):
@@ -19,4 +24,169 @@ class ResumeAnalysisResponse(BaseModel):
     confidence_notes: str
     final_summary: str
     validation_issues: Optional[list[str]] = None
-    errors: Optional[list[str]] = None
\ No newline at end of file
+    errors: Optional[list[str]] = None
+    node_models: Optional[dict[str, str]] = None
+    llm_usage: Optional[dict[str, dict[str, int]]] = None
+    run_id: Optional[str] = None
+    skipped_stages: Optional[list[str]] = None
+    degraded: Optional[bool] = None
+
+
+class ProjectedAnalysisResponse(BaseModel):
+    """Analysis response trimmed with ?fields= or compact; only the requested fields are present"""
+    success: Optional[bool] = None
+    match_score: Optional[float] = None
+    matched_count: Optional[int] = None
+    missing_count: Optional[int] = None
+    matched_keywords: Optional[list[str]] = None
+    missing_keywords: Optional[list[str]] = None
+    resume_keywords: Optional[list[str]] = None
+    target_keywords: Optional[list[str]] = None
+    recommendations: Optional[list[str]] = None
+    confidence_notes: Optional[str] = None
+    final_summary: Optional[str] = None
+    validation_issues: Optional[list[str]] = None
+    errors: Optional[list[str]] = None
+    node_models: Optional[dict[str, str]] = None
+    llm_usage: Optional[dict[str, dict[str, int]]] = None
+    run_id: Optional[str] = None
+    skipped_stages: Optional[list[str]] = None
+    degraded: Optional[bool] = None
+
+
+class ReanalysisRequest(BaseModel):
+    """Request model for incremental re-analysis of an edited resume"""
+    document_id: str = Field(..., min_length=1, description="Stable candidate or document id; results of unchanged sections are reused")
+    resume_text: str = Field(..., description="Current resume text")
+    job_description: str = Field(default="", description="Job description or requirements; a new one triggers a full analysis")
+    deadline_seconds: Optional[float] = Field(default=None, gt=0, description="Time budget; stages that can't finish in time are skipped or scored locally")
+    lane: Lane = Field(default="interactive", description="Priority lane: interactive requests run ahead of queued bulk work")
+
+
+class ReanalysisResponse(ResumeAnalysisResponse):
+    """Response model for incremental re-analysis"""
+    document_id: str
+    mode: Literal["full", "incremental"]
+    sections_total: int
+    sections_reextracted: int
+
+
+class StreamRecord(BaseModel):
+    """One line of an NDJSON stream ingest request"""
+    id: str = Field(..., min_length=1, description="Caller-supplied record identifier, echoed on its result line")
+    resume_text: str = Field(..., description="Resume text content")
+    job_description: str = Field(default="", description="Job description or requirements")
+
+
+class BatchResumeKeywords(BaseModel):
+    """Pre-extracted keywords for one resume in a batch"""
+    id: str = Field(..., description="Caller-supplied resume identifier")
+    resume_keywords: list[str] = Field(default_factory=list, description="Keywords extracted from the resume")
+
+
+class BatchScoreRequest(BaseModel):
+    """Request model for vectorized batch scoring"""
+    target_keywords: list[str] = Field(..., description="Keywords extracted from the job description")
+    keyword_weights: Optional[dict[str, float]] = Field(default=None, description="Optional weight per target keyword (default 1.0)")
+    resumes: list[BatchResumeKeywords] = Field(..., description="Resumes to score")
+    include_keywords: bool = Field(default=False, description="Return matched/missing keywords per resume")
+    semantic: bool = Field(default=False, description="Also count near-synonym keywords as matches (local n-gram similarity)")
+
+
+class BatchScoreResult(BaseModel):
+    """Score for one resume in a batch"""
+    id: str
+    match_score: float
+    matched_count: int
+    missing_count: int
+    matched_keywords: Optional[list[str]] = None
+    missing_keywords: Optional[list[str]] = None
+
+
+class BatchScoreResponse(BaseModel):
+    """Response model for vectorized batch scoring"""
+    success: bool
+    resume_count: int
+    target_count: int
+    results: list[BatchScoreResult]
+    skill_coverage: dict[str, float]
+
+
+class JobRequest(BaseModel):
+    """Request model for storing a job in the matching catalog"""
+    title: str = Field(default="", description="Role title")
+    job_description: str = Field(..., min_length=1, description="Job description or requirements")
+    target_keywords: Optional[list[str]] = Field(default=None, description="Pre-extracted target keywords; extracted once with the LLM if omitted")
+    keyword_weights: Optional[dict[str, float]] = Field(default=None, description="Optional weight per target keyword (default 1.0)")
+
+
+class JobResponse(BaseModel):
+    """A stored job with its extracted target keywords"""
+    job_id: str
+    title: str
+    target_keywords: list[str]
+    keyword_weights: Optional[dict[str, float]] = None
+    updated_at: float
+
+
+class JobListResponse(BaseModel):
+    """Response model for listing the job catalog"""
+    job_count: int
+    jobs: list[JobResponse]
+
+
+class MatchJobsRequest(BaseModel):
+    """Request model for ranking stored jobs against one resume"""
+    resume_text: Optional[str] = Field(default=None, description="Resume text; its keywords are extracted once")
+    resume_keywords: Optional[list[str]] = Field(default=None, description="Pre-extracted resume keywords (skips extraction)")
+    top_n: int = Field(default=10, ge=1, le=100, description="Number of ranked roles to return")
+    min_score: float = Field(default=0.0, ge=0.0, le=1.0, description="Leave out roles scoring below this")
+    analyze_top: int = Field(default=0, ge=0, description="Run the full LLM analysis for this many of the best roles (needs resume_text)")
+    deadline_seconds: Optional[float] = Field(default=None, gt=0, description="Time budget for the whole request, extraction and full analyses included")
+    lane: Lane = Field(default="interactive", description="Priority lane for the full analyses")
+
+
+class JobMatch(BaseModel):
+    """One ranked role for a resume"""
+    job_id: str
+    title: str
+    match_score: float
+    matched_count: int
+    missing_count: int
+    matched_keywords: list[str]
+    missing_keywords: list[str]
+    analysis: Optional[ResumeAnalysisResponse] = None
+
+
+class MatchJobsResponse(BaseModel):
+    """Response model for reverse matching"""
+    success: bool
+    resume_keywords: list[str]
+    jobs_considered: int
+    matches: list[JobMatch]
+    degraded: Optional[bool] = None
+    errors: Optional[list[str]] = None
+
+
+class WhatIfRequest(BaseModel):
+    """Request model for rescoring an analysis with edited resume keywords"""
+    run_id: Optional[str] = Field(default=None, description="Earlier analysis whose extracted keywords to start from")
+    resume_keywords: Optional[list[str]] = Field(default=None, description="Resume keywords to start from (overrides the run's)")
+    target_keywords: Optional[list[str]] = Field(default=None, description="Target keywords to score against (overrides the run's; required without run_id)")
+    add_keywords: list[str] = Field(default_factory=list, description="Keywords to add to the resume")
+    remove_keywords: list[str] = Field(default_factory=list, description="Keywords to remove from the resume")
+    semantic: bool = Field(default=False, description="Also count near-synonym keywords as matches (local n-gram similarity)")
+
+
+class WhatIfResponse(BaseModel):
+    """Response model for what-if rescoring"""
+    success: bool
+    run_id: Optional[str] = None
+    match_score: float
+    baseline_score: float
+    score_delta: float
+    matched_keywords: list[str]
+    missing_keywords: list[str]
+    newly_matched: list[str]
+    newly_missing: list[str]
+    resume_keywords: list[str]
@@ -1,204 +1,724 @@
 """
 Resume Analyzer Router
 """
+import tempfile
 import time
 import logging
+from dataclasses import asdict
+from typing import Optional, Union
 
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, UploadFile, File, Form, Header, HTTPException, Query, Request
+from fastapi.responses import ORJSONResponse, StreamingResponse
 
-from graphs.workflow import resume_analyzer_graph
-from graphs.state import ResumeAnalyzerState
-from models.resume_analyzer import ResumeAnalysisRequest, ResumeAnalysisResponse
+from utils.admission import AdmissionRejected, admission_controller
+from utils.archive_reader import is_supported_archive
+from utils.deadline import DEADLINE_HEADER, resolve_budget
+from utils.file_parser import supported_extensions
+from utils.profiling import PROFILE_ADMIN_TOKEN, PROFILE_HEADER, is_admin_token, profile_stage, profile_store
+from models.resume_analyzer import (
+    ResumeAnalysisRequest,
+    ResumeAnalysisResponse,
+    ProjectedAnalysisResponse,
+    BatchScoreRequest,
+    BatchScoreResponse,
+    Lane,
+    ReanalysisRequest,
+    ReanalysisResponse,
+    JobRequest,
+    JobResponse,
+    JobListResponse,
+    MatchJobsRequest,
+    MatchJobsResponse,
+    WhatIfRequest,
+    WhatIfResponse,
+)
+from services.resume_service import (
+    resume_analysis_service,
+    parse_response_fields,
+    RunConflictError,
+    RunNotFoundError,
+    ARCHIVE_CONCURRENCY,
+    MAX_ARCHIVE_BYTES,
+    STREAM_CONCURRENCY,
+)
+from services.document_service import document_parsing_service, UploadTooLargeError
+from services.incremental_service import incremental_analysis_service
+from services.job_matching_service import job_matching_service, JobNotFoundError, KeywordExtractionError
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
     prefix="/api/v1/resume-analyzer",
-    tags=["Resume Analyzer"]
+    tags=["Resume Analyzer"],
+    default_response_class=ORJSONResponse
 )
 
+FIELDS_DESCRIPTION = "Comma-separated response fields to return (e.g. match_score,missing_keywords,matched_count)"
+COMPACT_DESCRIPTION = "Return only success, match_score, matched_count and missing_count"
+# Handlers return serialized dicts that ?fields=/compact may trim, so the
+# response shapes are documented here instead of validated via response_model
+ANALYSIS_RESPONSES = {
+    200: {
+        "model": Union[ResumeAnalysisResponse, ProjectedAnalysisResponse],
+        "description": "Full ResumeAnalysisResponse, or only the fields selected with fields/compact"
+    }
+}
+DEADLINE_DESCRIPTION = "Time budget in seconds; stages that can't finish in time are skipped (see skipped_stages)"
+LANE_DESCRIPTION = "Priority lane: interactive requests run ahead of queued bulk work"
+
+
+async def _admit():
+    """Take a workflow slot, mapping rejection to 429 + Retry-After"""
+    try:
+        await admission_controller.acquire()
+    except AdmissionRejected as e:
+        logger.warning("Request rejected by admission control: %s", e)
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+
+
+async def admission_slot():
+    """Hold a workflow slot for the request, or reject it with 429 + Retry-After"""
+    await _admit()
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        admission_controller.release(time.perf_counter() - start_time)
+
+
+async def admission_gate():
+    """
+    Queue or reject a streaming request like admission_slot, without holding the slot
+    
+    Streaming work outlives the handler, so each record takes its own slot
+    while it runs (see AdmissionController.slot) and the request's slot is
+    handed straight on.
+    """
+    await _admit()
+    admission_controller.release()
+
+
+class DuplexStreamingResponse(StreamingResponse):
+    """
+    StreamingResponse that can be sent while the request body is still being read
+    
+    The stock response listens for a client disconnect by consuming receive()
+    messages, which would steal request body chunks from the endpoint. Here the
+    body reader sees the disconnect instead (Request.stream() raises).
+    """
+    
+    async def __call__(self, scope, receive, send):
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
+def _analysis_response(result: dict, fields: Optional[list[str]]) -> ORJSONResponse:
+    """Shape and serialize a workflow result (a stage of its own in request profiles)"""
+    with profile_stage("format_response"):
+        return ORJSONResponse(resume_analysis_service.format_result(result, fields))
+
+
+def _resolve_fields(fields: Optional[str], compact: bool) -> Optional[list[str]]:
+    """Validate the projection parameters, mapping bad input to 400"""
+    try:
+        return parse_response_fields(fields, compact)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 
-@router.post("/analyze", response_model=ResumeAnalysisResponse)
-async def analyze_resume(request: ResumeAnalysisRequest):
+@router.post("/analyze", response_model=None, responses=ANALYSIS_RESPONSES, dependencies=[Depends(admission_slot)])
+async def analyze_resume(
+    request: ResumeAnalysisRequest,
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    compact: bool = Query(default=False, description=COMPACT_DESCRIPTION),
+    deadline_header: Optional[float] = Header(default=None, alias=DEADLINE_HEADER, description=DEADLINE_DESCRIPTION)
+):
     """
     Analyze a resume against a job description
     
     Args:
         request: ResumeAnalysisRequest containing resume text and job description
+        fields: Optional comma-separated field projection
+        compact: Return only score and counts
+        deadline_header: Optional time budget from the X-Deadline-Seconds header
         
     Returns:
-        ResumeAnalysisResponse: Analysis results
+        ResumeAnalysisResponse: Analysis results (projected if fields/compact given)
     """
     start_time = time.time()
-    logger.info("=" * 100)
-    logger.info("POST /api/v1/resume-analyzer/analyze - Request received")
-    logger.info(f"Request - Resume length: {len(request.resume_text)} chars, Job description length: {len(request.job_description)} chars")
+    logger.info("POST /api/v1/resume-analyzer/analyze - Request received - Resume length: %d chars, Job description length: %d chars", len(request.resume_text), len(request.job_description))
+    
+    selected_fields = _resolve_fields(fields, compact)
     
     try:
-        # Create initial state
-        initial_state: ResumeAnalyzerState = {
-            "resume_text": request.resume_text,
-            "job_description": request.job_description,
-            "errors": []
-        }
+        logger.debug("Invoking resume analyzer workflow")
         
-        logger.info("Invoking resume analyzer workflow")
-        
-        # Run the workflow
-        result = resume_analyzer_graph.invoke(initial_state)
+        # Run the workflow off the event loop; identical in-flight requests share one run
+        result = await resume_analysis_service.analyze_resume_async(
+            request.resume_text,
+            request.job_description,
+            request.run_id,
+            resolve_budget(request.deadline_seconds, deadline_header),
+            request.lane
+        )
         
         # Check if validation failed
         if not result.get("is_valid", False):
             elapsed_time = time.time() - start_time
-            logger.warning(f"Analysis failed validation - Elapsed time: {elapsed_time:.2f}s")
-            logger.warning(f"Validation issues: {result.get('validation_issues', [])}")
-            logger.info("=" * 100)
+            logger.warning("Analysis failed validation - Elapsed time: %.2fs", elapsed_time)
+            logger.warning("Validation issues: %s", result.get("validation_issues", []))
             
-            return ResumeAnalysisResponse(
-                success=False,
-                match_score=0.0,
-                matched_keywords=[],
-                missing_keywords=[],
-                resume_keywords=[],
-                target_keywords=[],
-                recommendations=[],
-                confidence_notes="",
-                final_summary="",
-                validation_issues=result.get("validation_issues", []),
-                errors=result.get("errors", [])
-            )
+            return _analysis_response(result, selected_fields)
         
         # Return successful result
         elapsed_time = time.time() - start_time
-        logger.info(f"Analysis completed successfully - Elapsed time: {elapsed_time:.2f}s")
-        logger.info(f"Response - Match score: {result.get('match_score', 0.0):.2%}")
-        logger.info(f"Response - Matched keywords: {len(result.get('matched_keywords', []))}, Missing keywords: {len(result.get('missing_keywords', []))}")
-        logger.info(f"Response - Recommendations: {len(result.get('recommendations', []))}")
-        logger.info("=" * 100)
-        
-        return ResumeAnalysisResponse(
-            success=True,
-            match_score=result.get("match_score", 0.0),
-            matched_keywords=result.get("matched_keywords", []),
-            missing_keywords=result.get("missing_keywords", []),
-            resume_keywords=result.get("resume_keywords", []),
-            target_keywords=result.get("target_keywords", []),
-            recommendations=result.get("recommendations", []),
-            confidence_notes=result.get("confidence_notes", ""),
-            final_summary=result.get("final_summary", ""),
-            validation_issues=result.get("validation_issues", []),
-            errors=result.get("errors", [])
+        logger.info(
+            "Analysis completed successfully - Elapsed time: %.2fs, match score: %.2f, matched: %d, missing: %d, recommendations: %d",
+            elapsed_time,
+            result.get("match_score", 0.0),
+            len(result.get("matched_keywords", [])),
+            len(result.get("missing_keywords", [])),
+            len(result.get("recommendations", []))
         )
         
+        return _analysis_response(result, selected_fields)
+        
+    except RunConflictError as e:
+        logger.warning("Run id conflict: %s", e)
+        raise HTTPException(status_code=409, detail=str(e))
     except Exception as e:
         elapsed_time = time.time() - start_time
-        logger.error(f"Analysis failed with exception - Elapsed time: {elapsed_time:.2f}s", exc_info=True)
-        logger.info("=" * 100)
+        logger.error("Analysis failed with exception - Elapsed time: %.2fs", elapsed_time, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
-@router.post("/analyze-file", response_model=ResumeAnalysisResponse)
+@router.post("/analyze-file", response_model=None, responses=ANALYSIS_RESPONSES, dependencies=[Depends(admission_slot)])
 async def analyze_resume_file(
-    file: UploadFile = File(..., description="Resume text file (.txt)"),
-    job_description: str = Form(default="", description="Job description or requirements")
+    file: UploadFile = File(..., description="Resume file (.txt, .md, .pdf, .docx, .html, .rtf)"),
+    job_description: str = Form(default="", description="Job description or requirements"),
+    run_id: Optional[str] = Form(default=None, description="Run identifier; retrying with the same id resumes the run"),
+    deadline_seconds: Optional[float] = Form(default=None, gt=0, description=DEADLINE_DESCRIPTION),
+    lane: Lane = Form(default="interactive", description=LANE_DESCRIPTION),
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    compact: bool = Query(default=False, description=COMPACT_DESCRIPTION),
+    deadline_header: Optional[float] = Header(default=None, alias=DEADLINE_HEADER, description=DEADLINE_DESCRIPTION)
 ):
     """
     Analyze a resume from an uploaded file against a job description
     
     Args:
-        file: Uploaded resume file (.txt format)
+        file: Uploaded resume file (text, PDF, DOCX, HTML or RTF)
         job_description: Job description or requirements
+        run_id: Optional run identifier
+        deadline_seconds: Optional time budget
+        lane: Priority lane
+        deadline_header: Optional time budget from the X-Deadline-Seconds header
+        fields: Optional comma-separated field projection
+        compact: Return only score and counts
         
     Returns:
-        ResumeAnalysisResponse: Analysis results
+        ResumeAnalysisResponse: Analysis results (projected if fields/compact given)
     """
     start_time = time.time()
-    logger.info("=" * 100)
-    logger.info("POST /api/v1/resume-analyzer/analyze-file - Request received")
-    logger.info(f"Request - File: {file.filename}, Job description length: {len(job_description)} chars")
+    budget = resolve_budget(deadline_seconds, deadline_header)
+    logger.info("POST /api/v1/resume-analyzer/analyze-file - Request received - File: %s, Job description length: %d chars", file.filename, len(job_description))
+    
+    selected_fields = _resolve_fields(fields, compact)
     
     try:
         # Validate file type
-        if not file.filename.endswith(('.txt', '.md', '.text')):
-            logger.warning(f"Invalid file type: {file.filename}")
+        if not document_parsing_service.is_supported(file.filename):
+            logger.warning("Invalid file type: %s", file.filename)
             raise HTTPException(
                 status_code=400,
-                detail="File must be a text file (.txt, .md, .text)"
+                detail=f"Unsupported file type (supported: {', '.join(supported_extensions())})"
             )
         
-        # Read file content
-        logger.info(f"Reading file: {file.filename}")
-        content = await file.read()
-        resume_text = content.decode('utf-8')
-        logger.info(f"File content read: {len(resume_text)} characters")
+        # Stream, size-check and parse file content off the event loop
+        logger.debug("Reading file: %s", file.filename)
+        resume_text = await document_parsing_service.parse_upload(file)
+        logger.info("File content read: %d characters", len(resume_text))
         
-        # Create initial state
-        initial_state: ResumeAnalyzerState = {
-            "resume_text": resume_text,
-            "job_description": job_description,
-            "errors": []
-        }
+        logger.debug("Invoking resume analyzer workflow")
         
-        logger.info("Invoking resume analyzer workflow")
-        
-        # Run the workflow
-        result = resume_analyzer_graph.invoke(initial_state)
+        # Run the workflow off the event loop; identical in-flight requests share one run
+        result = await resume_analysis_service.analyze_resume_async(
+            resume_text,
+            job_description,
+            run_id,
+            budget,
+            lane
+        )
         
         # Check if validation failed
         if not result.get("is_valid", False):
             elapsed_time = time.time() - start_time
-            logger.warning(f"Analysis failed validation - Elapsed time: {elapsed_time:.2f}s")
-            logger.warning(f"Validation issues: {result.get('validation_issues', [])}")
-            logger.info("=" * 100)
+            logger.warning("Analysis failed validation - Elapsed time: %.2fs", elapsed_time)
+            logger.warning("Validation issues: %s", result.get("validation_issues", []))
             
-            return ResumeAnalysisResponse(
-                success=False,
-                match_score=0.0,
-                matched_keywords=[],
-                missing_keywords=[],
-                resume_keywords=[],
-                target_keywords=[],
-                recommendations=[],
-                confidence_notes="",
-                final_summary="",
-                validation_issues=result.get("validation_issues", []),
-                errors=result.get("errors", [])
-            )
+            return _analysis_response(result, selected_fields)
         
         # Return successful result
         elapsed_time = time.time() - start_time
-        logger.info(f"Analysis completed successfully - Elapsed time: {elapsed_time:.2f}s")
-        logger.info(f"Response - Match score: {result.get('match_score', 0.0):.2%}")
-        logger.info(f"Response - Matched keywords: {len(result.get('matched_keywords', []))}, Missing keywords: {len(result.get('missing_keywords', []))}")
-        logger.info(f"Response - Recommendations: {len(result.get('recommendations', []))}")
-        logger.info("=" * 100)
-        
-        return ResumeAnalysisResponse(
-            success=True,
-            match_score=result.get("match_score", 0.0),
-            matched_keywords=result.get("matched_keywords", []),
-            missing_keywords=result.get("missing_keywords", []),
-            resume_keywords=result.get("resume_keywords", []),
-            target_keywords=result.get("target_keywords", []),
-            recommendations=result.get("recommendations", []),
-            confidence_notes=result.get("confidence_notes", ""),
-            final_summary=result.get("final_summary", ""),
-            validation_issues=result.get("validation_issues", []),
-            errors=result.get("errors", [])
+        logger.info(
+            "Analysis completed successfully - Elapsed time: %.2fs, match score: %.2f, matched: %d, missing: %d, recommendations: %d",
+            elapsed_time,
+            result.get("match_score", 0.0),
+            len(result.get("matched_keywords", [])),
+            len(result.get("missing_keywords", [])),
+            len(result.get("recommendations", []))
         )
         
+        return _analysis_response(result, selected_fields)
+        
+    except HTTPException:
+        raise
+    except RunConflictError as e:
+        logger.warning("Run id conflict: %s", e)
+        raise HTTPException(status_code=409, detail=str(e))
+    except UploadTooLargeError as e:
+        elapsed_time = time.time() - start_time
+        logger.error("Upload too large - Elapsed time: %.2fs", elapsed_time)
+        raise HTTPException(status_code=413, detail=str(e))
     except UnicodeDecodeError:
         elapsed_time = time.time() - start_time
-        logger.error(f"File encoding error - Elapsed time: {elapsed_time:.2f}s")
-        logger.info("=" * 100)
+        logger.error("File encoding error - Elapsed time: %.2fs", elapsed_time)
         raise HTTPException(status_code=400, detail="File must be valid UTF-8 text")
+    except ValueError as e:
+        elapsed_time = time.time() - start_time
+        logger.error("File parsing error - Elapsed time: %.2fs: %s", elapsed_time, e)
+        raise HTTPException(status_code=400, detail=f"Could not parse file: {str(e)}")
     except Exception as e:
         elapsed_time = time.time() - start_time
-        logger.error(f"Analysis failed with exception - Elapsed time: {elapsed_time:.2f}s", exc_info=True)
-        logger.info("=" * 100)
+        logger.error("Analysis failed with exception - Elapsed time: %.2fs", elapsed_time, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Analysis failed: {str(e)}")
 
 
+@router.post("/runs/{run_id}/resume", response_model=None, responses=ANALYSIS_RESPONSES, dependencies=[Depends(admission_slot)])
+async def resume_run(
+    run_id: str,
+    lane: Lane = Query(default="interactive", description=LANE_DESCRIPTION),
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    compact: bool = Query(default=False, description=COMPACT_DESCRIPTION),
+    deadline_header: Optional[float] = Header(default=None, alias=DEADLINE_HEADER, description=DEADLINE_DESCRIPTION)
+):
+    """
+    Resume a checkpointed analysis from its last successful (not skipped) node
+    
+    Args:
+        run_id: Run identifier returned by /analyze or /analyze-file
+        lane: Priority lane
+        fields: Optional comma-separated field projection
+        compact: Return only score and counts
+        deadline_header: Optional time budget from the X-Deadline-Seconds header
+        
+    Returns:
+        ResumeAnalysisResponse: Analysis results (projected if fields/compact given)
+    """
+    start_time = time.time()
+    logger.info("POST /api/v1/resume-analyzer/runs/%s/resume - Request received", run_id)
+    
+    selected_fields = _resolve_fields(fields, compact)
+    
+    try:
+        result = await resume_analysis_service.resume_run_async(run_id, resolve_budget(deadline_header), lane)
+        
+        elapsed_time = time.time() - start_time
+        logger.info("Run resumed - Elapsed time: %.2fs, errors: %d", elapsed_time, len(result.get("errors", [])))
+        
+        return _analysis_response(result, selected_fields)
+        
+    except RunNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except Exception as e:
+        elapsed_time = time.time() - start_time
+        logger.error("Resume failed with exception - Elapsed time: %.2fs", elapsed_time, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Resume failed: {str(e)}")
+
+
+@router.post("/reanalyze", response_model=ReanalysisResponse, dependencies=[Depends(admission_slot)])
+async def reanalyze_resume(
+    request: ReanalysisRequest,
+    deadline_header: Optional[float] = Header(default=None, alias=DEADLINE_HEADER, description=DEADLINE_DESCRIPTION)
+):
+    """
+    Re-analyze an edited resume, re-extracting only the sections that changed
+    
+    The first submission for a document id (or one with a new job description)
+    runs the full analysis; later ones reuse unchanged sections' keywords and
+    re-score locally.
+    
+    Args:
+        request: ReanalysisRequest containing the document id and current resume text
+        deadline_header: Optional time budget from the X-Deadline-Seconds header
+        
+    Returns:
+        ReanalysisResponse: Analysis results plus how many sections were re-extracted
+    """
+    start_time = time.time()
+    logger.info("POST /api/v1/resume-analyzer/reanalyze - Request received - Document: %s, Resume length: %d chars", request.document_id, len(request.resume_text))
+    
+    try:
+        result = await incremental_analysis_service.reanalyze_async(
+            request.document_id,
+            request.resume_text,
+            request.job_description,
+            resolve_budget(request.deadline_seconds, deadline_header),
+            request.lane
+        )
+        
+        elapsed_time = time.time() - start_time
+        logger.info(
+            "Re-analysis completed - Elapsed time: %.2fs, mode: %s, sections re-extracted: %d/%d",
+            elapsed_time,
+            result["mode"],
+            result["sections_reextracted"],
+            result["sections_total"]
+        )
+        
+        return ORJSONResponse(incremental_analysis_service.format_result(result))
+        
+    except Exception as e:
+        elapsed_time = time.time() - start_time
+        logger.error("Re-analysis failed with exception - Elapsed time: %.2fs", elapsed_time, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Re-analysis failed: {str(e)}")
+
+
+@router.post("/analyze-archive", dependencies=[Depends(admission_gate)])
+async def analyze_resume_archive(
+    file: UploadFile = File(..., description="ZIP or tar archive of resumes"),
+    job_description: str = Form(default="", description="Job description or requirements"),
+    concurrency: int = Form(default=ARCHIVE_CONCURRENCY, ge=1, le=32, description="Maximum concurrent analyses"),
+    lane: Lane = Form(default="bulk", description=LANE_DESCRIPTION),
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    compact: bool = Query(default=False, description=COMPACT_DESCRIPTION)
+):
+    """
+    Analyze every resume in an uploaded archive, streaming results as NDJSON
+    
+    Each line is one member's ResumeAnalysisResponse plus "filename" (or an
+    "error"), in completion order; the last line is a {"summary": ...} record.
+    
+    Args:
+        file: Uploaded ZIP or tar archive
+        job_description: Job description applied to every resume
+        concurrency: Maximum number of concurrent analyses
+        lane: Priority lane for the member analyses
+        fields: Optional comma-separated field projection applied to each line
+        compact: Return only score and counts per file
+        
+    Returns:
+        StreamingResponse: application/x-ndjson stream of per-file results
+    """
+    logger.info("POST /api/v1/resume-analyzer/analyze-archive - Request received - Archive: %s, Job description length: %d chars", file.filename, len(job_description))
+    
+    if not is_supported_archive(file.filename):
+        logger.warning("Invalid archive type: %s", file.filename)
+        raise HTTPException(status_code=400, detail="File must be a ZIP or tar archive")
+    
+    selected_fields = _resolve_fields(fields, compact)
+    
+    if file.size is not None and file.size > MAX_ARCHIVE_BYTES:
+        logger.warning("Archive too large: %d bytes", file.size)
+        raise HTTPException(status_code=413, detail=f"Archive exceeds maximum size of {MAX_ARCHIVE_BYTES} bytes")
+    
+    # Take ownership of the spooled upload: FastAPI closes request files when the
+    # endpoint returns, but the NDJSON stream keeps reading members after that
+    archive_file = file.file
+    file.file = tempfile.SpooledTemporaryFile()
+    
+    async def ndjson_stream():
+        start_time = time.time()
+        try:
+            async for record in resume_analysis_service.analyze_archive(
+                archive_file, file.filename, job_description, concurrency, selected_fields, lane
+            ):
+                yield orjson.dumps(record) + b"\n"
+        finally:
+            archive_file.close()
+        elapsed_time = time.time() - start_time
+        logger.info("Archive analysis completed - Elapsed time: %.2fs", elapsed_time)
+    
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/analyze-stream", dependencies=[Depends(admission_gate)])
+async def analyze_resume_stream(
+    request: Request,
+    concurrency: int = Query(default=STREAM_CONCURRENCY, ge=1, le=32, description="Maximum concurrent analyses"),
+    lane: Lane = Query(default="bulk", description=LANE_DESCRIPTION),
+    fields: Optional[str] = Query(default=None, description=FIELDS_DESCRIPTION),
+    compact: bool = Query(default=False, description=COMPACT_DESCRIPTION)
+):
+    """
+    Analyze a chunked NDJSON stream of {id, resume_text, job_description} records
+    
+    Records start as soon as their line arrives and results stream back as
+    NDJSON in completion order, each tagged with its "id" (or an "error");
+    the last line is a {"summary": ...} record. The request body is read only
+    as fast as analysis slots free up, so memory stays flat for any stream
+    length.
+    
+    Args:
+        request: Request whose body is the NDJSON stream
+        concurrency: Maximum number of concurrent analyses
+        lane: Priority lane for the analyses
+        fields: Optional comma-separated field projection applied to each line
+        compact: Return only score and counts per record
+        
+    Returns:
+        DuplexStreamingResponse: application/x-ndjson stream of per-record results
+    """
+    logger.info("POST /api/v1/resume-analyzer/analyze-stream - Request received - Concurrency: %d, Lane: %s", concurrency, lane)
+    
+    selected_fields = _resolve_fields(fields, compact)
+    
+    async def ndjson_stream():
+        start_time = time.time()
+        async for record in resume_analysis_service.analyze_stream(
+            request.stream(), concurrency, selected_fields, lane
+        ):
+            yield orjson.dumps(record) + b"\n"
+        elapsed_time = time.time() - start_time
+        logger.info("Stream analysis completed - Elapsed time: %.2fs", elapsed_time)
+    
+    return DuplexStreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+
+@router.post("/score-batch", response_model=None, responses={200: {"model": BatchScoreResponse}})
+async def score_batch(request: BatchScoreRequest):
+    """
+    Score many pre-extracted resumes against one job description without LLM calls
+    
+    Args:
+        request: BatchScoreRequest containing target keywords and resume keyword sets
+        
+    Returns:
+        BatchScoreResponse: Per-resume scores and per-skill coverage
+    """
+    start_time = time.time()
+    logger.info("POST /api/v1/resume-analyzer/score-batch - Request received - Resumes: %d, Target keywords: %d", len(request.resumes), len(request.target_keywords))
+    
+    try:
+        batch = await resume_analysis_service.score_batch_async(
+            resumes=[item.model_dump() for item in request.resumes],
+            target_keywords=request.target_keywords,
+            keyword_weights=request.keyword_weights,
+            include_keywords=request.include_keywords,
+            semantic=request.semantic
+        )
+        
+        elapsed_time = time.time() - start_time
+        logger.info("Batch scoring completed - Elapsed time: %.3fs", elapsed_time)
+        
+        return ORJSONResponse({"success": True, **batch})
+        
+    except Exception as e:
+        elapsed_time = time.time() - start_time
+        logger.error("Batch scoring failed with exception - Elapsed time: %.3fs", elapsed_time, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Batch scoring failed: {str(e)}")
+
+
+@router.post("/what-if", response_model=None, responses={200: {"model": WhatIfResponse}})
+async def what_if(request: WhatIfRequest):
+    """
+    Rescore an analysis with resume keywords added or removed, without LLM calls
+    
+    Starts from the keywords extracted for run_id (or the keyword sets given)
+    and recomputes matched/missing keywords and match_score locally.
+    
+    Args:
+        request: WhatIfRequest with a run_id or keyword sets, plus the edits
+        
+    Returns:
+        WhatIfResponse: Edited score, baseline score and what changed
+    """
+    start_time = time.perf_counter()
+    logger.info("POST /api/v1/resume-analyzer/what-if - Request received - Run: %s", request.run_id)
+    
+    try:
+        result = resume_analysis_service.what_if(
+            run_id=request.run_id,
+            resume_keywords=request.resume_keywords,
+            target_keywords=request.target_keywords,
+            add_keywords=request.add_keywords,
+            remove_keywords=request.remove_keywords,
+            semantic=request.semantic
+        )
+        
+        logger.info("What-if rescoring completed - Elapsed time: %.3fms", (time.perf_counter() - start_time) * 1000)
+        
+        return ORJSONResponse(result)
+        
+    except RunNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error("What-if rescoring failed with exception", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"What-if rescoring failed: {str(e)}")
+
+
+@router.put("/jobs/{job_id}", response_model=JobResponse)
+async def put_job(job_id: str, request: JobRequest):
+    """
+    Add or replace a job in the matching catalog
+    
+    Target keywords are extracted once here (unless supplied) so that
+    /match-jobs never re-reads job descriptions.
+    
+    Args:
+        job_id: Caller-chosen job id
+        request: JobRequest with the job description and optional keywords
+        
+    Returns:
+        JobResponse: The stored job
+    """
+    logger.info("PUT /api/v1/resume-analyzer/jobs/%s - Request received - Job description length: %d chars", job_id, len(request.job_description))
+    
+    try:
+        job = await job_matching_service.put_job_async(
+            job_id,
+            request.job_description,
+            title=request.title,
+            target_keywords=request.target_keywords,
+            keyword_weights=request.keyword_weights
+        )
+        return asdict(job)
+    except KeywordExtractionError as e:
+        logger.warning("Job keyword extraction failed: %s", e)
+        raise HTTPException(status_code=502, detail=str(e))
+    except Exception as e:
+        logger.error("Storing job %s failed", job_id, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Storing job failed: {str(e)}")
+
+
+@router.get("/jobs", response_model=JobListResponse)
+async def list_jobs():
+    """Jobs in the matching catalog"""
+    logger.debug("GET /api/v1/resume-analyzer/jobs - Jobs listed")
+    jobs = job_matching_service.list_jobs()
+    return {"job_count": len(jobs), "jobs": [asdict(job) for job in jobs]}
+
+
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """One stored job with its target keywords"""
+    logger.debug("GET /api/v1/resume-analyzer/jobs/%s - Job requested", job_id)
+    try:
+        return asdict(job_matching_service.get_job(job_id))
+    except JobNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
+@router.delete("/jobs/{job_id}")
+async def delete_job(job_id: str):
+    """Remove a job from the matching catalog"""
+    logger.info("DELETE /api/v1/resume-analyzer/jobs/%s - Request received", job_id)
+    if not job_matching_service.delete_job(job_id):
+        raise HTTPException(status_code=404, detail=f"Unknown job: {job_id}")
+    return {"deleted": job_id}
+
+
+@router.post("/match-jobs", response_model=MatchJobsResponse, dependencies=[Depends(admission_slot)])
+async def match_jobs(
+    request: MatchJobsRequest,
+    deadline_header: Optional[float] = Header(default=None, alias=DEADLINE_HEADER, description=DEADLINE_DESCRIPTION)
+):
+    """
+    Rank the stored jobs for one resume
+    
+    The resume's keywords are extracted once (one LLM call, or none if
+    resume_keywords is given) and scored against every stored job's
+    pre-extracted target keywords. The full analysis can optionally be run
+    for the best `analyze_top` roles.
+    
+    Args:
+        request: MatchJobsRequest with the resume and ranking options
+        deadline_header: Optional time budget from the X-Deadline-Seconds header
+        
+    Returns:
+        MatchJobsResponse: Best roles first
+    """
+    start_time = time.time()
+    logger.info("POST /api/v1/resume-analyzer/match-jobs - Request received - Top: %d, Analyze top: %d", request.top_n, request.analyze_top)
+    
+    try:
+        result = await job_matching_service.match_jobs(
+            resume_text=request.resume_text,
+            resume_keywords=request.resume_keywords,
+            top_n=request.top_n,
+            min_score=request.min_score,
+            analyze_top=request.analyze_top,
+            deadline_seconds=resolve_budget(request.deadline_seconds, deadline_header),
+            lane=request.lane
+        )
+        
+        elapsed_time = time.time() - start_time
+        logger.info("Job matching completed - Elapsed time: %.2fs, jobs considered: %d, matches: %d", elapsed_time, result["jobs_considered"], len(result["matches"]))
+        
+        return ORJSONResponse(result)
+        
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except KeywordExtractionError as e:
+        logger.warning("Resume keyword extraction failed: %s", e)
+        raise HTTPException(status_code=502, detail=str(e))
+    except Exception as e:
+        elapsed_time = time.time() - start_time
+        logger.error("Job matching failed with exception - Elapsed time: %.2fs", elapsed_time, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Job matching failed: {str(e)}")
+
+
+@router.get("/stats")
+async def stats():
+    """Runtime counters for the analysis pipeline"""
+    logger.debug("GET /api/v1/resume-analyzer/stats - Stats requested")
+    return {
+        **resume_analysis_service.get_stats(),
+        "incremental": incremental_analysis_service.stats(),
+        "job_matching": job_matching_service.stats()
+    }
+
+
+def _check_profile_access(token: Optional[str]):
+    """Profiles may include request details; only holders of the admin token can read them"""
+    if not PROFILE_ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Reading profiles requires PROFILE_ADMIN_TOKEN to be set")
+    if not is_admin_token(token):
+        raise HTTPException(status_code=403, detail=f"Profiles require the {PROFILE_HEADER} admin header")
+
+
+@router.get("/profiles")
+async def list_profiles(token: Optional[str] = Header(default=None, alias=PROFILE_HEADER)):
+    """Most recent request profiles, newest first"""
+    logger.debug("GET /api/v1/resume-analyzer/profiles - Profiles listed")
+    _check_profile_access(token)
+    return {"profiles": profile_store.list()}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, token: Optional[str] = Header(default=None, alias=PROFILE_HEADER)):
+    """
+    One request's profile: wall, CPU and LLM-wait time per workflow node and the hottest functions
+    
+    Args:
+        profile_id: Id from the X-Profile-Id response header
+        token: Admin token (PROFILE_ADMIN_TOKEN)
+        
+    Returns:
+        dict: Profile report
+    """
+    logger.debug("GET /api/v1/resume-analyzer/profiles/%s - Profile requested", profile_id)
+    _check_profile_access(token)
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=404, detail=f"Unknown profile: {profile_id}")
+    return profile.to_dict()
+
+
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -0,0 +1,154 @@
+"""
+Document Parsing Service Layer
+"""
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from fastapi import UploadFile
+
+from utils.file_parser import TEXT_EXTENSIONS, extract_text, supported_extensions
+
+logger = logging.getLogger(__name__)
+
+MAX_UPLOAD_BYTES = int(os.getenv("MAX_UPLOAD_BYTES", str(5 * 1024 * 1024)))
+PARSER_MAX_WORKERS = int(os.getenv("PARSER_MAX_WORKERS", "2"))
+PARSE_CACHE_SIZE = int(os.getenv("PARSE_CACHE_SIZE", "256"))
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class UploadTooLargeError(ValueError):
+    """Raised when an upload exceeds the configured size limit"""
+
+
+class DocumentParsingService:
+    """Service for turning uploaded documents into resume text off the event loop"""
+
+    def __init__(
+        self,
+        max_workers: int = PARSER_MAX_WORKERS,
+        cache_size: int = PARSE_CACHE_SIZE,
+        max_upload_bytes: int = MAX_UPLOAD_BYTES
+    ):
+        self.max_workers = max_workers
+        self.cache_size = cache_size
+        self.max_upload_bytes = max_upload_bytes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._cache: "OrderedDict[str, str]" = OrderedDict()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the worker pool on first use"""
+        if self._executor is None:
+            logger.info("Starting parser process pool with %d workers", self.max_workers)
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            # Bound queued work so a burst of uploads can't pile up unbounded payloads
+            self._slots = asyncio.Semaphore(self.max_workers * 2)
+        return self._executor
+
+    def is_supported(self, filename: str) -> bool:
+        """Check whether a file name has a registered parser"""
+        return Path(filename or "").suffix.lower() in supported_extensions()
+
+    async def read_upload(self, file: UploadFile) -> tuple[bytes, str]:
+        """
+        Read an upload in chunks, enforcing the size limit and hashing as it streams
+
+        Args:
+            file: Uploaded file
+
+        Returns:
+            tuple: (raw content, sha256 hex digest)
+
+        Raises:
+            UploadTooLargeError: If the upload exceeds max_upload_bytes
+        """
+        if file.size is not None and file.size > self.max_upload_bytes:
+            raise UploadTooLargeError(
+                f"File exceeds maximum upload size of {self.max_upload_bytes} bytes"
+            )
+
+        digest = hashlib.sha256()
+        chunks = []
+        total = 0
+        while True:
+            chunk = await file.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            total += len(chunk)
+            if total > self.max_upload_bytes:
+                raise UploadTooLargeError(
+                    f"File exceeds maximum upload size of {self.max_upload_bytes} bytes"
+                )
+            digest.update(chunk)
+            chunks.append(chunk)
+
+        return b"".join(chunks), digest.hexdigest()
+
+    async def parse(self, filename: str, data: bytes, digest: Optional[str] = None) -> str:
+        """
+        Extract text from raw document content, using the cache when possible
+
+        Plain text is decoded inline; other formats are parsed in the process pool.
+
+        Args:
+            filename: Original file name (used for the extension)
+            data: Raw file content
+            digest: sha256 hex digest of data, computed if not given
+
+        Returns:
+            str: Extracted text
+        """
+        extension = Path(filename).suffix.lower()
+        cache_key = f"{digest or hashlib.sha256(data).hexdigest()}{extension}"
+
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            self._cache.move_to_end(cache_key)
+            logger.debug("Parse cache hit for %s", filename)
+            return cached
+
+        if extension in TEXT_EXTENSIONS:
+            text = extract_text(filename, data)
+        else:
+            executor = self._get_executor()
+            async with self._slots:
+                loop = asyncio.get_running_loop()
+                text = await loop.run_in_executor(executor, extract_text, filename, data)
+
+        self._cache[cache_key] = text
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        logger.info("Parsed %s: %d bytes -> %d characters", filename, len(data), len(text))
+        return text
+
+    async def parse_upload(self, file: UploadFile) -> str:
+        """
+        Stream, size-check and parse an uploaded resume
+
+        Args:
+            file: Uploaded file
+
+        Returns:
+            str: Extracted text
+        """
+        data, digest = await self.read_upload(file)
+        return await self.parse(file.filename, data, digest)
+
+    def shutdown(self):
+        """Stop the worker pool"""
+        if self._executor is not None:
+            logger.info("Shutting down parser process pool")
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._slots = None
+
+
+# Create singleton instance
+document_parsing_service = DocumentParsingService()
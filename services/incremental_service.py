@@ -0,0 +1,293 @@
+"""
+Incremental Re-analysis Service Layer
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from graphs.state import keywords_reusable
+from services.resume_service import resume_analysis_service
+from utils.deadline import budget_after_wait, deadline_from_budget
+from utils.file_parser import validate_text_content
+from utils.keywords import canonical_keyword_map
+from utils.lanes import INTERACTIVE, lane_scheduler
+from utils.resume_sections import Section, split_sections
+from utils.skill_lexicon import mentions
+
+logger = logging.getLogger(__name__)
+
+INCREMENTAL_CACHE_SIZE = int(os.getenv("INCREMENTAL_CACHE_SIZE", "1024"))
+
+FULL = "full"
+INCREMENTAL = "incremental"
+
+
+@dataclass
+class DocumentVersion:
+    """Extraction results kept from a document's last analysis"""
+    job_digest: str
+    target_keywords: List[str]
+    section_keywords: Dict[str, List[str]]  # section digest -> resume keywords found in it
+    unplaced_keywords: List[str]  # full-run keywords not found verbatim in any section
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _merge_keywords(groups: List[List[str]]) -> List[str]:
+    """Union of keyword lists in order, one entry per canonical keyword"""
+    return list(canonical_keyword_map(keyword for group in groups for keyword in group).values())
+
+
+def _place_keywords(sections: List[Section], keywords: List[str]) -> Tuple[Dict[str, List[str]], List[str]]:
+    """Attribute a full run's resume keywords to the sections that mention them; returns (placed, unplaced)"""
+    section_keywords: Dict[str, List[str]] = {section.digest: [] for section in sections}
+    unplaced = []
+    for keyword in keywords:
+        homes = [section for section in sections if mentions(section.text, keyword)]
+        for section in homes:
+            section_keywords[section.digest].append(keyword)
+        if not homes:
+            unplaced.append(keyword)
+    return section_keywords, unplaced
+
+
+class IncrementalAnalysisService:
+    """
+    Re-analyze edited resumes by re-extracting only the sections that changed
+
+    The first analysis of a document (or one against a different job
+    description) runs the full workflow; its resume keywords are then
+    attributed to the sections that mention them. Later submissions with the
+    same document id reuse the keywords of unchanged sections, run keyword
+    extraction on new or edited sections only, and re-score the merged
+    keywords locally. Keywords the full run found but that can't be placed in
+    a single section (e.g. inferred from several) are carried over until the
+    next full run.
+    """
+
+    def __init__(self, cache_size: int = INCREMENTAL_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._lock = threading.Lock()
+        self._versions: "OrderedDict[str, DocumentVersion]" = OrderedDict()
+        self.full_runs = 0
+        self.incremental_runs = 0
+        self.sections_reused = 0
+        self.sections_reextracted = 0
+
+    def _load(self, document_id: str) -> Optional[DocumentVersion]:
+        with self._lock:
+            version = self._versions.get(document_id)
+            if version is not None:
+                self._versions.move_to_end(document_id)
+            return version
+
+    def _store(self, document_id: str, version: DocumentVersion):
+        with self._lock:
+            self._versions[document_id] = version
+            self._versions.move_to_end(document_id)
+            if len(self._versions) > self.cache_size:
+                self._versions.popitem(last=False)
+
+    def forget(self, document_id: str) -> bool:
+        """Drop a document's stored version so its next analysis runs in full"""
+        with self._lock:
+            return self._versions.pop(document_id, None) is not None
+
+    def reanalyze(
+        self,
+        document_id: str,
+        resume_text: str,
+        job_description: str = "",
+        deadline_seconds: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Analyze a resume, reusing the previous version's section results when possible
+
+        Args:
+            document_id: Stable id of the candidate's document
+            resume_text: Current resume text
+            job_description: Job description or requirements
+            deadline_seconds: Optional time budget (see ResumeAnalysisService.analyze_resume)
+
+        Returns:
+            Dict: final workflow state plus "document_id", "mode" ("full" or
+                  "incremental"), "sections_total" and "sections_reextracted"
+        """
+        sections = split_sections(resume_text)
+        job_digest = _digest(job_description)
+        previous = self._load(document_id)
+
+        if previous is None or previous.job_digest != job_digest:
+            return self._full_run(document_id, resume_text, job_description, deadline_seconds, sections, job_digest)
+        return self._incremental_run(document_id, resume_text, deadline_seconds, sections, previous)
+
+    def _full_run(
+        self,
+        document_id: str,
+        resume_text: str,
+        job_description: str,
+        deadline_seconds: Optional[float],
+        sections: List[Section],
+        job_digest: str
+    ) -> Dict[str, Any]:
+        logger.info("Document %s: full analysis (%d sections)", document_id, len(sections))
+        with self._lock:
+            self.full_runs += 1
+        result = resume_analysis_service.analyze_resume(resume_text, job_description, deadline_seconds=deadline_seconds)
+
+        if keywords_reusable(result):
+            section_keywords, unplaced = _place_keywords(sections, result.get("resume_keywords", []))
+            self._store(document_id, DocumentVersion(
+                job_digest, result.get("target_keywords", []), section_keywords, unplaced
+            ))
+
+        return {
+            **result,
+            "document_id": document_id,
+            "mode": FULL,
+            "sections_total": len(sections),
+            "sections_reextracted": len(sections)
+        }
+
+    def _incremental_run(
+        self,
+        document_id: str,
+        resume_text: str,
+        deadline_seconds: Optional[float],
+        sections: List[Section],
+        previous: DocumentVersion
+    ) -> Dict[str, Any]:
+        result: Dict[str, Any] = {
+            "resume_text": resume_text,
+            "document_id": document_id,
+            "mode": INCREMENTAL,
+            "sections_total": len(sections),
+            "skipped_stages": [],
+            "errors": [],
+            "degraded": False
+        }
+
+        is_valid, error = validate_text_content(resume_text, min_words=50)
+        if not is_valid:
+            result.update(is_valid=False, validation_issues=[error], errors=[error], sections_reextracted=0)
+            return result
+
+        # Imported here so loading this module doesn't pull in the agents, the OpenAI SDK and numpy
+        from agents.extraction_agent import extract_keywords
+        from utils.semantic_matcher import semantic_matcher
+
+        deadline = deadline_from_budget(deadline_seconds)
+        # Keywords scored in this run; section_keywords holds only the ones worth storing
+        run_keywords: Dict[str, List[str]] = {}
+        section_keywords: Dict[str, List[str]] = {}
+        usage: Dict[str, int] = {}
+        reextracted = 0
+        for section in sections:
+            if section.digest in run_keywords:
+                continue
+            if section.digest in previous.section_keywords:
+                run_keywords[section.digest] = section_keywords[section.digest] = previous.section_keywords[section.digest]
+                continue
+
+            reextracted += 1
+            state = extract_keywords({
+                "resume_text": section.text,
+                "job_description": "",
+                "deadline": deadline,
+                "skipped_stages": [],
+                "errors": []
+            })
+            for name, count in state.get("llm_usage", {}).get("extract_keywords", {}).items():
+                usage[name] = usage.get(name, 0) + count
+            result["node_models"] = state.get("node_models", {})
+            result["skipped_stages"] = list(dict.fromkeys(result["skipped_stages"] + state.get("skipped_stages", [])))
+            result["errors"] += state.get("errors", [])
+            result["degraded"] = result["degraded"] or state.get("degraded", False)
+            run_keywords[section.digest] = state.get("resume_keywords", [])
+            if not (state.get("errors") or state.get("degraded")):
+                # Lexicon fallback keywords are scored now but not stored, so the
+                # section is extracted again next time
+                section_keywords[section.digest] = run_keywords[section.digest]
+
+        reused = len(sections) - reextracted
+        with self._lock:
+            self.incremental_runs += 1
+            self.sections_reused += reused
+            self.sections_reextracted += reextracted
+        logger.info(
+            "Document %s: re-extracted %d of %d sections",
+            document_id, reextracted, len(sections)
+        )
+
+        resume_keywords = _merge_keywords(
+            [run_keywords.get(section.digest, []) for section in sections] + [previous.unplaced_keywords]
+        )
+        scores = semantic_matcher.local_score(resume_keywords, previous.target_keywords)
+        self._store(document_id, DocumentVersion(
+            previous.job_digest, previous.target_keywords, section_keywords, previous.unplaced_keywords
+        ))
+
+        result.update(
+            is_valid=True,
+            validation_issues=[],
+            resume_keywords=resume_keywords,
+            target_keywords=previous.target_keywords,
+            matched_keywords=scores["matched_keywords"],
+            missing_keywords=scores["missing_keywords"],
+            match_score=scores["match_score"],
+            recommendations=[],
+            confidence_notes=(
+                f"Re-scored locally by keyword matching after re-extracting "
+                f"{reextracted} of {len(sections)} sections"
+            ),
+            final_summary="",
+            llm_usage={"extract_keywords": usage} if usage else {},
+            sections_reextracted=reextracted
+        )
+        return result
+
+    async def reanalyze_async(
+        self,
+        document_id: str,
+        resume_text: str,
+        job_description: str = "",
+        deadline_seconds: Optional[float] = None,
+        lane: str = INTERACTIVE
+    ) -> Dict[str, Any]:
+        """Run reanalyze in a worker thread once a slot in the lane is free"""
+        async with lane_scheduler.slot(lane) as waited:
+            return await asyncio.to_thread(
+                self.reanalyze, document_id, resume_text, job_description,
+                budget_after_wait(deadline_seconds, waited)
+            )
+
+    def format_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Shape a re-analysis result like ReanalysisResponse"""
+        return {
+            **resume_analysis_service.format_result(result),
+            "document_id": result["document_id"],
+            "mode": result["mode"],
+            "sections_total": result["sections_total"],
+            "sections_reextracted": result["sections_reextracted"]
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "documents": len(self._versions),
+                "full_runs": self.full_runs,
+                "incremental_runs": self.incremental_runs,
+                "sections_reused": self.sections_reused,
+                "sections_reextracted": self.sections_reextracted
+            }
+
+
+# Create singleton instance
+incremental_analysis_service = IncrementalAnalysisService()
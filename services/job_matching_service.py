@@ -0,0 +1,331 @@
+"""
+Job Catalog and Reverse Matching Service Layer
+"""
+import asyncio
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+from services.resume_service import resume_analysis_service
+from utils.admission import AdmissionRejected, admission_controller
+from utils.deadline import budget_after_wait, deadline_from_budget
+from utils.keywords import canonicalize_keyword
+from utils.lanes import INTERACTIVE, lane_scheduler
+
+logger = logging.getLogger(__name__)
+
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", "data/jobs.json")
+# Full LLM analyses a single /match-jobs request may ask for
+MATCH_JOBS_MAX_ANALYZE = int(os.getenv("MATCH_JOBS_MAX_ANALYZE", "5"))
+
+
+class JobNotFoundError(LookupError):
+    """Raised when a job id is not in the catalog"""
+
+
+class KeywordExtractionError(RuntimeError):
+    """Raised when keywords could not be extracted with the LLM"""
+
+
+@dataclass
+class StoredJob:
+    """A catalog job with its target keywords extracted once"""
+    job_id: str
+    title: str
+    job_description: str
+    target_keywords: List[str]
+    keyword_weights: Optional[Dict[str, float]]
+    updated_at: float
+
+
+def _extract(resume_text: str, job_description: str, deadline_seconds: Optional[float]) -> Dict[str, Any]:
+    """Run the extraction node on its own; returns its final state"""
+    # Imported here so loading this module doesn't pull in the agents and the OpenAI SDK
+    from agents.extraction_agent import extract_keywords
+
+    return extract_keywords({
+        "resume_text": resume_text,
+        "job_description": job_description,
+        "deadline": deadline_from_budget(deadline_seconds),
+        "skipped_stages": [],
+        "errors": []
+    })
+
+
+class JobMatchingService:
+    """
+    Catalog of job descriptions, and ranking of all of them against one resume
+
+    Each job's target keywords are extracted once when it is stored (or
+    supplied by the caller) and persisted to a JSON file. Matching extracts
+    the resume's keywords once and scores them against every job with one
+    sparse matrix product (see utils/skill_matrix.py); the job matrix is
+    built once per catalog change. The full LLM analysis can optionally be
+    run for the best few roles.
+    """
+
+    def __init__(self, store_path: str = JOB_STORE_PATH):
+        self.store_path = store_path
+        self._lock = threading.Lock()
+        self._jobs: Optional[Dict[str, StoredJob]] = None
+        self._matrix = None  # (job ids, JobMatrix) for the current catalog
+        self.matches = 0
+        self.analyses = 0
+
+    def _catalog(self) -> Dict[str, StoredJob]:
+        """Jobs by id, loaded from the store file on first use (call with the lock held)"""
+        if self._jobs is None:
+            self._jobs = {}
+            try:
+                with open(self.store_path, encoding="utf-8") as f:
+                    for item in json.load(f):
+                        job = StoredJob(**item)
+                        self._jobs[job.job_id] = job
+                logger.info("Loaded %d jobs from %s", len(self._jobs), self.store_path)
+            except FileNotFoundError:
+                pass
+        return self._jobs
+
+    def _save(self):
+        """Persist the catalog (call with the lock held)"""
+        directory = os.path.dirname(self.store_path) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump([asdict(job) for job in self._jobs.values()], f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.store_path)
+
+    def put_job(
+        self,
+        job_id: str,
+        job_description: str,
+        title: str = "",
+        target_keywords: Optional[List[str]] = None,
+        keyword_weights: Optional[Dict[str, float]] = None
+    ) -> StoredJob:
+        """
+        Add or replace a job in the catalog
+
+        Args:
+            job_id: Caller-chosen job id
+            job_description: Job description or requirements
+            title: Role title
+            target_keywords: Pre-extracted target keywords; extracted with the LLM if None
+            keyword_weights: Optional weight per target keyword
+
+        Returns:
+            StoredJob: The stored job
+
+        Raises:
+            KeywordExtractionError: If target keywords had to be extracted and the LLM failed
+        """
+        if target_keywords is None:
+            state = _extract("", job_description, None)
+            if state.get("errors") or state.get("degraded") or not state.get("target_keywords"):
+                reason = "; ".join(state.get("errors", [])) or state.get("extraction_notes") or "no keywords found"
+                raise KeywordExtractionError(f"Could not extract target keywords for job {job_id}: {reason}")
+            target_keywords = state["target_keywords"]
+
+        job = StoredJob(job_id, title, job_description, list(target_keywords), keyword_weights, time.time())
+        with self._lock:
+            self._catalog()[job_id] = job
+            self._matrix = None
+            self._save()
+        logger.info("Stored job %s with %d target keywords", job_id, len(job.target_keywords))
+        return job
+
+    async def put_job_async(self, job_id: str, job_description: str, **kwargs) -> StoredJob:
+        """Run put_job in a worker thread (it may call the LLM)"""
+        return await asyncio.to_thread(self.put_job, job_id, job_description, **kwargs)
+
+    def get_job(self, job_id: str) -> StoredJob:
+        """
+        Raises:
+            JobNotFoundError: If the job is not in the catalog
+        """
+        with self._lock:
+            job = self._catalog().get(job_id)
+        if job is None:
+            raise JobNotFoundError(f"Unknown job: {job_id}")
+        return job
+
+    def list_jobs(self) -> List[StoredJob]:
+        with self._lock:
+            return list(self._catalog().values())
+
+    def delete_job(self, job_id: str) -> bool:
+        """Remove a job; returns False if it wasn't in the catalog"""
+        with self._lock:
+            if self._catalog().pop(job_id, None) is None:
+                return False
+            self._matrix = None
+            self._save()
+        return True
+
+    def _job_matrix(self):
+        """Jobs encoded for scoring, rebuilt only after the catalog changes"""
+        # Imported lazily: numpy/scipy are only needed for bulk scoring
+        from utils.skill_matrix import build_job_matrix
+
+        with self._lock:
+            if self._matrix is None:
+                jobs = list(self._catalog().values())
+                self._matrix = (
+                    [job.job_id for job in jobs],
+                    build_job_matrix([job.target_keywords for job in jobs], [job.keyword_weights for job in jobs])
+                )
+                logger.debug("Built job matrix for %d jobs", len(jobs))
+            return self._matrix
+
+    def rank_jobs(self, resume_keywords: List[str], top_n: int = 10, min_score: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Rank every stored job for one resume's keywords (no LLM calls)
+
+        Args:
+            resume_keywords: Keywords extracted from the resume
+            top_n: Number of roles to return
+            min_score: Leave out roles scoring below this
+
+        Returns:
+            List of dicts with job_id, title, match_score, counts and matched/missing
+            keywords, best first (ties keep catalog order)
+        """
+        import numpy as np
+        from utils.skill_matrix import score_jobs
+
+        job_ids, job_matrix = self._job_matrix()
+        if not job_ids:
+            return []
+        scores, matched_counts = score_jobs(job_matrix, resume_keywords)
+
+        resume_skills = {canonicalize_keyword(keyword) for keyword in resume_keywords}
+        ranked = []
+        for row in np.argsort(-scores, kind="stable")[:top_n]:
+            if scores[row] < min_score:
+                break
+            try:
+                job = self.get_job(job_ids[row])
+            except JobNotFoundError:
+                continue  # deleted since the matrix was built
+            matched = [k for k in job.target_keywords if canonicalize_keyword(k) in resume_skills]
+            missing = [k for k in job.target_keywords if canonicalize_keyword(k) not in resume_skills]
+            ranked.append({
+                "job_id": job.job_id,
+                "title": job.title,
+                "match_score": float(scores[row]),
+                "matched_count": int(matched_counts[row]),
+                "missing_count": int(job_matrix.target_counts[row] - matched_counts[row]),
+                "matched_keywords": matched,
+                "missing_keywords": missing,
+            })
+        return ranked
+
+    async def match_jobs(
+        self,
+        resume_text: Optional[str] = None,
+        resume_keywords: Optional[List[str]] = None,
+        top_n: int = 10,
+        min_score: float = 0.0,
+        analyze_top: int = 0,
+        deadline_seconds: Optional[float] = None,
+        lane: str = INTERACTIVE
+    ) -> Dict[str, Any]:
+        """
+        Rank the catalog for one resume, extracting its keywords once
+
+        Args:
+            resume_text: Resume text (needed unless resume_keywords is given, and for analyze_top)
+            resume_keywords: Pre-extracted resume keywords; skips extraction
+            top_n: Number of roles to return
+            min_score: Leave out roles scoring below this
+            analyze_top: Run the full workflow for this many of the best roles; the
+                         first runs on the caller's admission slot, each further
+                         one takes its own
+            deadline_seconds: Time budget for the whole request (extraction and analyses)
+            lane: Priority lane for the LLM work
+
+        Returns:
+            Dict shaped like MatchJobsResponse
+
+        Raises:
+            ValueError: If the input can't support the request
+            KeywordExtractionError: If the resume's keywords could not be extracted
+        """
+        if resume_keywords is None and not resume_text:
+            raise ValueError("Provide resume_text or resume_keywords")
+        if analyze_top and not resume_text:
+            raise ValueError("analyze_top needs resume_text")
+        if analyze_top > MATCH_JOBS_MAX_ANALYZE:
+            raise ValueError(f"analyze_top may be at most {MATCH_JOBS_MAX_ANALYZE}")
+
+        started = time.monotonic()
+        degraded = False
+        errors: List[str] = []
+        if resume_keywords is None:
+            async with lane_scheduler.slot(lane):
+                state = await asyncio.to_thread(
+                    _extract, resume_text, "", budget_after_wait(deadline_seconds, time.monotonic() - started)
+                )
+            if state.get("errors"):
+                raise KeywordExtractionError("; ".join(state["errors"]))
+            resume_keywords = state.get("resume_keywords", [])
+            degraded = state.get("degraded", False)
+
+        matches = await asyncio.to_thread(self.rank_jobs, resume_keywords, top_n, min_score)
+        with self._lock:
+            self.matches += 1
+            jobs_considered = len(self._catalog())
+
+        if analyze_top:
+            async def run_analysis(job: StoredJob) -> Dict[str, Any]:
+                # Whatever the extraction and queueing used comes out of the same budget
+                return await resume_analysis_service.analyze_resume_async(
+                    resume_text, job.job_description,
+                    deadline_seconds=budget_after_wait(deadline_seconds, time.monotonic() - started), lane=lane
+                )
+
+            async def analyze(position: int, match: Dict[str, Any]):
+                try:
+                    job = self.get_job(match["job_id"])
+                    if position == 0:
+                        result = await run_analysis(job)
+                    else:
+                        async with admission_controller.slot():
+                            result = await run_analysis(job)
+                    match["analysis"] = resume_analysis_service.format_result(result)
+                except AdmissionRejected as e:
+                    errors.append(f"Analysis for job {match['job_id']} not run: {str(e)}")
+                except Exception as e:
+                    logger.error("Full analysis for job %s failed: %s", match["job_id"], e)
+                    errors.append(f"Analysis for job {match['job_id']} failed: {str(e)}")
+
+            best = matches[:analyze_top]
+            await asyncio.gather(*(analyze(position, match) for position, match in enumerate(best)))
+            with self._lock:
+                self.analyses += len(best)
+
+        return {
+            "success": True,
+            "resume_keywords": resume_keywords,
+            "jobs_considered": jobs_considered,
+            "matches": matches,
+            "degraded": degraded,
+            "errors": errors or None
+        }
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "jobs": len(self._catalog()),
+                "matches": self.matches,
+                "full_analyses": self.analyses
+            }
+
+
+# Create singleton instance
+job_matching_service = JobMatchingService()
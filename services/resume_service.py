@@ -1,26 +1,178 @@
 """
 Resume Analysis Service Layer
 """
+import asyncio
 import logging
+import os
+import threading
+import time
+import uuid
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, AsyncIterator, BinaryIO, List, Optional
 
-from graphs.workflow import resume_analyzer_graph
-from graphs.state import ResumeAnalyzerState
+from pydantic import ValidationError
+
+from graphs.checkpointer import CheckpointRetention, checkpoint_writer, find_resume_point, run_config
+from graphs.workflow import get_resume_analyzer_graph
+from graphs.state import ResumeAnalyzerState, keywords_reusable
+from models.resume_analyzer import ResumeAnalysisResponse, StreamRecord
+from services.document_service import document_parsing_service
+from utils.admission import AdmissionRejected, admission_controller
+from utils.archive_reader import ArchiveMember, iter_archive_members
+from utils.circuit_breaker import circuit_breakers
+from utils.concurrency import iterate_in_thread, run_bounded
+from utils.deadline import budget_after_wait, deadline_from_budget
+from utils.extraction_packer import extraction_packer
+from utils.file_parser import supported_extensions
+from utils.lanes import BULK, INTERACTIVE, lane_scheduler
+from utils.llm_cassette import llm_cassette
+from utils.model_router import model_router
+from utils.ndjson_reader import NDJSONLine, iter_ndjson
+from utils.keywords import canonical_keyword_map, canonicalize_keyword, score_keywords
+from utils.readiness import readiness
+from utils.run_keyword_cache import RunKeywordCache
+from utils.single_flight import SingleFlight, make_flight_key
 
 logger = logging.getLogger(__name__)
 
+ARCHIVE_CONCURRENCY = int(os.getenv("ARCHIVE_CONCURRENCY", "4"))
+MAX_ARCHIVE_BYTES = int(os.getenv("MAX_ARCHIVE_BYTES", str(200 * 1024 * 1024)))
+STREAM_CONCURRENCY = int(os.getenv("STREAM_CONCURRENCY", "4"))
+MAX_STREAM_LINE_BYTES = int(os.getenv("MAX_STREAM_LINE_BYTES", str(1024 * 1024)))
+
+# Fields selectable with ?fields=; counts are derived from the keyword lists
+COUNT_FIELDS = ("matched_count", "missing_count")
+RESPONSE_FIELDS = tuple(ResumeAnalysisResponse.model_fields) + COUNT_FIELDS
+COMPACT_FIELDS = ("success", "match_score", "matched_count", "missing_count")
+
+
+def parse_response_fields(fields: Optional[str], compact: bool = False) -> Optional[List[str]]:
+    """
+    Resolve a comma-separated ?fields= value (or compact mode) to a field list
+    
+    Args:
+        fields: Comma-separated field names, or None for the full response
+        compact: Return only score and counts
+        
+    Returns:
+        List of field names, or None for the full response
+        
+    Raises:
+        ValueError: If an unknown field is requested
+    """
+    if compact:
+        return list(COMPACT_FIELDS)
+    if not fields:
+        return None
+    
+    requested = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in RESPONSE_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)} (allowed: {', '.join(RESPONSE_FIELDS)})")
+    return requested
+
+
+class RunNotFoundError(LookupError):
+    """Raised when resuming a run id that has no checkpoints"""
+
+
+class RunConflictError(ValueError):
+    """Raised when a run id is reused for a different resume or job description"""
+
+
 class ResumeAnalysisService:
     """Service for handling resume analysis operations"""
     
     def __init__(self):
-        self.graph = resume_analyzer_graph
+        self.single_flight = SingleFlight()
+        self.run_keywords = RunKeywordCache()
+        self._unchecked_graph = None
+        self._retention: Optional[CheckpointRetention] = None
+        self._retention_lock = threading.Lock()
+    
+    @property
+    def graph(self):
+        """Compiled workflow graph (built on first use)"""
+        return get_resume_analyzer_graph()
+    
+    def warm_up(self):
+        """
+        Build the workflow graph, open the LLM client and prepare caches
+        
+        Each step is recorded in the readiness registry so /ready can report
+        warm state. Intended to run in a background thread at startup.
+        """
+        start_time = time.perf_counter()
+        try:
+            get_resume_analyzer_graph()
+            readiness.mark_ready("graph", seconds=round(time.perf_counter() - start_time, 3))
+        except Exception as e:
+            logger.error("Workflow graph warm-up failed: %s", e, exc_info=True)
+            readiness.mark_failed("graph", str(e))
+        
+        step_time = time.perf_counter()
+        try:
+            from utils.llm_helper import get_llm
+            get_llm()
+            readiness.mark_ready("llm_client", seconds=round(time.perf_counter() - step_time, 3))
+        except Exception as e:
+            logger.error("LLM client warm-up failed: %s", e, exc_info=True)
+            readiness.mark_failed("llm_client", str(e))
+        
+        readiness.mark_ready(
+            "caches",
+            parse_cache_entries=len(document_parsing_service._cache),
+            parse_cache_size=document_parsing_service.cache_size
+        )
+        
+        logger.info("Warm-up finished in %.3fs", time.perf_counter() - start_time)
+    
+    def _flight_key(self, resume_text: str, job_description: str, mode: str = "full") -> str:
+        """Identity of an analysis for in-flight deduplication"""
+        return make_flight_key(resume_text, job_description, mode, model_router.config_signature())
+    
+    @property
+    def checkpointing(self) -> bool:
+        """Whether runs are checkpointed and can be resumed"""
+        return self.graph.checkpointer is not None
+    
+    @property
+    def unchecked_graph(self):
+        """The workflow without its checkpointer, for runs nobody can resume"""
+        if not self.checkpointing:
+            return self.graph
+        if self._unchecked_graph is None:
+            self._unchecked_graph = self.graph.copy({"checkpointer": None})
+        return self._unchecked_graph
+    
+    def _touch_run(self, run_id: str):
+        """Record checkpoint activity for a run so idle runs expire (see CHECKPOINT_TTL_SECONDS)"""
+        if self._retention is None:
+            with self._retention_lock:
+                if self._retention is None:
+                    self._retention = CheckpointRetention(self.graph.checkpointer)
+        self._retention.touch(run_id)
+    
+    def _invoke(self, initial_state: ResumeAnalyzerState, checkpoint: bool = False) -> Dict[str, Any]:
+        """
+        Run the workflow
+        
+        Only runs whose id came from the caller are checkpointed: nobody
+        resumes a generated id, and saving the full state after every node
+        costs tens of KB of SQLite writes per run.
+        """
+        if not (checkpoint and self.checkpointing):
+            return self.unchecked_graph.invoke(initial_state)
+        self._touch_run(initial_state["run_id"])
+        return self.graph.invoke(initial_state, run_config(initial_state["run_id"]))
     
     def analyze_resume(
         self,
         resume_text: str,
         job_description: str = "",
-        file_path: Optional[str] = None
+        file_path: Optional[str] = None,
+        run_id: Optional[str] = None,
+        deadline_seconds: Optional[float] = None
     ) -> Dict[str, Any]:
         """
         Analyze a resume against a job description
@@ -29,46 +181,483 @@ class ResumeAnalysisService:
             resume_text: Resume content as text
             job_description: Job description or requirements
             file_path: Optional file path if analyzing from file
+            run_id: Optional run identifier; reusing the id of an earlier run
+                    resumes it instead of starting over
+            deadline_seconds: Optional time budget; stages that can't finish in
+                              time are skipped or scored locally (see skipped_stages)
             
         Returns:
             Dict containing analysis results
+            
+        Raises:
+            RunConflictError: If run_id belongs to a run with different inputs
         """
-        logger.info("=" * 80)
-        logger.info("Starting resume analysis")
-        logger.info(f"Resume text length: {len(resume_text)} characters")
-        logger.info(f"Job description length: {len(job_description)} characters")
-        if file_path:
-            logger.info(f"File path provided: {file_path}")
+        if run_id and self.checkpointing:
+            stored = self.graph.get_state(run_config(run_id)).values
+            if stored:
+                if not file_path and (stored.get("resume_text"), stored.get("job_description")) != (resume_text, job_description):
+                    raise RunConflictError(f"Run {run_id} was started with a different resume or job description")
+                return self.resume_run(run_id, deadline_seconds)
+        
+        logger.info(
+            "Starting resume analysis - resume: %d chars, job description: %d chars, file: %s",
+            len(resume_text),
+            len(job_description),
+            file_path
+        )
         
         # Create initial state
         initial_state: ResumeAnalyzerState = {
             "resume_text": resume_text,
             "job_description": job_description,
+            "run_id": run_id or uuid.uuid4().hex,
+            "deadline": deadline_from_budget(deadline_seconds),
+            "skipped_stages": [],
+            "degraded": False,
             "errors": []
         }
         
         if file_path:
             initial_state["file_path"] = file_path
         
-        logger.info("Invoking LangGraph workflow")
+        logger.debug("Invoking LangGraph workflow")
         
         try:
-            # Run the workflow
-            result = self.graph.invoke(initial_state)
+            # Run the workflow, joining an identical analysis if one is already running
+            if file_path or run_id:
+                result = self._invoke(initial_state, checkpoint=run_id is not None)
+            else:
+                # Callers share a run only if they asked for the same time budget
+                mode = f"deadline={deadline_seconds:g}" if deadline_seconds else "full"
+                key = self._flight_key(resume_text, job_description, mode)
+                result, shared = self.single_flight.do(key, self._invoke, initial_state)
+                if shared:
+                    logger.info("Joined identical in-flight analysis")
+                    result = dict(result)
             
-            logger.info("Workflow execution completed")
-            logger.info(f"Final state - is_valid: {result.get('is_valid', False)}")
-            logger.info(f"Final state - match_score: {result.get('match_score', 0.0):.2%}")
-            logger.info(f"Final state - errors: {len(result.get('errors', []))} errors")
-            logger.info("=" * 80)
+            logger.info(
+                "Workflow execution completed - is_valid: %s, match_score: %.2f, errors: %d",
+                result.get("is_valid", False),
+                result.get("match_score", 0.0),
+                len(result.get("errors", []))
+            )
             
+            self._remember_keywords(result)
             return result
             
         except Exception as e:
-            logger.error(f"Error during workflow execution: {str(e)}", exc_info=True)
-            logger.info("=" * 80)
+            logger.error("Error during workflow execution: %s", e, exc_info=True)
             raise
     
+    async def analyze_resume_async(
+        self,
+        resume_text: str,
+        job_description: str = "",
+        run_id: Optional[str] = None,
+        deadline_seconds: Optional[float] = None,
+        lane: str = INTERACTIVE
+    ) -> Dict[str, Any]:
+        """
+        Run analyze_resume in a worker thread so the event loop stays responsive
+        
+        The run waits for a slot in its priority lane first (see utils/lanes.py);
+        time spent queued counts against the deadline.
+        
+        Args:
+            resume_text: Resume content as text
+            job_description: Job description or requirements
+            run_id: Optional run identifier (see analyze_resume)
+            deadline_seconds: Optional time budget (see analyze_resume)
+            lane: Priority lane, "interactive" or "bulk"
+            
+        Returns:
+            Dict containing analysis results
+            
+        Raises:
+            ValueError: If the lane is unknown
+        """
+        async with lane_scheduler.slot(lane) as waited:
+            return await asyncio.to_thread(
+                self.analyze_resume, resume_text, job_description, None, run_id,
+                budget_after_wait(deadline_seconds, waited)
+            )
+    
+    def resume_run(self, run_id: str, deadline_seconds: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Continue a checkpointed run from its last successful node
+        
+        Outputs of nodes that already succeeded are reused from the checkpoint,
+        so only the failed (or deadline-skipped) node and the ones after it call
+        the LLM again. A run that completed without errors is returned as stored.
+        
+        Args:
+            run_id: Run identifier returned by an earlier analysis
+            deadline_seconds: Optional time budget for the resumed part
+            
+        Returns:
+            Dict containing analysis results
+            
+        Raises:
+            RunNotFoundError: If checkpointing is disabled or the run is unknown
+        """
+        if not self.checkpointing:
+            raise RunNotFoundError("Workflow checkpointing is disabled")
+        
+        snapshot = self.graph.get_state(run_config(run_id))
+        if not snapshot.values:
+            raise RunNotFoundError(f"Unknown run: {run_id}")
+        
+        resume_point = find_resume_point(self.graph, run_id)
+        if resume_point is None:
+            logger.info("Run %s already completed - returning stored result", run_id)
+            result = dict(snapshot.values)
+            self._remember_keywords(result)
+            return result
+        
+        resume_from, node = resume_point
+        logger.info("Resuming run %s from %s", run_id, node)
+        deadline = deadline_from_budget(deadline_seconds)
+        
+        writer = checkpoint_writer(resume_from)
+        if writer is None:
+            # Failed before any node finished: nothing to reuse, start over with the stored inputs
+            values = resume_from.values
+            initial_state: ResumeAnalyzerState = {
+                "resume_text": values.get("resume_text", ""),
+                "job_description": values.get("job_description", ""),
+                "run_id": run_id,
+                "deadline": deadline,
+                "skipped_stages": [],
+                "degraded": False,
+                "errors": []
+            }
+            if values.get("file_path"):
+                initial_state["file_path"] = values["file_path"]
+            result = self._invoke(initial_state, checkpoint=True)
+        else:
+            # Replace the stored (expired) deadline, then continue after the last good node
+            self._touch_run(run_id)
+            config = self.graph.update_state(resume_from.config, {"deadline": deadline}, as_node=writer)
+            result = self.graph.invoke(None, config)
+        self._remember_keywords(result)
+        return result
+    
+    def _remember_keywords(self, result: Dict[str, Any]):
+        """Cache a finished run's extracted keywords for what-if rescoring"""
+        if result.get("run_id") and keywords_reusable(result):
+            self.run_keywords.put(result["run_id"], result.get("resume_keywords", []), result.get("target_keywords", []))
+    
+    def get_run_keywords(self, run_id: str) -> tuple[List[str], List[str]]:
+        """
+        Extracted keywords of an earlier analysis, from memory or its checkpoint
+        
+        Args:
+            run_id: Run identifier returned by the analysis
+            
+        Returns:
+            tuple: (resume keywords, target keywords)
+            
+        Raises:
+            RunNotFoundError: If the run is neither cached nor checkpointed, or its
+                              keywords didn't come from a successful LLM extraction
+        """
+        keywords = self.run_keywords.get(run_id)
+        if keywords is not None:
+            return keywords
+        
+        if self.checkpointing:
+            values = self.graph.get_state(run_config(run_id)).values
+            if values and values.get("resume_keywords") is not None:
+                if not keywords_reusable(values):
+                    raise RunNotFoundError(
+                        f"Run {run_id} has no usable extracted keywords "
+                        f"(extraction failed, was skipped or fell back to the skill lexicon)"
+                    )
+                self._remember_keywords(values)
+                return values.get("resume_keywords", []), values.get("target_keywords", [])
+        raise RunNotFoundError(f"No extracted keywords for run: {run_id}")
+    
+    def what_if(
+        self,
+        run_id: Optional[str] = None,
+        resume_keywords: Optional[List[str]] = None,
+        target_keywords: Optional[List[str]] = None,
+        add_keywords: Optional[List[str]] = None,
+        remove_keywords: Optional[List[str]] = None,
+        semantic: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Rescore an analysis with resume keywords added or removed, without any LLM call
+        
+        Both the baseline and the edited keyword sets are scored locally the
+        same way, so the delta reflects only the edits (the baseline can differ
+        from the original LLM score).
+        
+        Args:
+            run_id: Earlier analysis whose extracted keywords to start from
+            resume_keywords: Resume keywords to start from instead of (or overriding) the run's
+            target_keywords: Target keywords to use instead of (or overriding) the run's
+            add_keywords: Keywords to add to the resume
+            remove_keywords: Keywords to remove from the resume (synonyms included)
+            semantic: Also count near-synonym keywords as matches (slower, still local)
+            
+        Returns:
+            Dict with match_score, baseline_score, score_delta, matched/missing
+            keywords, newly_matched, newly_missing and the edited resume_keywords
+            
+        Raises:
+            RunNotFoundError: If run_id has no extracted keywords
+            ValueError: If neither run_id nor target_keywords is given
+        """
+        if run_id:
+            run_resume, run_target = self.get_run_keywords(run_id)
+            resume_keywords = run_resume if resume_keywords is None else resume_keywords
+            target_keywords = run_target if target_keywords is None else target_keywords
+        elif target_keywords is None:
+            raise ValueError("Provide run_id or target_keywords")
+        resume_keywords = resume_keywords or []
+        
+        removed = {canonicalize_keyword(keyword) for keyword in remove_keywords or []}
+        edited = [keyword for keyword in resume_keywords if canonicalize_keyword(keyword) not in removed]
+        edited += [keyword for keyword in add_keywords or [] if canonicalize_keyword(keyword) not in removed]
+        
+        if semantic:
+            # Imported lazily: numpy/scipy are only needed for semantic matching
+            from utils.semantic_matcher import semantic_matcher
+            score = semantic_matcher.score
+        else:
+            score = score_keywords
+        baseline = score(resume_keywords, target_keywords)
+        scores = score(edited, target_keywords)
+        
+        was_matched = set(baseline["matched_keywords"])
+        now_matched = set(scores["matched_keywords"])
+        return {
+            "success": True,
+            "run_id": run_id,
+            "match_score": scores["match_score"],
+            "baseline_score": baseline["match_score"],
+            "score_delta": round(scores["match_score"] - baseline["match_score"], 2),
+            "matched_keywords": scores["matched_keywords"],
+            "missing_keywords": scores["missing_keywords"],
+            "newly_matched": [keyword for keyword in scores["matched_keywords"] if keyword not in was_matched],
+            "newly_missing": [keyword for keyword in baseline["matched_keywords"] if keyword not in now_matched],
+            "resume_keywords": list(canonical_keyword_map(edited).values())
+        }
+    
+    async def resume_run_async(
+        self,
+        run_id: str,
+        deadline_seconds: Optional[float] = None,
+        lane: str = INTERACTIVE
+    ) -> Dict[str, Any]:
+        """Run resume_run in a worker thread once a slot in the lane is free"""
+        async with lane_scheduler.slot(lane) as waited:
+            return await asyncio.to_thread(self.resume_run, run_id, budget_after_wait(deadline_seconds, waited))
+    
+    def format_result(self, result: Dict[str, Any], fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Shape a workflow result like ResumeAnalysisResponse
+        
+        Args:
+            result: Final workflow state
+            fields: Optional projection (see parse_response_fields)
+            
+        Returns:
+            Dict with the ResumeAnalysisResponse fields, or only the requested ones
+        """
+        response = self._build_response(result)
+        if fields is None:
+            return response
+        
+        response["matched_count"] = len(response["matched_keywords"])
+        response["missing_count"] = len(response["missing_keywords"])
+        return {name: response[name] for name in fields}
+    
+    def _build_response(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Map final workflow state to the full response fields"""
+        if not result.get("is_valid", False):
+            return {
+                "success": False,
+                "match_score": 0.0,
+                "matched_keywords": [],
+                "missing_keywords": [],
+                "resume_keywords": [],
+                "target_keywords": [],
+                "recommendations": [],
+                "confidence_notes": "",
+                "final_summary": "",
+                "validation_issues": result.get("validation_issues", []),
+                "errors": result.get("errors", []),
+                "node_models": result.get("node_models", {}),
+                "llm_usage": result.get("llm_usage", {}),
+                "run_id": result.get("run_id"),
+                "skipped_stages": result.get("skipped_stages", []),
+                "degraded": result.get("degraded", False)
+            }
+        
+        return {
+            "success": True,
+            "match_score": float(result.get("match_score", 0.0)),
+            "matched_keywords": result.get("matched_keywords", []),
+            "missing_keywords": result.get("missing_keywords", []),
+            "resume_keywords": result.get("resume_keywords", []),
+            "target_keywords": result.get("target_keywords", []),
+            "recommendations": result.get("recommendations", []),
+            "confidence_notes": result.get("confidence_notes", ""),
+            "final_summary": result.get("final_summary", ""),
+            "validation_issues": result.get("validation_issues", []),
+            "errors": result.get("errors", []),
+            "node_models": result.get("node_models", {}),
+            "llm_usage": result.get("llm_usage", {}),
+            "run_id": result.get("run_id"),
+            "skipped_stages": result.get("skipped_stages", []),
+            "degraded": result.get("degraded", False)
+        }
+    
+    async def analyze_archive(
+        self,
+        fileobj: BinaryIO,
+        filename: str,
+        job_description: str = "",
+        concurrency: int = ARCHIVE_CONCURRENCY,
+        fields: Optional[List[str]] = None,
+        lane: str = BULK
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze every resume in a ZIP or tar archive, yielding results as they finish
+        
+        Members are extracted one at a time and analyzed with bounded concurrency,
+        each holding an admission slot while its workflow runs. A failing (or
+        rejected) member produces an error result instead of aborting the batch.
+        
+        Args:
+            fileobj: Binary file object for the archive
+            filename: Archive file name
+            job_description: Job description applied to every resume
+            concurrency: Maximum number of concurrent analyses
+            fields: Optional projection applied to each result
+            lane: Priority lane for the member analyses (bulk by default)
+            
+        Yields:
+            Dict per member with "filename" plus the formatted result or "error",
+            followed by a final {"summary": {...}} record
+        """
+        logger.info("Analyzing archive %s with concurrency=%d", filename, concurrency)
+        
+        members = iter_archive_members(
+            fileobj,
+            filename,
+            extensions=supported_extensions(),
+            max_member_bytes=document_parsing_service.max_upload_bytes
+        )
+        
+        async def analyze_member(member: ArchiveMember) -> Dict[str, Any]:
+            if member.error:
+                return {"filename": member.name, "success": False, "error": member.error}
+            try:
+                resume_text = await document_parsing_service.parse(member.name, member.data)
+                async with admission_controller.slot():
+                    result = await self.analyze_resume_async(resume_text, job_description, lane=lane)
+                return {"filename": member.name, **self.format_result(result, fields)}
+            except AdmissionRejected as e:
+                return {"filename": member.name, "success": False, "error": str(e), "retry_after": e.retry_after}
+            except Exception as e:
+                logger.error("Archive member %s failed: %s", member.name, e)
+                return {"filename": member.name, "success": False, "error": str(e)}
+        
+        total = succeeded = 0
+        try:
+            async for record in run_bounded(iterate_in_thread(members), analyze_member, concurrency):
+                total += 1
+                succeeded += 1 if record.get("success") else 0
+                yield record
+        except ValueError as e:
+            # Archive-level corruption: report it and stop reading
+            logger.error("Archive %s could not be read: %s", filename, e)
+            yield {"filename": filename, "success": False, "error": str(e)}
+        
+        logger.info("Archive %s complete: %d/%d succeeded", filename, succeeded, total)
+        yield {"summary": {"total": total, "succeeded": succeeded, "failed": total - succeeded}}
+    
+    async def analyze_stream(
+        self,
+        chunks: AsyncIterator[bytes],
+        concurrency: int = STREAM_CONCURRENCY,
+        fields: Optional[List[str]] = None,
+        lane: str = BULK
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Analyze {id, resume_text, job_description} records from an NDJSON byte stream
+        
+        Each record starts as soon as its line is parsed and a slot is free, and
+        results are yielded in completion order. The next line is read only when
+        a slot frees up, so memory stays bounded by the concurrency limit and the
+        maximum line size however long the stream is. Each record holds an
+        admission slot while its workflow runs. A bad (or rejected) line
+        produces an error result instead of aborting the stream.
+        
+        Args:
+            chunks: Request body chunks in arrival order
+            concurrency: Maximum number of concurrent analyses
+            fields: Optional projection applied to each result
+            lane: Priority lane for the analyses (bulk by default)
+            
+        Yields:
+            Dict per record with "id" plus the formatted result or "error" (bad
+            lines carry "line" instead of "id"), followed by a final
+            {"summary": {...}} record
+        """
+        logger.info("Analyzing NDJSON stream with concurrency=%d", concurrency)
+        
+        async def analyze_line(line: NDJSONLine) -> Dict[str, Any]:
+            if line.error:
+                return {"line": line.line_number, "success": False, "error": line.error}
+            try:
+                record = StreamRecord.model_validate(line.value)
+            except ValidationError as e:
+                problems = "; ".join(
+                    f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}" for error in e.errors()
+                )
+                record_id = line.value.get("id") if isinstance(line.value, dict) else None
+                return {"id": record_id, "line": line.line_number, "success": False, "error": f"Invalid record: {problems}"}
+            try:
+                async with admission_controller.slot():
+                    result = await self.analyze_resume_async(record.resume_text, record.job_description, lane=lane)
+                return {"id": record.id, **self.format_result(result, fields)}
+            except AdmissionRejected as e:
+                return {"id": record.id, "success": False, "error": str(e), "retry_after": e.retry_after}
+            except Exception as e:
+                logger.error("Stream record %s failed: %s", record.id, e)
+                return {"id": record.id, "success": False, "error": str(e)}
+        
+        total = succeeded = 0
+        async for record in run_bounded(iter_ndjson(chunks, MAX_STREAM_LINE_BYTES), analyze_line, concurrency):
+            total += 1
+            succeeded += 1 if record.get("success") else 0
+            yield record
+        
+        logger.info("NDJSON stream complete: %d/%d succeeded", succeeded, total)
+        yield {"summary": {"total": total, "succeeded": succeeded, "failed": total - succeeded}}
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Collect runtime counters for the analysis pipeline
+        
+        Returns:
+            Dict of counters grouped by component
+        """
+        return {
+            "single_flight": self.single_flight.stats(),
+            "model_router": model_router.stats(),
+            "circuit_breakers": circuit_breakers.stats(),
+            "admission": admission_controller.stats(),
+            "lanes": lane_scheduler.stats(),
+            "extraction_packing": extraction_packer.stats(),
+            "llm_cassette": llm_cassette.stats(),
+            "run_keywords": self.run_keywords.stats()
+        }
+    
     def get_analysis_summary(self, result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Extract key summary information from analysis result
@@ -89,8 +678,78 @@ class ResumeAnalysisService:
             "has_errors": len(result.get("errors", [])) > 0
         }
         
-        logger.debug(f"Summary: {summary}")
+        logger.debug("Summary: %s", summary)
         return summary
+    
+    def score_batch(
+        self,
+        resumes: List[Dict[str, Any]],
+        target_keywords: List[str],
+        keyword_weights: Optional[Dict[str, float]] = None,
+        include_keywords: bool = False,
+        semantic: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Score many already-extracted resumes against one job without LLM calls
+        
+        Args:
+            resumes: Items with "id" and "resume_keywords"
+            target_keywords: Keywords extracted from the job description
+            keyword_weights: Optional weight per target keyword (default 1.0)
+            include_keywords: Whether to list matched/missing keywords per resume
+            semantic: Also count near-synonym keywords as matches (see utils/semantic_matcher.py)
+            
+        Returns:
+            Dict with per-resume results and per-skill coverage
+        """
+        # Imported lazily: numpy/scipy are only needed for bulk scoring
+        from utils.semantic_matcher import semantic_matcher
+        from utils.skill_matrix import score_resumes
+        
+        logger.info("Batch scoring %d resumes against %d target keywords", len(resumes), len(target_keywords))
+        
+        keyword_lists = [item.get("resume_keywords", []) for item in resumes]
+        if semantic:
+            # Fuzzily matched targets are added to each resume's keywords before exact scoring
+            keyword_lists = semantic_matcher.expand(keyword_lists, target_keywords)
+        
+        scores = score_resumes(keyword_lists, target_keywords, keyword_weights)
+        
+        results = []
+        for row, item in enumerate(resumes):
+            entry = {
+                "id": item.get("id", str(row)),
+                "match_score": float(scores.match_scores[row]),
+                "matched_count": int(scores.matched_counts[row]),
+                "missing_count": int(scores.missing_counts[row]),
+            }
+            if include_keywords:
+                matched_columns = set(scores.target_matrix.indices[
+                    scores.target_matrix.indptr[row]:scores.target_matrix.indptr[row + 1]
+                ])
+                entry["matched_keywords"] = [
+                    keyword for column, keyword in enumerate(scores.target_keywords)
+                    if column in matched_columns
+                ]
+                entry["missing_keywords"] = [
+                    keyword for column, keyword in enumerate(scores.target_keywords)
+                    if column not in matched_columns
+                ]
+            results.append(entry)
+        
+        return {
+            "resume_count": len(resumes),
+            "target_count": len(scores.target_keywords),
+            "results": results,
+            "skill_coverage": {
+                keyword: round(float(coverage), 4)
+                for keyword, coverage in zip(scores.target_keywords, scores.skill_coverage)
+            },
+        }
+    
+    async def score_batch_async(self, **kwargs) -> Dict[str, Any]:
+        """Run score_batch in a worker thread so the SciPy work doesn't block the event loop"""
+        return await asyncio.to_thread(self.score_batch, **kwargs)
 
 
 # Create singleton instance
@@ -0,0 +1,152 @@
+"""
+Admission control: cap in-flight workflows and shed load once the wait queue is full
+"""
+import asyncio
+import logging
+import math
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+ADMISSION_MAX_IN_FLIGHT = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "8"))  # 0 disables admission control
+ADMISSION_MAX_QUEUE = int(os.getenv("ADMISSION_MAX_QUEUE", "16"))
+ADMISSION_MAX_QUEUE_SECONDS = float(os.getenv("ADMISSION_MAX_QUEUE_SECONDS", "10"))
+# Weight of the newest sample in the moving average of workflow duration
+SERVICE_TIME_SMOOTHING = 0.2
+
+
+class AdmissionRejected(Exception):
+    """Raised when a request can't be admitted; retry_after is a whole number of seconds"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class AdmissionController:
+    """
+    Admit at most `max_in_flight` workflows; queue up to `max_queue` more (FIFO)
+
+    A request that finds the queue full, or waits longer than
+    `max_queue_seconds`, is rejected with a Retry-After estimate instead of
+    slowing every accepted request down. Must be used from one event loop.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = ADMISSION_MAX_IN_FLIGHT,
+        max_queue: int = ADMISSION_MAX_QUEUE,
+        max_queue_seconds: float = ADMISSION_MAX_QUEUE_SECONDS
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queue = max_queue
+        self.max_queue_seconds = max_queue_seconds
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._in_flight = 0
+        self._avg_service_seconds: Optional[float] = None
+        self.admitted = 0
+        self.rejected_full = 0
+        self.rejected_timeout = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_in_flight > 0
+
+    def retry_after(self) -> int:
+        """Seconds until a new request would likely get a slot"""
+        per_slot = self._avg_service_seconds or self.max_queue_seconds
+        return max(1, math.ceil(per_slot * (len(self._waiters) + 1) / max(1, self.max_in_flight)))
+
+    async def acquire(self):
+        """
+        Take a workflow slot, waiting in the queue if all slots are busy
+
+        Raises:
+            AdmissionRejected: If the queue is full or the wait exceeds max_queue_seconds
+        """
+        if not self.enabled:
+            return
+        if self._in_flight < self.max_in_flight and not self._waiters:
+            self._in_flight += 1
+            self.admitted += 1
+            return
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_full += 1
+            raise AdmissionRejected("Server is at capacity; retry later", self.retry_after())
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter), timeout=self.max_queue_seconds)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if waiter.done() and not waiter.cancelled():
+                # release() handed us a slot just as we gave up; pass it on
+                self.release()
+            else:
+                waiter.cancel()
+                self._waiters.remove(waiter)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            self.rejected_timeout += 1
+            raise AdmissionRejected(
+                f"Request waited {self.max_queue_seconds:g}s without a free slot; retry later", self.retry_after()
+            ) from e
+        self.admitted += 1
+
+    def release(self, service_seconds: Optional[float] = None):
+        """
+        Give a slot back, handing it straight to the oldest waiter if any
+
+        Args:
+            service_seconds: How long the workflow held the slot (feeds Retry-After)
+        """
+        if not self.enabled:
+            return
+        if service_seconds is not None:
+            if self._avg_service_seconds is None:
+                self._avg_service_seconds = service_seconds
+            else:
+                self._avg_service_seconds += SERVICE_TIME_SMOOTHING * (service_seconds - self._avg_service_seconds)
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)  # the slot moves to the waiter; in_flight is unchanged
+                return
+        self._in_flight -= 1
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a workflow slot for the duration of the block
+
+        Raises:
+            AdmissionRejected: If no slot could be had (see acquire)
+        """
+        await self.acquire()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.release(time.perf_counter() - start_time)
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            "enabled": self.enabled,
+            "in_flight": self._in_flight,
+            "queue_depth": len(self._waiters),
+            "max_in_flight": self.max_in_flight,
+            "max_queue": self.max_queue,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_full,
+            "rejected_queue_timeout": self.rejected_timeout,
+            "avg_service_seconds": round(self._avg_service_seconds, 3) if self._avg_service_seconds is not None else None,
+        }
+
+
+admission_controller = AdmissionController()
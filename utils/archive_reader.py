@@ -0,0 +1,124 @@
+"""
+Utility functions for reading resume archives one member at a time
+"""
+import tarfile
+import zipfile
+from dataclasses import dataclass
+from pathlib import PurePosixPath
+from typing import BinaryIO, Iterable, Iterator, Optional
+
+ZIP_EXTENSIONS = ('.zip',)
+TAR_EXTENSIONS = ('.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+@dataclass
+class ArchiveMember:
+    """A single archive entry, either with its content or the reason it was skipped"""
+    name: str
+    data: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+def is_supported_archive(filename: str) -> bool:
+    """Check whether a file name looks like a ZIP or tar archive"""
+    lower = (filename or "").lower()
+    return lower.endswith(ZIP_EXTENSIONS + TAR_EXTENSIONS)
+
+
+def _is_ignored(name: str) -> bool:
+    """Skip OS metadata entries such as __MACOSX/ and dotfiles"""
+    path = PurePosixPath(name)
+    return any(part.startswith(('.', '__MACOSX')) for part in path.parts)
+
+
+def _check_member(name: str, size: int, extensions: Iterable[str], max_member_bytes: int) -> Optional[str]:
+    """Return a skip reason for a member, or None if it should be read"""
+    if PurePosixPath(name).suffix.lower() not in extensions:
+        return "Unsupported file type"
+    if size > max_member_bytes:
+        return f"File exceeds maximum size of {max_member_bytes} bytes"
+    return None
+
+
+def _read_limited(stream: BinaryIO, max_member_bytes: int) -> Optional[bytes]:
+    """Read at most max_member_bytes, returning None if the stream is longer"""
+    data = stream.read(max_member_bytes + 1)
+    return None if len(data) > max_member_bytes else data
+
+
+def iter_archive_members(
+    fileobj: BinaryIO,
+    filename: str,
+    extensions: Iterable[str],
+    max_member_bytes: int
+) -> Iterator[ArchiveMember]:
+    """
+    Lazily yield resume files from a ZIP or tar archive
+
+    Only one member is held in memory at a time. Tar archives are read in
+    streaming mode, so compressed tarballs are never fully decompressed up front.
+
+    Args:
+        fileobj: Binary file object for the archive (must be seekable for ZIP)
+        filename: Archive file name (used to pick ZIP vs tar)
+        extensions: Member extensions to parse; other files are reported as skipped
+        max_member_bytes: Per-member size limit
+
+    Yields:
+        ArchiveMember: Member content or the reason it was skipped
+
+    Raises:
+        ValueError: If the archive is unsupported or corrupt
+    """
+    extensions = tuple(extensions)
+    lower = (filename or "").lower()
+
+    if lower.endswith(ZIP_EXTENSIONS):
+        try:
+            archive = zipfile.ZipFile(fileobj)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"Invalid ZIP archive: {str(e)}") from e
+
+        with archive:
+            for info in archive.infolist():
+                if info.is_dir() or _is_ignored(info.filename):
+                    continue
+                error = _check_member(info.filename, info.file_size, extensions, max_member_bytes)
+                if error:
+                    yield ArchiveMember(name=info.filename, error=error)
+                    continue
+                try:
+                    with archive.open(info) as member_stream:
+                        data = _read_limited(member_stream, max_member_bytes)
+                except (zipfile.BadZipFile, RuntimeError, OSError) as e:
+                    yield ArchiveMember(name=info.filename, error=f"Could not extract file: {str(e)}")
+                    continue
+                if data is None:
+                    yield ArchiveMember(name=info.filename, error=f"File exceeds maximum size of {max_member_bytes} bytes")
+                else:
+                    yield ArchiveMember(name=info.filename, data=data)
+        return
+
+    if lower.endswith(TAR_EXTENSIONS):
+        try:
+            archive = tarfile.open(fileobj=fileobj, mode="r|*")
+        except tarfile.TarError as e:
+            raise ValueError(f"Invalid tar archive: {str(e)}") from e
+
+        with archive:
+            try:
+                for info in archive:
+                    if not info.isfile() or _is_ignored(info.name):
+                        continue
+                    error = _check_member(info.name, info.size, extensions, max_member_bytes)
+                    if error:
+                        yield ArchiveMember(name=info.name, error=error)
+                        continue
+                    member_stream = archive.extractfile(info)
+                    data = _read_limited(member_stream, max_member_bytes)
+                    yield ArchiveMember(name=info.name, data=data)
+            except tarfile.TarError as e:
+                raise ValueError(f"Invalid tar archive: {str(e)}") from e
+        return
+
+    raise ValueError(f"Unsupported archive type: {filename}")
@@ -0,0 +1,180 @@
+"""
+Circuit breaker for the LLM backend: fail fast while the endpoint is unhealthy
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from typing import Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+CIRCUIT_ENABLED = os.getenv("CIRCUIT_ENABLED", "true").lower() in ("1", "true", "yes")
+CIRCUIT_FAILURE_RATE = float(os.getenv("CIRCUIT_FAILURE_RATE", "0.5"))
+CIRCUIT_SLOW_CALL_SECONDS = float(os.getenv("CIRCUIT_SLOW_CALL_SECONDS", "30"))
+CIRCUIT_WINDOW = int(os.getenv("CIRCUIT_WINDOW", "20"))
+CIRCUIT_MIN_CALLS = int(os.getenv("CIRCUIT_MIN_CALLS", "5"))
+CIRCUIT_OPEN_SECONDS = float(os.getenv("CIRCUIT_OPEN_SECONDS", "30"))
+CIRCUIT_HALF_OPEN_PROBES = int(os.getenv("CIRCUIT_HALF_OPEN_PROBES", "1"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling the backend while its circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Track recent call outcomes for one endpoint and stop calling it when it degrades
+
+    Closed: calls go through; failures and slow calls are counted over the last
+    `window` calls. Once at least `min_calls` are recorded and the bad-call rate
+    reaches `failure_rate`, the circuit opens. Open: calls fail immediately with
+    CircuitOpenError for `open_seconds`. Half-open: up to `half_open_probes`
+    calls are let through; a good probe closes the circuit, a bad one reopens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate: float = CIRCUIT_FAILURE_RATE,
+        slow_call_seconds: float = CIRCUIT_SLOW_CALL_SECONDS,
+        window: int = CIRCUIT_WINDOW,
+        min_calls: int = CIRCUIT_MIN_CALLS,
+        open_seconds: float = CIRCUIT_OPEN_SECONDS,
+        half_open_probes: int = CIRCUIT_HALF_OPEN_PROBES
+    ):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.slow_call_seconds = slow_call_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_probes = half_open_probes
+        self._lock = threading.Lock()
+        self._outcomes: Deque[bool] = deque(maxlen=window)  # True = bad call
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self.rejected = 0
+        self.times_opened = 0
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return self._state
+
+    def _maybe_half_open(self, now: float):
+        if self._state == OPEN and now - self._opened_at >= self.open_seconds:
+            logger.info("Circuit %s half-open - probing backend", self.name)
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
+
+    def _open(self, now: float):
+        self._state = OPEN
+        self._opened_at = now
+        self._outcomes.clear()
+        self.times_opened += 1
+
+    def before_call(self):
+        """
+        Admit a call or fail fast
+
+        Raises:
+            CircuitOpenError: If the circuit is open or half-open with all probes in flight
+        """
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            if self._state == CLOSED:
+                return
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return
+            self.rejected += 1
+            raise CircuitOpenError(f"LLM backend {self.name} is unavailable (circuit {self._state})")
+
+    def record(self, ok: bool, seconds: float):
+        """
+        Record the outcome of an admitted call
+
+        Args:
+            ok: False if the backend failed (connection error, 5xx, rate limit, timeout)
+            seconds: Call latency; calls slower than slow_call_seconds count as bad
+        """
+        bad = not ok or seconds > self.slow_call_seconds
+        now = time.monotonic()
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                if bad:
+                    logger.warning("Circuit %s probe failed - reopening", self.name)
+                    self._open(now)
+                else:
+                    logger.info("Circuit %s probe succeeded - closing", self.name)
+                    self._state = CLOSED
+                    self._outcomes.clear()
+                return
+
+            if self._state == OPEN:
+                # A call admitted before the circuit opened; its outcome is already moot
+                return
+
+            self._outcomes.append(bad)
+            # Only a bad call can trip the circuit; a recovering backend shouldn't open it
+            if bad and len(self._outcomes) >= self.min_calls:
+                rate = sum(self._outcomes) / len(self._outcomes)
+                if rate >= self.failure_rate:
+                    logger.warning(
+                        "Circuit %s opened - %.0f%% of the last %d calls failed or were slow",
+                        self.name, rate * 100, len(self._outcomes)
+                    )
+                    self._open(now)
+
+    def release(self):
+        """Forget an admitted call whose outcome says nothing about the backend"""
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            self._maybe_half_open(time.monotonic())
+            return {
+                "state": self._state,
+                "recent_calls": len(self._outcomes),
+                "recent_bad_calls": sum(self._outcomes),
+                "times_opened": self.times_opened,
+                "rejected": self.rejected,
+            }
+
+
+class CircuitBreakerRegistry:
+    """One breaker per LLM endpoint"""
+
+    def __init__(self, enabled: bool = CIRCUIT_ENABLED):
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def get(self, endpoint: Optional[str]) -> Optional[CircuitBreaker]:
+        """Breaker for an endpoint (None = default endpoint), or None if disabled"""
+        if not self.enabled:
+            return None
+        name = endpoint or "default"
+        with self._lock:
+            breaker = self._breakers.get(name)
+            if breaker is None:
+                breaker = self._breakers[name] = CircuitBreaker(name)
+            return breaker
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            breakers = list(self._breakers.values())
+        return {breaker.name: breaker.stats() for breaker in breakers}
+
+
+circuit_breakers = CircuitBreakerRegistry()
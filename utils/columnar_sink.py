@@ -0,0 +1,148 @@
+"""
+Parquet sink for bulk analysis results, written in row groups as results arrive
+"""
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+PARQUET_ROW_GROUP_SIZE = int(os.getenv("PARQUET_ROW_GROUP_SIZE", "1000"))
+
+# (column, pyarrow type name); keyword lists are list<string> columns
+RESULT_COLUMNS = [
+    ("id", "string"),
+    ("run_id", "string"),
+    ("success", "bool"),
+    ("match_score", "float64"),
+    ("matched_count", "int32"),
+    ("missing_count", "int32"),
+    ("matched_keywords", "list"),
+    ("missing_keywords", "list"),
+    ("resume_keywords", "list"),
+    ("target_keywords", "list"),
+    ("recommendations", "list"),
+    ("skipped_stages", "list"),
+    ("errors", "list"),
+    ("degraded", "bool"),
+    ("confidence_notes", "string"),
+    ("final_summary", "string"),
+    ("error", "string"),
+]
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise RuntimeError("Parquet export requires the 'pyarrow' package") from e
+    return pa, pq
+
+
+def result_schema():
+    """pyarrow schema of RESULT_COLUMNS"""
+    pa, _ = _pyarrow()
+    types = {
+        "string": pa.string(),
+        "bool": pa.bool_(),
+        "float64": pa.float64(),
+        "int32": pa.int32(),
+        "list": pa.list_(pa.string()),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in RESULT_COLUMNS])
+
+
+def _row(record: Dict[str, Any]) -> Dict[str, Any]:
+    """One result record (format_result plus id, or an error record) as a schema row"""
+    row = {name: record.get(name) for name, _ in RESULT_COLUMNS}
+    if row["matched_count"] is None and row["matched_keywords"] is not None:
+        row["matched_count"] = len(row["matched_keywords"])
+    if row["missing_count"] is None and row["missing_keywords"] is not None:
+        row["missing_count"] = len(row["missing_keywords"])
+    if row["id"] is not None:
+        row["id"] = str(row["id"])
+    return row
+
+
+class ParquetResultSink:
+    """
+    Append analysis results to a Parquet file one row group at a time
+
+    Rows are buffered until `row_group_size` have arrived and then written as
+    a row group, so memory stays bounded by one row group whatever the number
+    of results. The file is only readable after close() (or leaving the
+    `with` block), which writes the footer; a Parquet file can't be appended
+    to afterwards, so each run writes its own file.
+    """
+
+    def __init__(self, path: str, row_group_size: int = PARQUET_ROW_GROUP_SIZE):
+        pa, pq = _pyarrow()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.row_group_size = max(1, row_group_size)
+        self.schema = result_schema()
+        self._table_from_rows = pa.Table.from_pylist
+        self._writer = pq.ParquetWriter(str(self.path), self.schema, compression="zstd")
+        self._rows: List[Dict[str, Any]] = []
+        self.rows_written = 0
+        self.row_groups = 0
+
+    def write(self, record: Dict[str, Any]):
+        """Buffer one result, flushing a row group when the buffer is full"""
+        self._rows.append(_row(record))
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def flush(self):
+        """Write buffered results as one row group"""
+        if not self._rows:
+            return
+        self._writer.write_table(self._table_from_rows(self._rows, schema=self.schema))
+        self.rows_written += len(self._rows)
+        self.row_groups += 1
+        self._rows = []
+
+    def close(self):
+        """Flush and write the footer"""
+        if self._writer is None:
+            return
+        self.flush()
+        self._writer.close()
+        self._writer = None
+        logger.info("Wrote %d results in %d row groups to %s", self.rows_written, self.row_groups, self.path)
+
+    def __enter__(self) -> "ParquetResultSink":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def iter_jsonl_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Lazily read result records from a JSONL file, skipping blank lines"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def export_results(records: Iterable[Dict[str, Any]], path: str, row_group_size: Optional[int] = None) -> int:
+    """
+    Stream result records into a new Parquet file
+
+    Args:
+        records: Result records (e.g. from iter_jsonl_records)
+        path: Parquet file to write (replaced if it exists)
+        row_group_size: Rows per row group (default PARQUET_ROW_GROUP_SIZE)
+
+    Returns:
+        int: Number of records written
+    """
+    with ParquetResultSink(path, row_group_size or PARQUET_ROW_GROUP_SIZE) as sink:
+        for record in records:
+            sink.write(record)
+        sink.flush()
+        return sink.rows_written
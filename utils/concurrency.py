@@ -0,0 +1,72 @@
+"""
+Async helpers for bounded-concurrency batch processing
+"""
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Iterator, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def iterate_in_thread(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Drive a blocking iterator from a worker thread, one item at a time
+
+    Args:
+        iterator: Synchronous iterator whose next() may block (e.g. archive reads)
+
+    Yields:
+        Items from the iterator
+    """
+    sentinel = object()
+    while True:
+        item = await asyncio.to_thread(next, iterator, sentinel)
+        if item is sentinel:
+            return
+        yield item
+
+
+async def run_bounded(
+    items: AsyncIterator[T],
+    worker: Callable[[T], Awaitable[R]],
+    concurrency: int
+) -> AsyncIterator[R]:
+    """
+    Run worker over items with at most `concurrency` in flight, yielding in completion order
+
+    Items are pulled from the source only when a slot is free, so memory stays
+    bounded by the concurrency limit however long the input is. The worker is
+    expected to handle its own errors; an exception escaping it cancels the batch.
+
+    Args:
+        items: Async source of work items
+        worker: Coroutine function applied to each item
+        concurrency: Maximum number of concurrent workers
+
+    Yields:
+        Worker results as they finish
+    """
+    concurrency = max(1, concurrency)
+    pending: set[asyncio.Task] = set()
+    source = items.__aiter__()
+    exhausted = False
+
+    try:
+        while True:
+            while not exhausted and len(pending) < concurrency:
+                try:
+                    item = await source.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                pending.add(asyncio.create_task(worker(item)))
+
+            if not pending:
+                return
+
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
@@ -0,0 +1,63 @@
+"""
+Per-request time budgets carried through the workflow state
+"""
+import logging
+import os
+import time
+from typing import Any, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+DEADLINE_HEADER = "X-Deadline-Seconds"
+# Below this much remaining time an LLM call is skipped instead of started
+DEADLINE_MIN_LLM_SECONDS = float(os.getenv("DEADLINE_MIN_LLM_SECONDS", "1.0"))
+
+
+class DeadlineExceeded(TimeoutError):
+    """Raised when an LLM call runs past the request deadline"""
+
+
+def resolve_budget(*budgets: Optional[float]) -> Optional[float]:
+    """
+    Combine budgets from several sources (e.g. body field and header)
+
+    Args:
+        budgets: Budgets in seconds; None or non-positive values are ignored
+
+    Returns:
+        The tightest budget, or None if none was given
+    """
+    given = [budget for budget in budgets if budget is not None and budget > 0]
+    return min(given) if given else None
+
+
+def deadline_from_budget(budget: Optional[float]) -> Optional[float]:
+    """Absolute deadline (epoch seconds, so it survives checkpointing) for a budget"""
+    return time.time() + budget if budget else None
+
+
+def budget_after_wait(budget: Optional[float], waited: float) -> Optional[float]:
+    """Budget left after time spent queued; stays positive so the run still has a deadline"""
+    if budget is None:
+        return None
+    return max(budget - waited, 1e-3)
+
+
+def remaining_seconds(state: Mapping[str, Any]) -> Optional[float]:
+    """Seconds left before the state's deadline, or None if it has none"""
+    deadline = state.get("deadline")
+    if deadline is None:
+        return None
+    return max(0.0, deadline - time.time())
+
+
+def has_time_for_llm(state: Mapping[str, Any]) -> bool:
+    """Whether an LLM call is worth starting under the state's deadline"""
+    remaining = remaining_seconds(state)
+    return remaining is None or remaining >= DEADLINE_MIN_LLM_SECONDS
+
+
+def mark_skipped(state: dict, stage: str, reason: str):
+    """Record a stage that was skipped or run locally instead of through the LLM"""
+    logger.warning("Skipping %s: %s", stage, reason)
+    state["skipped_stages"] = state.get("skipped_stages", []) + [stage]
@@ -0,0 +1,235 @@
+"""
+Pack keyword extraction for several short resumes into one LLM call
+"""
+import hashlib
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.model_router import ModelRoute
+from utils.prompt_builder import build_user_input, NO_JOB_DESCRIPTION
+
+logger = logging.getLogger(__name__)
+
+EXTRACTION_PACKING = os.getenv("EXTRACTION_PACKING", "false").lower() in ("1", "true", "yes")
+# Estimated input tokens per packed call (job description + resumes) and per resume
+EXTRACTION_PACK_TOKEN_BUDGET = int(os.getenv("EXTRACTION_PACK_TOKEN_BUDGET", "6000"))
+EXTRACTION_PACK_MAX_DOC_TOKENS = int(os.getenv("EXTRACTION_PACK_MAX_DOC_TOKENS", "1200"))
+EXTRACTION_PACK_MAX_DOCS = int(os.getenv("EXTRACTION_PACK_MAX_DOCS", "8"))
+# How long the first resume of a pack waits for others to join
+EXTRACTION_PACK_WINDOW_MS = float(os.getenv("EXTRACTION_PACK_WINDOW_MS", "50"))
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+class _Pack:
+    """Resumes waiting to be extracted together"""
+
+    def __init__(self, system_prompt: str, job_description: str, route: ModelRoute):
+        self.system_prompt = system_prompt
+        self.job_description = job_description
+        self.route = route
+        self.tokens = estimate_tokens(job_description)
+        # (resume text, absolute deadline or None, result future)
+        self.members: List[Tuple[str, Optional[float], Future]] = []
+        self.ready = threading.Event()
+
+    def fits(self, tokens: int, token_budget: int, max_docs: int) -> bool:
+        return len(self.members) < max_docs and self.tokens + tokens <= token_budget
+
+
+class ExtractionPacker:
+    """
+    Collect concurrent extraction calls that share a job description and model
+
+    Worker threads running the extract_keywords node call extract(). The first
+    resume for a (prompt, job description, route) opens a pack and waits up to
+    `window_ms` for others; the pack is sent as soon as it is full (by resume
+    count or estimated tokens). The response lists keywords per resume id and is
+    split back out to each caller. A caller gets None, and should make its own
+    single-resume call, if its resume is too long to pack, it ended up alone,
+    or the packed output didn't parse or left its id out. Deadline and
+    circuit-breaker errors are raised to every caller in the pack.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = EXTRACTION_PACKING,
+        token_budget: int = EXTRACTION_PACK_TOKEN_BUDGET,
+        max_doc_tokens: int = EXTRACTION_PACK_MAX_DOC_TOKENS,
+        max_docs: int = EXTRACTION_PACK_MAX_DOCS,
+        window_ms: float = EXTRACTION_PACK_WINDOW_MS
+    ):
+        self.enabled = enabled
+        self.token_budget = token_budget
+        self.max_doc_tokens = max_doc_tokens
+        self.max_docs = max(2, max_docs)
+        self.window_seconds = window_ms / 1000
+        self._lock = threading.Lock()
+        self._open: Dict[Tuple[str, str, ModelRoute], _Pack] = {}
+        self.packed_calls = 0
+        self.packed_resumes = 0
+        self.single_fallbacks = 0
+
+    def extract(
+        self,
+        system_prompt: str,
+        resume_text: str,
+        job_description: str,
+        route: ModelRoute,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Extract one resume's keywords as part of a pack
+
+        Args:
+            system_prompt: Packed extraction prompt (id-keyed output schema)
+            resume_text: Resume text
+            job_description: Job description shared by the pack
+            route: Model route for the call
+            timeout: Seconds left before this caller's deadline
+
+        Returns:
+            Dict with resume_keywords, target_keywords, extraction_notes and usage
+            (this resume's share of the packed call), or None to fall back to a
+            single-resume call
+
+        Raises:
+            DeadlineExceeded: If the packed call ran past this caller's deadline
+            CircuitOpenError: If the LLM backend's circuit is open
+        """
+        tokens = estimate_tokens(resume_text)
+        if not self.enabled or tokens > self.max_doc_tokens:
+            return None
+
+        future: Future = Future()
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        key = (hashlib.sha256(system_prompt.encode("utf-8")).hexdigest(),
+               hashlib.sha256(job_description.encode("utf-8")).hexdigest(), route)
+        with self._lock:
+            pack = self._open.get(key)
+            leader = pack is None or not pack.fits(tokens, self.token_budget, self.max_docs)
+            if leader:
+                if pack is not None:
+                    pack.ready.set()  # full: send it now
+                pack = self._open[key] = _Pack(system_prompt, job_description, route)
+            pack.members.append((resume_text, deadline, future))
+            pack.tokens += tokens
+            if not pack.fits(0, self.token_budget, self.max_docs):
+                pack.ready.set()
+                del self._open[key]
+
+        if leader:
+            pack.ready.wait(self.window_seconds)
+            with self._lock:
+                if self._open.get(key) is pack:
+                    del self._open[key]
+            try:
+                self._send(pack)
+            finally:
+                # Never leave a caller waiting, whatever went wrong
+                for _, _, member_future in pack.members:
+                    if not member_future.done():
+                        member_future.set_result(None)
+        return future.result()
+
+    def _send(self, pack: _Pack):
+        """Make the packed call and resolve every member's future"""
+        members = pack.members
+        if len(members) == 1:
+            members[0][2].set_result(None)
+            return
+
+        # Imported here so reading stats doesn't pull in the OpenAI SDK
+        from utils.circuit_breaker import CircuitOpenError
+        from utils.deadline import DeadlineExceeded
+        from utils.llm_helper import call_llm_with_structured_output
+
+        ids = [f"r{i + 1}" for i in range(len(members))]
+        user_input = build_user_input(
+            shared=[("Job Description", pack.job_description or NO_JOB_DESCRIPTION)],
+            per_candidate=[(f"Resume {resume_id}", text) for resume_id, (text, _, _) in zip(ids, members)]
+        )
+        deadlines = [deadline for _, deadline, _ in members if deadline is not None]
+        timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+        usage: Dict[str, int] = {}
+        try:
+            response = call_llm_with_structured_output(
+                system_prompt=pack.system_prompt,
+                user_input=user_input,
+                model=pack.route.model,
+                temperature=0.0,
+                base_url=pack.route.base_url,
+                usage=usage,
+                timeout=timeout
+            )
+        except CircuitOpenError as e:
+            for _, _, future in members:
+                future.set_exception(e)
+            return
+        except DeadlineExceeded as e:
+            # Only callers whose own deadline has passed fail; the rest retry singly
+            now = time.monotonic()
+            for _, deadline, future in members:
+                if deadline is not None and deadline <= now + 0.05:
+                    future.set_exception(e)
+                else:
+                    future.set_result(None)
+            return
+        except Exception as e:
+            logger.warning("Packed extraction of %d resumes failed, falling back to single calls: %s", len(members), e)
+            with self._lock:
+                self.single_fallbacks += len(members)
+            for _, _, future in members:
+                future.set_result(None)
+            return
+
+        if not isinstance(response, dict):
+            response = {}
+        per_resume = response.get("resumes")
+        if not isinstance(per_resume, dict):
+            per_resume = {}
+        target_keywords = response.get("target_keywords", [])
+        share = {name: count // len(members) for name, count in usage.items()}
+
+        fallbacks = 0
+        for resume_id, (_, _, future) in zip(ids, members):
+            entry = per_resume.get(resume_id)
+            if not isinstance(entry, dict) or not isinstance(entry.get("resume_keywords"), list):
+                fallbacks += 1
+                future.set_result(None)
+                continue
+            future.set_result({
+                "resume_keywords": entry["resume_keywords"],
+                "target_keywords": target_keywords,
+                "extraction_notes": entry.get("extraction_notes", ""),
+                "usage": dict(share)
+            })
+
+        with self._lock:
+            self.packed_calls += 1
+            self.packed_resumes += len(members) - fallbacks
+            self.single_fallbacks += fallbacks
+        if fallbacks:
+            logger.warning("Packed extraction left out %d of %d resumes; extracting them singly", fallbacks, len(members))
+        else:
+            logger.info("Extracted %d resumes in one packed call", len(members))
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "packed_calls": self.packed_calls,
+                "packed_resumes": self.packed_resumes,
+                "single_fallbacks": self.single_fallbacks,
+            }
+
+
+extraction_packer = ExtractionPacker()
@@ -1,23 +1,162 @@
 """
 Utility functions for file parsing
 """
+import re
+from io import BytesIO
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
+
+# Registered parsers keyed by lowercase file extension
+_PARSERS: Dict[str, Callable[[bytes], str]] = {}
+
+TEXT_EXTENSIONS = ('.txt', '.md', '.text')
+
+
+def register_parser(*extensions: str) -> Callable[[Callable[[bytes], str]], Callable[[bytes], str]]:
+    """
+    Register a bytes -> text parser for one or more file extensions
+
+    Args:
+        extensions: File extensions including the leading dot (e.g. ".pdf")
+
+    Returns:
+        Decorator that registers the parser and returns it unchanged
+    """
+    def decorator(parser: Callable[[bytes], str]) -> Callable[[bytes], str]:
+        for extension in extensions:
+            _PARSERS[extension.lower()] = parser
+        return parser
+    return decorator
+
+
+def supported_extensions() -> tuple[str, ...]:
+    """Return all file extensions with a registered parser"""
+    return tuple(sorted(_PARSERS))
+
+
+@register_parser(*TEXT_EXTENSIONS)
+def _parse_plain_text(data: bytes) -> str:
+    return data.decode('utf-8')
+
+
+@register_parser('.pdf')
+def _parse_pdf(data: bytes) -> str:
+    try:
+        from pypdf import PdfReader
+    except ImportError as e:
+        raise ValueError("PDF parsing requires the 'pypdf' package") from e
+
+    reader = PdfReader(BytesIO(data))
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+@register_parser('.docx')
+def _parse_docx(data: bytes) -> str:
+    try:
+        from docx import Document
+    except ImportError as e:
+        raise ValueError("DOCX parsing requires the 'python-docx' package") from e
+
+    document = Document(BytesIO(data))
+    lines = [paragraph.text for paragraph in document.paragraphs]
+    for table in document.tables:
+        for row in table.rows:
+            lines.append(" | ".join(cell.text for cell in row.cells))
+    return "\n".join(lines)
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """Collect visible text from an HTML document"""
+
+    _SKIPPED_TAGS = {'script', 'style', 'head', 'noscript'}
+    _BLOCK_TAGS = {'p', 'div', 'br', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'section'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: list[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self._SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif tag in self._BLOCK_TAGS:
+            self.parts.append("\n")
+
+    def handle_endtag(self, tag):
+        if tag in self._SKIPPED_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.parts.append(data)
+
+
+@register_parser('.html', '.htm')
+def _parse_html(data: bytes) -> str:
+    extractor = _HTMLTextExtractor()
+    extractor.feed(data.decode('utf-8', errors='replace'))
+    extractor.close()
+    text = "".join(extractor.parts)
+    return re.sub(r"\n\s*\n+", "\n\n", text).strip()
+
+
+@register_parser('.rtf')
+def _parse_rtf(data: bytes) -> str:
+    try:
+        from striprtf.striprtf import rtf_to_text
+    except ImportError as e:
+        raise ValueError("RTF parsing requires the 'striprtf' package") from e
+
+    return rtf_to_text(data.decode('latin-1'))
+
+
+def extract_text(filename: str, data: bytes) -> str:
+    """
+    Extract plain text from raw file content using the parser for its extension
+
+    This is a pure function of its inputs so it can run in a worker process.
+
+    Args:
+        filename: Original file name (used for the extension)
+        data: Raw file content
+
+    Returns:
+        str: Extracted text
+
+    Raises:
+        ValueError: If the extension is not supported or the file cannot be parsed
+        UnicodeDecodeError: If a plain text file is not valid UTF-8
+    """
+    extension = Path(filename).suffix.lower()
+    parser = _PARSERS.get(extension)
+    if parser is None:
+        raise ValueError(
+            f"Unsupported file type '{extension}' (supported: {', '.join(supported_extensions())})"
+        )
+    
+    try:
+        return parser(data)
+    except (ValueError, UnicodeDecodeError):
+        raise
+    except Exception as e:
+        # Third-party parsers raise their own error types on corrupt input
+        raise ValueError(f"Failed to parse {extension} file: {str(e)}") from e
 
 
 def parse_text_file(file_path: str) -> str:
     """
-    Read and parse a text file from the given file path
+    Read and parse a resume file from the given file path
     
     Args:
-        file_path: Path to the text file
+        file_path: Path to a file with a registered parser (.txt, .md, .pdf, .docx, ...)
         
     Returns:
         str: Content of the file
         
     Raises:
         FileNotFoundError: If file doesn't exist
-        ValueError: If file is not a text file
+        ValueError: If file type is not supported
     """
     path = Path(file_path)
     
@@ -27,14 +166,7 @@ def parse_text_file(file_path: str) -> str:
     if not path.is_file():
         raise ValueError(f"Path is not a file: {file_path}")
     
-    # Check if it's a text file
-    if path.suffix not in ['.txt', '.md', '.text']:
-        raise ValueError(f"File must be a text file (.txt, .md, .text): {file_path}")
-    
-    with open(path, 'r', encoding='utf-8') as file:
-        content = file.read()
-    
-    return content
+    return extract_text(path.name, path.read_bytes())
 
 
 def validate_text_content(text: str, min_words: int = 50) -> tuple[bool, Optional[str]]:
@@ -0,0 +1,98 @@
+"""
+Keyword canonicalization and deterministic keyword scoring
+"""
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+# Synonyms mirrored from EXTRACTION_PROMPT / ANALYSIS_PROMPT, keyed by lowercase form
+SYNONYMS: Dict[str, str] = {
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "amazon web services": "aws",
+    "google cloud platform": "gcp",
+    "google cloud": "gcp",
+    "k8s": "kubernetes",
+    "restful api": "rest api",
+    "restful apis": "rest api",
+    "rest apis": "rest api",
+    "continuous integration": "ci/cd",
+    "continuous deployment": "ci/cd",
+    "continuous delivery": "ci/cd",
+    "react.js": "react",
+    "reactjs": "react",
+    "postgres": "postgresql",
+    "golang": "go",
+}
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_VERSION_SUFFIX_RE = re.compile(r"\s+v?\d+(?:\.\d+)*\+?$")
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_keyword(keyword: str) -> str:
+    """
+    Normalize a keyword to its canonical comparison form
+
+    Lowercases, collapses whitespace, drops trailing version numbers
+    ("Python 3.10" -> "python") and folds known synonyms ("K8s" -> "kubernetes").
+
+    Args:
+        keyword: Raw keyword as extracted by the LLM
+
+    Returns:
+        str: Canonical keyword (empty string if nothing is left)
+    """
+    canonical = _WHITESPACE_RE.sub(" ", keyword.strip().lower())
+    stripped = _VERSION_SUFFIX_RE.sub("", canonical)
+    if stripped:
+        canonical = stripped
+    return SYNONYMS.get(canonical, canonical)
+
+
+def canonical_keyword_map(keywords: Iterable[str]) -> Dict[str, str]:
+    """
+    Map canonical keywords to the first original spelling seen
+
+    Args:
+        keywords: Raw keywords
+
+    Returns:
+        Dict[str, str]: canonical keyword -> original keyword, in input order
+    """
+    mapping: Dict[str, str] = {}
+    for keyword in keywords:
+        canonical = canonicalize_keyword(keyword)
+        if canonical and canonical not in mapping:
+            mapping[canonical] = keyword
+    return mapping
+
+
+def score_keywords(resume_keywords: List[str], target_keywords: List[str]) -> Dict[str, Any]:
+    """
+    Deterministically match resume keywords against target keywords
+
+    Implements the ANALYSIS_PROMPT scoring rules locally: case-insensitive exact
+    matching after canonicalization, synonyms counted once, and
+    score = matched_count / target_keywords_count rounded to 2 decimals.
+
+    Args:
+        resume_keywords: Keywords extracted from the resume
+        target_keywords: Keywords extracted from the job description
+
+    Returns:
+        Dict with matched_keywords, missing_keywords and match_score
+    """
+    resume_canonical = set(canonical_keyword_map(resume_keywords))
+    targets = canonical_keyword_map(target_keywords)
+
+    matched = [original for canonical, original in targets.items() if canonical in resume_canonical]
+    missing = [original for canonical, original in targets.items() if canonical not in resume_canonical]
+    match_score = round(len(matched) / len(targets), 2) if targets else 0.0
+
+    return {
+        "matched_keywords": matched,
+        "missing_keywords": missing,
+        "match_score": match_score,
+    }
@@ -0,0 +1,135 @@
+"""
+Priority lanes sharing the workflow (LLM) concurrency budget
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, List
+
+logger = logging.getLogger(__name__)
+
+INTERACTIVE = "interactive"
+BULK = "bulk"
+LANES = (INTERACTIVE, BULK)  # highest priority first
+
+# Workflows running at once across all lanes, and the most each lane may hold
+LANE_TOTAL_SLOTS = int(os.getenv("LANE_TOTAL_SLOTS", "8"))
+LANE_INTERACTIVE_SLOTS = int(os.getenv("LANE_INTERACTIVE_SLOTS", str(LANE_TOTAL_SLOTS)))
+LANE_BULK_SLOTS = int(os.getenv("LANE_BULK_SLOTS", "4"))
+# Queue waits kept per lane for the p95 in stats
+LANE_WAIT_SAMPLES = 500
+
+
+class LaneScheduler:
+    """
+    Hand out workflow slots by lane priority
+
+    At most `total_slots` workflows run at once, and each lane is capped at its
+    own share. When a slot frees, the highest-priority lane with queued work
+    and room under its cap gets it, so an interactive request jumps ahead of
+    every queued bulk item (running work is never interrupted). Giving bulk a
+    cap below the total keeps slots free for interactive requests even while a
+    large batch is queued. Must be used from one event loop.
+    """
+
+    def __init__(self, total_slots: int, lane_slots: Dict[str, int]):
+        self.total_slots = max(1, total_slots)
+        self.lane_slots = {lane: max(1, min(slots, self.total_slots)) for lane, slots in lane_slots.items()}
+        self._running: Dict[str, int] = {lane: 0 for lane in lane_slots}
+        self._queues: Dict[str, Deque[asyncio.Future]] = {lane: deque() for lane in lane_slots}
+        self._waits: Dict[str, Deque[float]] = {lane: deque(maxlen=LANE_WAIT_SAMPLES) for lane in lane_slots}
+        self._admitted: Dict[str, int] = {lane: 0 for lane in lane_slots}
+
+    def _has_room(self, lane: str) -> bool:
+        return (
+            sum(self._running.values()) < self.total_slots
+            and self._running[lane] < self.lane_slots[lane]
+        )
+
+    def _can_start(self, lane: str) -> bool:
+        # Work in a higher-priority lane that could run goes first
+        for other in self.lane_slots:
+            if other == lane:
+                return self._has_room(lane)
+            if self._queues[other] and self._has_room(other):
+                return False
+        return False
+
+    def _dispatch(self):
+        for lane in self.lane_slots:
+            queue = self._queues[lane]
+            while queue and self._has_room(lane):
+                waiter = queue.popleft()
+                if not waiter.done():
+                    self._running[lane] += 1
+                    waiter.set_result(None)
+
+    async def acquire(self, lane: str) -> float:
+        """
+        Wait for a slot in a lane
+
+        Args:
+            lane: Lane name (see LANES)
+
+        Returns:
+            float: Seconds spent queued
+
+        Raises:
+            ValueError: If the lane is unknown
+        """
+        if lane not in self.lane_slots:
+            raise ValueError(f"Unknown lane: {lane} (expected one of {', '.join(self.lane_slots)})")
+
+        start = time.perf_counter()
+        if not self._queues[lane] and self._can_start(lane):
+            self._running[lane] += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            self._queues[lane].append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self.release(lane)
+                elif waiter in self._queues[lane]:
+                    self._queues[lane].remove(waiter)
+                raise
+
+        waited = time.perf_counter() - start
+        self._waits[lane].append(waited)
+        self._admitted[lane] += 1
+        return waited
+
+    def release(self, lane: str):
+        """Return a lane slot and start queued work by priority"""
+        self._running[lane] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, lane: str) -> AsyncIterator[float]:
+        """Hold a lane slot for the body of the block; yields the queue wait in seconds"""
+        waited = await self.acquire(lane)
+        try:
+            yield waited
+        finally:
+            self.release(lane)
+
+    def stats(self) -> Dict[str, Dict[str, object]]:
+        report = {}
+        for lane in self.lane_slots:
+            waits: List[float] = sorted(self._waits[lane])
+            report[lane] = {
+                "slots": self.lane_slots[lane],
+                "running": self._running[lane],
+                "queued": len(self._queues[lane]),
+                "admitted": self._admitted[lane],
+                "queue_wait_avg_seconds": round(sum(waits) / len(waits), 3) if waits else 0.0,
+                "queue_wait_p95_seconds": round(waits[int(0.95 * (len(waits) - 1))], 3) if waits else 0.0,
+            }
+        return report
+
+
+lane_scheduler = LaneScheduler(LANE_TOTAL_SLOTS, {INTERACTIVE: LANE_INTERACTIVE_SLOTS, BULK: LANE_BULK_SLOTS})
@@ -0,0 +1,202 @@
+"""
+Record LLM calls to cassette files and replay them offline
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+from utils.deadline import DeadlineExceeded
+
+logger = logging.getLogger(__name__)
+
+OFF = "off"
+RECORD = "record"
+REPLAY = "replay"
+MODES = (OFF, RECORD, REPLAY)
+
+LLM_CASSETTE_MODE = os.getenv("LLM_CASSETTE_MODE", OFF).lower()
+LLM_CASSETTE_DIR = os.getenv("LLM_CASSETTE_DIR", "data/cassettes")
+# 0 replays instantly, 1 sleeps for each call's recorded latency, 0.5 for half of it
+LLM_CASSETTE_LATENCY_SCALE = float(os.getenv("LLM_CASSETTE_LATENCY_SCALE", "0"))
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when no cassette was recorded for a call"""
+
+
+def cassette_key(model: str, messages: List[Dict[str, str]], temperature: float) -> str:
+    """Identify a call by everything that determines its response (not the endpoint)"""
+    payload = json.dumps(
+        {"model": model, "messages": messages, "temperature": temperature},
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _as_response(entry: Dict[str, Any]) -> SimpleNamespace:
+    """Rebuild the parts of a chat completion that llm_helper reads"""
+    usage = entry.get("usage", {})
+    return SimpleNamespace(
+        model=entry["model"],
+        choices=[SimpleNamespace(message=SimpleNamespace(content=entry["content"]))],
+        usage=SimpleNamespace(
+            prompt_tokens=usage.get("prompt_tokens", 0),
+            completion_tokens=usage.get("completion_tokens", 0),
+            total_tokens=usage.get("total_tokens", 0),
+            prompt_tokens_details=SimpleNamespace(cached_tokens=usage.get("cached_tokens", 0))
+        )
+    )
+
+
+class LLMCassette:
+    """
+    Record/replay store for chat completions, one JSON file per distinct call
+
+    In record mode every successful completion is written to
+    `<directory>/<key>.json` with its content, token usage and latency, where
+    the key hashes the model, messages and temperature. In replay mode calls
+    are answered from those files without touching the network (or the
+    circuit breaker), optionally sleeping for the recorded latency scaled by
+    `latency_scale`; a call with no recording raises CassetteMiss.
+    """
+
+    def __init__(
+        self,
+        mode: str = LLM_CASSETTE_MODE,
+        directory: str = LLM_CASSETTE_DIR,
+        latency_scale: float = LLM_CASSETTE_LATENCY_SCALE
+    ):
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self.configure(mode, directory, latency_scale)
+
+    def configure(self, mode: str, directory: Optional[str] = None, latency_scale: Optional[float] = None):
+        """Switch mode (e.g. from a benchmark) and reset counters"""
+        if mode not in MODES:
+            raise ValueError(f"Unknown LLM cassette mode '{mode}' (expected one of {', '.join(MODES)})")
+        with self._lock:
+            self.mode = mode
+            if directory is not None:
+                self.directory = directory
+            if latency_scale is not None:
+                self.latency_scale = max(0.0, latency_scale)
+            self._entries.clear()
+            self.recorded = 0
+            self.replayed = 0
+            self.misses = 0
+        if mode != OFF:
+            logger.info("LLM cassette %s mode (%s)", mode, self.directory)
+
+    @property
+    def replaying(self) -> bool:
+        return self.mode == REPLAY
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def record(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        content: str,
+        usage: Dict[str, int],
+        latency_seconds: float
+    ):
+        """Write one completion to its cassette file (no-op unless recording)"""
+        if self.mode != RECORD:
+            return
+        key = cassette_key(model, messages, temperature)
+        entry = {
+            "model": model,
+            "temperature": temperature,
+            "messages": messages,
+            "content": content,
+            "usage": usage,
+            "latency_seconds": round(latency_seconds, 6),
+            "recorded_at": time.time()
+        }
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Write then rename so a concurrent replay never reads half a file
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            logger.warning("Could not record LLM cassette %s: %s", key[:12], e)
+            return
+        with self._lock:
+            self.recorded += 1
+
+    def _load(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def replay(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        timeout: Optional[float] = None
+    ) -> SimpleNamespace:
+        """
+        Answer a call from its recording
+
+        Args:
+            model: Model name
+            messages: Chat messages
+            temperature: Temperature setting
+            timeout: Seconds left before the request deadline
+
+        Returns:
+            SimpleNamespace: Response shaped like a chat completion
+
+        Raises:
+            CassetteMiss: If the call was never recorded
+            DeadlineExceeded: If the scaled recorded latency exceeds the timeout
+        """
+        key = cassette_key(model, messages, temperature)
+        entry = self._load(key)
+        if entry is None:
+            with self._lock:
+                self.misses += 1
+            raise CassetteMiss(f"No LLM cassette for {model} call {key[:12]} in {self.directory}")
+
+        delay = entry.get("latency_seconds", 0.0) * self.latency_scale
+        if timeout is not None and delay > timeout:
+            time.sleep(timeout)
+            raise DeadlineExceeded(f"LLM call did not finish in the {timeout:.1f}s left before the deadline")
+        if delay > 0:
+            time.sleep(delay)
+        with self._lock:
+            self.replayed += 1
+        return _as_response(entry)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "mode": self.mode,
+                "recorded": self.recorded,
+                "replayed": self.replayed,
+                "misses": self.misses,
+            }
+
+
+llm_cassette = LLMCassette()
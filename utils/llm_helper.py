@@ -4,28 +4,46 @@ LLM helper functions for OpenAI integration
 import os
 import json
 import logging
+import time
 
+from functools import lru_cache
 from typing import Any, Dict, Optional
-from openai import OpenAI
+from openai import APIConnectionError, APIStatusError, APITimeoutError, OpenAI
 from dotenv import load_dotenv
 
+from utils.circuit_breaker import CircuitOpenError, circuit_breakers
+from utils.deadline import DeadlineExceeded
+from utils.llm_cassette import llm_cassette
+from utils.logging_config import log_payload
+from utils.model_router import ModelRoute, model_router
+from utils.profiling import record_llm_wait
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Default per-request timeout; calls under a request deadline use the time left instead
+LLM_TIMEOUT_SECONDS = float(os.getenv("LLM_TIMEOUT_SECONDS", "60"))
+
 
-def get_llm() -> OpenAI:
+@lru_cache(maxsize=None)
+def get_llm(base_url: Optional[str] = None) -> OpenAI:
     """
-    Get configured OpenAI client instance
+    Get the shared, configured OpenAI client instance
+    
+    One client is created per endpoint so its HTTP connection pool is reused across calls.
+    
+    Args:
+        base_url: Endpoint override (defaults to OPENAI_API_BASE)
     
     Returns:
         OpenAI: Configured OpenAI client
     """
     api_key = os.getenv("OPENAI_API_KEY", "lm-studio")
-    base_url = os.getenv("OPENAI_API_BASE", None)
+    base_url = base_url or os.getenv("OPENAI_API_BASE", None)
     
-    client_kwargs = {"api_key": api_key}
+    client_kwargs = {"api_key": api_key, "timeout": LLM_TIMEOUT_SECONDS}
     
     if base_url:
         client_kwargs["base_url"] = base_url
@@ -33,11 +51,112 @@ def get_llm() -> OpenAI:
     return OpenAI(**client_kwargs)
 
 
+def usage_counts(response: Any) -> Dict[str, int]:
+    """
+    Extract token counts from a chat completion response
+    
+    cached_tokens is the part of the prompt served from the provider's prefix
+    cache; it is 0 when the provider doesn't report it.
+    
+    Args:
+        response: Chat completion response
+        
+    Returns:
+        Dict with prompt_tokens, cached_tokens, completion_tokens and total_tokens
+    """
+    usage = getattr(response, "usage", None)
+    details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", None) or 0,
+        "cached_tokens": getattr(details, "cached_tokens", None) or 0,
+        "completion_tokens": getattr(usage, "completion_tokens", None) or 0,
+        "total_tokens": getattr(usage, "total_tokens", None) or 0,
+    }
+
+
+def _is_backend_failure(error: Exception) -> bool:
+    """Whether an error says the endpoint is unhealthy (as opposed to a bad request)"""
+    if isinstance(error, APIConnectionError):  # includes timeouts
+        return True
+    return isinstance(error, APIStatusError) and (error.status_code >= 500 or error.status_code == 429)
+
+
+def _create_completion(
+    model: str,
+    messages: list,
+    temperature: float,
+    base_url: Optional[str],
+    timeout: Optional[float]
+) -> Any:
+    """
+    Send one chat completion through the endpoint's circuit breaker
+    
+    In cassette replay mode the call is answered from its recording instead
+    (see utils/llm_cassette.py); in record mode successful calls are saved.
+    
+    Raises:
+        CircuitOpenError: If the endpoint's circuit is open (no request is sent)
+        DeadlineExceeded: If a timeout was given and the call ran past it
+        CassetteMiss: In replay mode, if the call was never recorded
+    """
+    if llm_cassette.replaying:
+        start_time = time.perf_counter()
+        try:
+            return llm_cassette.replay(model, messages, temperature, timeout)
+        finally:
+            record_llm_wait(time.perf_counter() - start_time)
+    
+    breaker = circuit_breakers.get(base_url)
+    if breaker is not None:
+        breaker.before_call()
+    
+    client = get_llm(base_url)
+    if timeout is not None:
+        client = client.with_options(timeout=timeout, max_retries=0)
+    
+    start_time = time.perf_counter()
+    healthy: Optional[bool] = None
+    try:
+        response = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            temperature=temperature
+        )
+        healthy = True
+        llm_cassette.record(
+            model, messages, temperature, response.choices[0].message.content,
+            usage_counts(response), time.perf_counter() - start_time
+        )
+        return response
+    except APITimeoutError as e:
+        if timeout is None:
+            healthy = False
+            raise
+        # A caller's short budget says nothing about the backend's health
+        raise DeadlineExceeded(f"LLM call did not finish in the {timeout:.1f}s left before the deadline") from e
+    except Exception as e:
+        healthy = not _is_backend_failure(e)
+        raise
+    finally:
+        elapsed = time.perf_counter() - start_time
+        # Latency feeds the router's p95 tracking (see utils/model_router.py)
+        model_router.record(ModelRoute(model, base_url), elapsed)
+        record_llm_wait(elapsed)
+        if breaker is not None:
+            if healthy is None:
+                breaker.release()
+            else:
+                breaker.record(healthy, elapsed)
+
+
 def call_llm_with_structured_output(
     system_prompt: str,
     user_input: str,
     model: Optional[str] = None,
-    temperature: float = 0.0
+    temperature: float = 0.0,
+    base_url: Optional[str] = None,
+    usage: Optional[Dict[str, int]] = None,
+    timeout: Optional[float] = None
 ) -> Dict[str, Any]:
     """
     Call LLM and parse structured JSON output
@@ -47,36 +166,37 @@ def call_llm_with_structured_output(
         user_input: User input/query
         model: Model name
         temperature: Temperature setting
+        base_url: Endpoint override (defaults to OPENAI_API_BASE)
+        usage: Optional dict filled with this call's token counts (see usage_counts)
+        timeout: Seconds left before the request deadline; the call is not retried
         
     Returns:
         Dict: Parsed JSON response
         
     Raises:
         ValueError: If response is not valid JSON
+        DeadlineExceeded: If a timeout was given and the call ran past it
+        CircuitOpenError: If the LLM backend's circuit is open
     """
     if model is None:
         model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
-    client = get_llm()
-    
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_input}
     ]
     
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature
-        )
+        response = _create_completion(model, messages, temperature, base_url, timeout)
         
         # Extract content from response
         content = response.choices[0].message.content
         
         # Log response
-        tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else None
-        logger.info(f"Tokens Used: {tokens_used}")
+        counts = usage_counts(response)
+        if usage is not None:
+            usage.update(counts)
+        logger.debug("LLM call completed", extra={"model": model, **counts})
         
         # Parse JSON from response
         try:
@@ -87,15 +207,17 @@ def call_llm_with_structured_output(
                 content = content.split("```")[1].split("```")[0].strip()
             
             result = json.loads(content)
-            logger.info(f"Successfully parsed JSON response with {len(result)} keys")
-            logger.info(f"LLM Response: \n{result}")
+            logger.debug("Successfully parsed JSON response with %d keys", len(result))
+            log_payload(logger, "llm_response", "LLM Response: %s", result)
             return result
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON from LLM response: {str(e)}")
+            logger.error("Failed to parse JSON from LLM response: %s", e)
             raise ValueError(f"LLM response is not valid JSON: {content}") from e
             
+    except (DeadlineExceeded, CircuitOpenError):
+        raise
     except Exception as e:
-        logger.error(f"LLM call failed: {str(e)}")
+        logger.error("LLM call failed: %s", e)
         raise
 
 
@@ -103,7 +225,10 @@ def call_llm_with_text_output(
     system_prompt: str,
     user_input: str,
     model: Optional[str] = None,
-    temperature: float = 0.3
+    temperature: float = 0.3,
+    base_url: Optional[str] = None,
+    usage: Optional[Dict[str, int]] = None,
+    timeout: Optional[float] = None
 ) -> str:
     """
     Call LLM and get text output
@@ -113,36 +238,41 @@ def call_llm_with_text_output(
         user_input: User input/query
         model: Model name
         temperature: Temperature setting
+        base_url: Endpoint override (defaults to OPENAI_API_BASE)
+        usage: Optional dict filled with this call's token counts (see usage_counts)
+        timeout: Seconds left before the request deadline; the call is not retried
         
     Returns:
         str: Text response
+        
+    Raises:
+        DeadlineExceeded: If a timeout was given and the call ran past it
+        CircuitOpenError: If the LLM backend's circuit is open
     """
     if model is None:
         model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
     
-    client = get_llm()
-    
     messages = [
         {"role": "system", "content": system_prompt},
         {"role": "user", "content": user_input}
     ]
     
     try:
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature
-        )
+        response = _create_completion(model, messages, temperature, base_url, timeout)
         
         # Extract content from response
         content = response.choices[0].message.content
         
         # Log response
-        tokens_used = response.usage.total_tokens if hasattr(response, 'usage') else None
-        logger.info(f"Tokens Used: {tokens_used}")
+        counts = usage_counts(response)
+        if usage is not None:
+            usage.update(counts)
+        logger.debug("LLM call completed", extra={"model": model, **counts})
         
         return content
         
+    except (DeadlineExceeded, CircuitOpenError):
+        raise
     except Exception as e:
-        logger.error(f"LLM call failed: {str(e)}")
+        logger.error("LLM call failed: %s", e)
         raise
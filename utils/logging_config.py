@@ -0,0 +1,166 @@
+"""
+Logging configuration: queue-backed handlers, structured output and payload sampling
+"""
+import atexit
+import copy
+import json
+import logging
+import os
+import queue
+import random
+import sys
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text")  # "text" or "json"
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+LOG_PAYLOAD_SAMPLE_RATE = float(os.getenv("LOG_PAYLOAD_SAMPLE_RATE", "0.01"))
+LOG_PAYLOAD_MAX_PER_MINUTE = int(os.getenv("LOG_PAYLOAD_MAX_PER_MINUTE", "30"))
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Attributes every LogRecord has; anything else was passed via extra= and is a structured field
+_RESERVED_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[QueueListener] = None
+
+
+def _extra_fields(record: logging.LogRecord) -> Dict[str, Any]:
+    return {key: value for key, value in vars(record).items() if key not in _RESERVED_ATTRS}
+
+
+class KeyValueFormatter(logging.Formatter):
+    """Human-readable format with structured extra= fields appended as key=value"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        line = super().format(record)
+        fields = _extra_fields(record)
+        if fields:
+            line += " | " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return line
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, including extra= fields"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, DATE_FORMAT),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+            **_extra_fields(record),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves message formatting to the listener thread
+
+    The stock QueueHandler formats each record in the calling thread; here the
+    caller only enqueues, and %-style args are merged when the record is written.
+    Records are dropped rather than blocking when the queue is full.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return copy.copy(record)
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            pass
+
+
+def configure_logging(level: str = LOG_LEVEL, fmt: str = LOG_FORMAT) -> QueueListener:
+    """
+    Route all application logging through a background writer thread
+
+    Request coroutines and worker threads only enqueue records; a QueueListener
+    thread formats them and writes to stderr.
+
+    Args:
+        level: Root log level name
+        fmt: "text" (key=value extras) or "json"
+
+    Returns:
+        QueueListener: The running listener (stopped automatically at exit)
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    stream_handler = logging.StreamHandler(sys.stderr)
+    if fmt == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(KeyValueFormatter(TEXT_FORMAT, datefmt=DATE_FORMAT))
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root = logging.getLogger()
+    root.handlers[:] = [DeferredQueueHandler(log_queue)]
+    root.setLevel(level.upper())
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(stop_logging)
+    return _listener
+
+
+def stop_logging():
+    """Flush queued records and stop the writer thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+class PayloadSampler:
+    """
+    Decide whether a large payload dump should be logged
+
+    Combines probabilistic sampling with a per-key cap per minute, so payload
+    logging stays bounded however hot the path is.
+    """
+
+    def __init__(self, sample_rate: float = LOG_PAYLOAD_SAMPLE_RATE, max_per_minute: int = LOG_PAYLOAD_MAX_PER_MINUTE):
+        self.sample_rate = sample_rate
+        self.max_per_minute = max_per_minute
+        self._lock = threading.Lock()
+        self._windows: Dict[str, list] = {}
+
+    def should_log(self, key: str) -> bool:
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return False
+        now = time.monotonic()
+        with self._lock:
+            window_start, count = self._windows.get(key, (now, 0))
+            if now - window_start >= 60:
+                window_start, count = now, 0
+            if count >= self.max_per_minute:
+                return False
+            self._windows[key] = [window_start, count + 1]
+            return True
+
+
+payload_sampler = PayloadSampler()
+
+
+def log_payload(logger: logging.Logger, key: str, msg: str, *args: Any, **kwargs: Any):
+    """
+    Log a large payload at DEBUG, subject to sampling and rate limiting
+
+    Args:
+        logger: Logger to write to
+        key: Sampling bucket (e.g. "llm_response")
+        msg: %-style message; args are only formatted if the record is emitted
+    """
+    if logger.isEnabledFor(logging.DEBUG) and payload_sampler.should_log(key):
+        logger.debug(msg, *args, **kwargs)
@@ -0,0 +1,167 @@
+"""
+Per-node model selection with latency-aware fallback
+"""
+import logging
+import math
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+NODE_NAMES = ("validate_input", "extract_keywords", "analyze_and_score", "format_output")
+
+DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini")
+FALLBACK_MODEL = os.getenv("OPENAI_FALLBACK_MODEL", "")
+FALLBACK_API_BASE = os.getenv("OPENAI_FALLBACK_API_BASE", "")
+LLM_P95_THRESHOLD_SECONDS = float(os.getenv("LLM_P95_THRESHOLD_SECONDS", "0"))  # 0 disables fallback
+LLM_LATENCY_WINDOW_SECONDS = float(os.getenv("LLM_LATENCY_WINDOW_SECONDS", "60"))
+LLM_LATENCY_MIN_SAMPLES = int(os.getenv("LLM_LATENCY_MIN_SAMPLES", "10"))
+LLM_LATENCY_MAX_SAMPLES = 500
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """A model on a specific endpoint (base_url None means the default OPENAI_API_BASE)"""
+    model: str
+    base_url: Optional[str] = None
+
+    @property
+    def label(self) -> str:
+        return f"{self.model}@{self.base_url}" if self.base_url else self.model
+
+
+def _node_env(prefix: str, node: str) -> str:
+    """Read a per-node override such as OPENAI_MODEL_EXTRACT_KEYWORDS"""
+    return os.getenv(f"{prefix}_{node.upper()}", "")
+
+
+class LatencyTracker:
+    """Sliding-window latency samples for one route"""
+
+    def __init__(self, window_seconds: float, max_samples: int = LLM_LATENCY_MAX_SAMPLES):
+        self.window_seconds = window_seconds
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=max_samples)
+
+    def add(self, seconds: float, now: float):
+        self._samples.append((now, seconds))
+
+    def _prune(self, now: float):
+        while self._samples and now - self._samples[0][0] > self.window_seconds:
+            self._samples.popleft()
+
+    def p95(self, now: float) -> Tuple[Optional[float], int]:
+        """Return (p95 latency or None if there are no samples, sample count)"""
+        self._prune(now)
+        if not self._samples:
+            return None, 0
+        values = sorted(seconds for _, seconds in self._samples)
+        index = max(0, math.ceil(0.95 * len(values)) - 1)
+        return values[index], len(values)
+
+
+class ModelRouter:
+    """
+    Resolve the model for each workflow node and fall back when the primary is slow
+
+    Each node uses OPENAI_MODEL_<NODE> (default OPENAI_MODEL). If a fallback is
+    configured and the primary's p95 latency over the recent window exceeds
+    LLM_P95_THRESHOLD_SECONDS, calls go to the fallback instead. Samples age out
+    of the window, so the primary is retried automatically once it goes quiet.
+    """
+
+    def __init__(
+        self,
+        p95_threshold: float = LLM_P95_THRESHOLD_SECONDS,
+        window_seconds: float = LLM_LATENCY_WINDOW_SECONDS,
+        min_samples: int = LLM_LATENCY_MIN_SAMPLES
+    ):
+        self.p95_threshold = p95_threshold
+        self.window_seconds = window_seconds
+        self.min_samples = min_samples
+        self._lock = threading.Lock()
+        self._trackers: Dict[ModelRoute, LatencyTracker] = {}
+        self._fallback_calls: Dict[str, int] = {}
+
+    def primary(self, node: str) -> ModelRoute:
+        """Configured primary route for a node"""
+        return ModelRoute(
+            model=_node_env("OPENAI_MODEL", node) or DEFAULT_MODEL,
+            base_url=_node_env("OPENAI_API_BASE", node) or None
+        )
+
+    def fallback(self, node: str) -> Optional[ModelRoute]:
+        """Configured fallback route for a node, if any"""
+        model = _node_env("OPENAI_FALLBACK_MODEL", node) or FALLBACK_MODEL
+        base_url = _node_env("OPENAI_FALLBACK_API_BASE", node) or FALLBACK_API_BASE or None
+        if not model and not base_url:
+            return None
+        route = ModelRoute(model=model or self.primary(node).model, base_url=base_url)
+        return None if route == self.primary(node) else route
+
+    def select(self, node: str) -> ModelRoute:
+        """
+        Pick the route for the next LLM call of a node
+
+        Args:
+            node: Workflow node name
+
+        Returns:
+            ModelRoute: Primary route, or the fallback if the primary is over its p95 budget
+        """
+        primary = self.primary(node)
+        fallback = self.fallback(node)
+        if fallback is None or self.p95_threshold <= 0:
+            return primary
+
+        with self._lock:
+            tracker = self._trackers.get(primary)
+            p95, count = tracker.p95(time.monotonic()) if tracker else (None, 0)
+            if count < self.min_samples or p95 <= self.p95_threshold:
+                return primary
+            self._fallback_calls[node] = self._fallback_calls.get(node, 0) + 1
+
+        logger.info(
+            "Routing %s to fallback %s - primary %s p95 %.2fs over %d samples",
+            node, fallback.label, primary.label, p95, count
+        )
+        return fallback
+
+    def record(self, route: ModelRoute, seconds: float):
+        """Record the latency of one call made on a route"""
+        with self._lock:
+            tracker = self._trackers.get(route)
+            if tracker is None:
+                tracker = self._trackers[route] = LatencyTracker(self.window_seconds)
+            tracker.add(seconds, time.monotonic())
+
+    def config_signature(self) -> str:
+        """Stable description of the configured primaries, for cache and dedup keys"""
+        return ",".join(f"{node}={self.primary(node).label}" for node in NODE_NAMES)
+
+    def stats(self) -> Dict[str, object]:
+        """Return per-route latency and fallback counters"""
+        now = time.monotonic()
+        with self._lock:
+            routes = {}
+            for route, tracker in self._trackers.items():
+                p95, count = tracker.p95(now)
+                routes[route.label] = {
+                    "samples": count,
+                    "p95_seconds": round(p95, 3) if p95 is not None else None,
+                }
+            return {
+                "p95_threshold_seconds": self.p95_threshold,
+                "routes": routes,
+                "fallback_calls": dict(self._fallback_calls),
+            }
+
+
+model_router = ModelRouter()
@@ -0,0 +1,75 @@
+"""
+Incremental NDJSON parsing of a streamed request body
+"""
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Optional
+
+import orjson
+
+
+@dataclass
+class NDJSONLine:
+    """One parsed line, either with its value or the reason it was rejected"""
+    line_number: int
+    value: Any = None
+    error: Optional[str] = None
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes], max_line_bytes: int) -> AsyncIterator[NDJSONLine]:
+    """
+    Yield NDJSON values as soon as each line is complete
+
+    Only the current partial line is buffered, and it is capped at
+    max_line_bytes: a longer line is reported as an error and skipped
+    without being held in memory. Blank lines are ignored.
+
+    Args:
+        chunks: Body chunks in arrival order (e.g. Request.stream())
+        max_line_bytes: Maximum size of one line
+
+    Yields:
+        NDJSONLine per non-blank line, numbered from 1
+    """
+    buffer = bytearray()
+    line_number = 0
+    oversized = False
+
+    def finish(line: bytes, too_long: bool) -> Optional[NDJSONLine]:
+        if too_long or len(line) > max_line_bytes:
+            return NDJSONLine(line_number, error=f"Line exceeds maximum size of {max_line_bytes} bytes")
+        if not line.strip():
+            return None
+        try:
+            return NDJSONLine(line_number, value=orjson.loads(line))
+        except orjson.JSONDecodeError as e:
+            return NDJSONLine(line_number, error=f"Invalid JSON: {e}")
+
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end == -1:
+                if not oversized:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_line_bytes:
+                        # Drop the rest of the line as it arrives
+                        oversized = True
+                        buffer.clear()
+                break
+
+            line_number += 1
+            if not oversized:
+                buffer += chunk[start:end]
+            parsed = finish(bytes(buffer), oversized)
+            if parsed is not None:
+                yield parsed
+            buffer.clear()
+            oversized = False
+            start = end + 1
+
+    # A final line without a trailing newline
+    if oversized or buffer.strip():
+        line_number += 1
+        parsed = finish(bytes(buffer), oversized)
+        if parsed is not None:
+            yield parsed
@@ -0,0 +1,239 @@
+"""
+Opt-in per-request profiling: wall vs CPU time per workflow node plus cProfile hot spots
+"""
+import contextvars
+import cProfile
+import functools
+import hmac
+import logging
+import os
+import pstats
+import random
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from starlette.middleware.base import BaseHTTPMiddleware
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_ID_HEADER = "X-Profile-Id"
+# Requests carrying PROFILE_HEADER with this value are profiled; unset disables the header
+PROFILE_ADMIN_TOKEN = os.getenv("PROFILE_ADMIN_TOKEN", "")
+PROFILE_SAMPLE_RATE = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+PROFILE_STORE_SIZE = int(os.getenv("PROFILE_STORE_SIZE", "50"))
+PROFILE_TOP_FUNCTIONS = int(os.getenv("PROFILE_TOP_FUNCTIONS", "30"))
+# Only workflow endpoints are worth profiling
+PROFILE_PATH_PREFIX = "/api/v1/resume-analyzer/"
+# Streaming endpoints do their work after the response starts, so their profiles would be empty
+PROFILE_EXCLUDED_PATHS = frozenset({
+    PROFILE_PATH_PREFIX + "analyze-archive",
+    PROFILE_PATH_PREFIX + "analyze-stream",
+})
+
+_active: contextvars.ContextVar[Optional["RequestProfile"]] = contextvars.ContextVar("active_profile", default=None)
+_current_stage: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar("profile_stage", default=None)
+
+
+def profiling_enabled() -> bool:
+    """Whether any request can be profiled (otherwise the middleware isn't installed)"""
+    return bool(PROFILE_ADMIN_TOKEN) or PROFILE_SAMPLE_RATE > 0
+
+
+class RequestProfile:
+    """Timings and cProfile statistics collected for one request"""
+
+    def __init__(self, path: str, trigger: str):
+        self.id = uuid.uuid4().hex
+        self.path = path
+        self.trigger = trigger  # "header" or "sampled"
+        self.created_at = time.time()
+        self.wall_seconds = 0.0
+        self.status_code: Optional[int] = None
+        self.stages: Dict[str, Dict[str, float]] = {}
+        self._stats: Optional[pstats.Stats] = None
+        self._lock = threading.Lock()
+
+    def add_stage(self, name: str, wall: float, cpu: float, profiler: Optional[cProfile.Profile] = None):
+        with self._lock:
+            stage = self.stages.setdefault(
+                name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "llm_wait_seconds": 0.0}
+            )
+            stage["calls"] += 1
+            stage["wall_seconds"] += wall
+            stage["cpu_seconds"] += cpu
+            if profiler is not None:
+                if self._stats is None:
+                    self._stats = pstats.Stats(profiler)
+                else:
+                    self._stats.add(profiler)
+
+    def add_llm_wait(self, stage_name: str, seconds: float):
+        with self._lock:
+            stage = self.stages.setdefault(
+                stage_name, {"calls": 0, "wall_seconds": 0.0, "cpu_seconds": 0.0, "llm_wait_seconds": 0.0}
+            )
+            stage["llm_wait_seconds"] += seconds
+
+    def top_functions(self, limit: int = PROFILE_TOP_FUNCTIONS) -> List[Dict[str, Any]]:
+        """Functions with the most self time across all profiled stages"""
+        with self._lock:
+            if self._stats is None:
+                return []
+            rows = [
+                {
+                    "function": f"{func}:{line}({name})" if line else name,
+                    "calls": calls,
+                    "self_seconds": round(self_time, 6),
+                    "cumulative_seconds": round(cumulative, 6),
+                }
+                for (func, line, name), (_, calls, self_time, cumulative, _) in self._stats.stats.items()
+            ]
+        rows.sort(key=lambda row: row["self_seconds"], reverse=True)
+        return rows[:limit]
+
+    def to_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            stages = {
+                name: {key: round(value, 6) if isinstance(value, float) else value for key, value in stage.items()}
+                for name, stage in self.stages.items()
+            }
+        return {
+            "id": self.id,
+            "path": self.path,
+            "trigger": self.trigger,
+            "created_at": self.created_at,
+            "status_code": self.status_code,
+            "wall_seconds": round(self.wall_seconds, 6),
+            "stages": stages,
+            "top_functions": self.top_functions(),
+        }
+
+
+class ProfileStore:
+    """Most recent request profiles, retrievable by id"""
+
+    def __init__(self, max_size: int = PROFILE_STORE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._profiles: "OrderedDict[str, RequestProfile]" = OrderedDict()
+
+    def add(self, profile: RequestProfile):
+        with self._lock:
+            self._profiles[profile.id] = profile
+            if len(self._profiles) > self.max_size:
+                self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        with self._lock:
+            return self._profiles.get(profile_id)
+
+    def list(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            profiles = list(self._profiles.values())
+        return [
+            {"id": p.id, "path": p.path, "trigger": p.trigger, "created_at": p.created_at, "wall_seconds": round(p.wall_seconds, 6)}
+            for p in reversed(profiles)
+        ]
+
+
+profile_store = ProfileStore()
+
+
+def is_admin_token(value: Optional[str]) -> bool:
+    """Whether a header carries the configured admin token (constant-time comparison)"""
+    return bool(PROFILE_ADMIN_TOKEN) and hmac.compare_digest(value or "", PROFILE_ADMIN_TOKEN)
+
+
+def choose_trigger(header_value: Optional[str]) -> Optional[str]:
+    """Decide whether to profile a request: by admin header, by sampling, or not at all"""
+    if is_admin_token(header_value):
+        return "header"
+    if PROFILE_SAMPLE_RATE > 0 and random.random() < PROFILE_SAMPLE_RATE:
+        return "sampled"
+    return None
+
+
+@contextmanager
+def start_profile(path: str, trigger: str) -> Iterator[RequestProfile]:
+    """Make a new profile active for the current context and store it when done"""
+    profile = RequestProfile(path, trigger)
+    token = _active.set(profile)
+    start = time.perf_counter()
+    try:
+        yield profile
+    finally:
+        profile.wall_seconds = time.perf_counter() - start
+        _active.reset(token)
+        profile_store.add(profile)
+        logger.info("Stored profile %s for %s (%.3fs)", profile.id, path, profile.wall_seconds)
+
+
+@contextmanager
+def profile_stage(name: str, deterministic: bool = True) -> Iterator[None]:
+    """
+    Time a stage of the active profile (no-op when the request isn't profiled)
+
+    Args:
+        name: Stage name, e.g. a workflow node
+        deterministic: Also run cProfile over the stage (current thread only)
+    """
+    profile = _active.get()
+    if profile is None:
+        yield
+        return
+
+    profiler = cProfile.Profile() if deterministic else None
+    stage_token = _current_stage.set(name)
+    wall_start, cpu_start = time.perf_counter(), time.thread_time()
+    if profiler is not None:
+        try:
+            profiler.enable()
+        except ValueError:
+            # Python 3.12+ allows one cProfile per process; keep the timings without hot spots
+            profiler = None
+    try:
+        yield
+    finally:
+        if profiler is not None:
+            profiler.disable()
+        profile.add_stage(name, time.perf_counter() - wall_start, time.thread_time() - cpu_start, profiler)
+        _current_stage.reset(stage_token)
+
+
+def record_llm_wait(seconds: float):
+    """Attribute time spent waiting on the LLM to the current stage, if profiling"""
+    profile = _active.get()
+    if profile is not None:
+        profile.add_llm_wait(_current_stage.get() or "unattributed", seconds)
+
+
+def profiled_node(name: str, node: Callable) -> Callable:
+    """Wrap a workflow node so profiled requests record its wall/CPU time and hot spots"""
+    @functools.wraps(node)
+    def wrapper(state):
+        with profile_stage(name):
+            return node(state)
+    return wrapper
+
+
+class ProfilingMiddleware(BaseHTTPMiddleware):
+    """Profile workflow requests chosen by admin header or sampling; adds X-Profile-Id"""
+
+    async def dispatch(self, request, call_next):
+        path = request.url.path
+        if request.method != "POST" or not path.startswith(PROFILE_PATH_PREFIX) or path in PROFILE_EXCLUDED_PATHS:
+            return await call_next(request)
+        trigger = choose_trigger(request.headers.get(PROFILE_HEADER))
+        if trigger is None:
+            return await call_next(request)
+
+        with start_profile(request.url.path, trigger) as profile:
+            response = await call_next(request)
+            profile.status_code = response.status_code
+        response.headers[PROFILE_ID_HEADER] = profile.id
+        return response
@@ -0,0 +1,45 @@
+"""
+Prompt assembly that keeps shared content ahead of per-candidate content
+
+Providers cache prompts by exact prefix. When many resumes are screened against
+one job description, putting the system prompt and job description first makes
+that part of every request identical, so only the resume is processed fresh.
+"""
+from typing import Optional, Sequence, Tuple
+
+NO_JOB_DESCRIPTION = "(No job description provided)"
+
+Section = Tuple[str, str]
+
+
+def build_user_input(shared: Sequence[Section], per_candidate: Sequence[Section]) -> str:
+    """
+    Join labelled sections into a user message, shared sections first
+
+    Args:
+        shared: (label, text) sections that are the same across a batch
+        per_candidate: (label, text) sections that change for every resume
+
+    Returns:
+        str: User message with one "Label:\\ntext" block per section
+    """
+    blocks = [f"{label}:\n{text}" for label, text in list(shared) + list(per_candidate)]
+    return "\n\n".join(blocks)
+
+
+def job_then_resume(resume_text: str, job_description: str, placeholder: Optional[str] = NO_JOB_DESCRIPTION) -> str:
+    """
+    Standard resume/job message with the job description as the cacheable prefix
+
+    Args:
+        resume_text: Candidate resume text
+        job_description: Job description shared across the batch
+        placeholder: Text used when there is no job description
+
+    Returns:
+        str: User message
+    """
+    return build_user_input(
+        shared=[("Job Description", job_description or placeholder or "")],
+        per_candidate=[("Resume Text", resume_text)]
+    )
@@ -0,0 +1,53 @@
+"""
+Readiness tracking for warm-up of heavy components
+"""
+import threading
+import time
+from typing import Any, Dict, Iterable
+
+REQUIRED_COMPONENTS = ("graph", "llm_client", "caches")
+
+
+class Readiness:
+    """Records which components have finished warming up"""
+
+    def __init__(self, required: Iterable[str] = REQUIRED_COMPONENTS):
+        self.required = tuple(required)
+        self._lock = threading.Lock()
+        self._components: Dict[str, Dict[str, Any]] = {}
+
+    def mark_ready(self, component: str, **details: Any):
+        """Record a component as warm, with optional details (timings, sizes)"""
+        with self._lock:
+            self._components[component] = {"ready": True, "at": time.time(), **details}
+
+    def mark_failed(self, component: str, error: str):
+        """Record a component whose warm-up failed"""
+        with self._lock:
+            self._components[component] = {"ready": False, "at": time.time(), "error": error}
+
+    def is_ready(self) -> bool:
+        """Check whether every required component is warm"""
+        with self._lock:
+            return all(self._components.get(name, {}).get("ready") for name in self.required)
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Summarize warm state for the /ready endpoint
+
+        Returns:
+            Dict with overall "ready" flag and per-component state
+        """
+        with self._lock:
+            components = {
+                name: dict(self._components.get(name, {"ready": False}))
+                for name in self.required
+            }
+        return {
+            "ready": all(component["ready"] for component in components.values()),
+            "components": components,
+        }
+
+
+# Create singleton instance
+readiness = Readiness()
@@ -0,0 +1,79 @@
+"""
+Split resume text into sections and fingerprint them for change detection
+"""
+import hashlib
+import re
+from typing import List, NamedTuple
+
+# Common resume headings, matched case-insensitively against a whole line
+KNOWN_HEADINGS = {
+    "summary", "professional summary", "profile", "objective", "about", "about me",
+    "experience", "work experience", "professional experience", "employment", "employment history",
+    "education", "skills", "technical skills", "core competencies", "projects", "personal projects",
+    "certifications", "certificates", "publications", "awards", "languages", "volunteering",
+    "interests", "achievements", "training", "courses",
+}
+MAX_HEADING_CHARS = 40
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n")
+
+
+class Section(NamedTuple):
+    """One resume section; `digest` identifies its content"""
+    heading: str
+    text: str
+    digest: str
+
+
+def _fingerprint(text: str) -> str:
+    # Whitespace-only edits (re-wrapping, trailing spaces) don't change a section
+    return hashlib.sha256(_WHITESPACE_RE.sub(" ", text).strip().encode("utf-8")).hexdigest()
+
+
+def _is_heading(line: str) -> bool:
+    stripped = line.strip().strip("#*").strip()
+    if not stripped or len(stripped) > MAX_HEADING_CHARS:
+        return False
+    bare = stripped.rstrip(":").strip()
+    if bare.lower() in KNOWN_HEADINGS:
+        return True
+    # "WORK HISTORY" style headings
+    return bare.isupper() and len(bare.split()) <= 4 and any(c.isalpha() for c in bare)
+
+
+def split_sections(text: str) -> List[Section]:
+    """
+    Split resume text at its headings, or at blank lines if it has none
+
+    Text before the first heading becomes a section with an empty heading.
+    Empty sections are dropped.
+
+    Args:
+        text: Resume text
+
+    Returns:
+        List[Section]: Sections in document order
+    """
+    lines = text.splitlines()
+    if not any(_is_heading(line) for line in lines):
+        return [
+            Section("", block.strip(), _fingerprint(block))
+            for block in _BLANK_LINES_RE.split(text)
+            if block.strip()
+        ]
+
+    sections = []
+    heading, body = "", []
+    for line in lines:
+        if _is_heading(line):
+            if "".join(body).strip() or heading:
+                content = "\n".join([heading] + body).strip()
+                sections.append(Section(heading, content, _fingerprint(content)))
+            heading, body = line.strip(), []
+        else:
+            body.append(line)
+    content = "\n".join([heading] + body).strip()
+    if content:
+        sections.append(Section(heading, content, _fingerprint(content)))
+    return sections
@@ -0,0 +1,42 @@
+"""
+In-memory cache of each run's extracted keywords, for rescoring without the LLM
+"""
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+RUN_KEYWORD_CACHE_SIZE = int(os.getenv("RUN_KEYWORD_CACHE_SIZE", "10000"))
+
+
+class RunKeywordCache:
+    """Resume and target keywords by run id, least recently used evicted first"""
+
+    def __init__(self, max_size: int = RUN_KEYWORD_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._runs: "OrderedDict[str, Tuple[List[str], List[str]]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, run_id: str, resume_keywords: List[str], target_keywords: List[str]):
+        with self._lock:
+            self._runs[run_id] = (list(resume_keywords), list(target_keywords))
+            self._runs.move_to_end(run_id)
+            if len(self._runs) > self.max_size:
+                self._runs.popitem(last=False)
+
+    def get(self, run_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        """(resume keywords, target keywords) for a run, or None if not cached"""
+        with self._lock:
+            keywords = self._runs.get(run_id)
+            if keywords is None:
+                self.misses += 1
+                return None
+            self._runs.move_to_end(run_id)
+            self.hits += 1
+            return keywords
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"runs": len(self._runs), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,260 @@
+"""
+Local fuzzy keyword matching with hashed character n-gram TF-IDF vectors
+"""
+import logging
+import os
+import zlib
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Sequence, Set
+
+import numpy as np
+from scipy import sparse
+
+from utils.keywords import SYNONYMS, canonical_keyword_map, canonicalize_keyword, score_keywords
+from utils.skill_lexicon import SKILLS
+
+logger = logging.getLogger(__name__)
+
+# Whether the local scoring fallbacks count near-synonyms; requests can still ask with "semantic": true
+SEMANTIC_MATCHING = os.getenv("SEMANTIC_MATCHING", "false").lower() in ("1", "true", "yes")
+SEMANTIC_MATCH_THRESHOLD = float(os.getenv("SEMANTIC_MATCH_THRESHOLD", "0.6"))
+# Keywords shorter than this (canonical form) only ever match exactly: "Go", "R", "C#"
+SEMANTIC_MIN_CHARS = 4
+NGRAM_SIZES = (2, 3, 4)
+N_FEATURES = 1 << 16
+
+# Canonical pairs that look alike but are different skills
+FALSE_FRIENDS: FrozenSet[FrozenSet[str]] = frozenset(
+    frozenset(pair) for pair in [
+        ("java", "javascript"),
+        ("javascript", "typescript"),
+        ("react", "react native"),
+        ("sql", "nosql"),
+        ("mysql", "postgresql"),
+        ("mysql", "sql server"),
+        ("c++", "c#"),
+        ("angular", "angularjs"),
+        ("scala", "scalability"),
+        ("spark", "sparkle"),
+        ("azure", "azure devops"),
+        ("node.js", "next.js"),
+        ("vue.js", "nuxt.js"),
+        ("machine learning", "deep learning"),
+        ("project management", "product management"),
+        ("data analyst", "data architect"),
+        ("data analysis", "data engineering"),
+        ("data science", "data engineering"),
+        ("frontend development", "backend development"),
+        ("front-end development", "back-end development"),
+    ]
+)
+
+
+def _ngrams(canonical: str) -> List[str]:
+    padded = f" {canonical} "
+    return [padded[i:i + n] for n in NGRAM_SIZES for i in range(len(padded) - n + 1)]
+
+
+def _feature(ngram: str) -> int:
+    # crc32 rather than hash(): stable across processes
+    return zlib.crc32(ngram.encode("utf-8")) % N_FEATURES
+
+
+@lru_cache(maxsize=1)
+def _reference_idf() -> np.ndarray:
+    """
+    IDF per feature over a fixed reference vocabulary (the skill lexicon and
+    synonym table), so a pair's similarity doesn't depend on the other
+    keywords it is compared alongside
+    """
+    reference = {canonicalize_keyword(skill) for skill in SKILLS}
+    reference.update(canonicalize_keyword(spelling) for spellings in SKILLS.values() for spelling in spellings)
+    reference.update(SYNONYMS)
+    reference.update(SYNONYMS.values())
+    document_frequency = np.zeros(N_FEATURES)
+    for keyword in reference:
+        document_frequency[list({_feature(ngram) for ngram in _ngrams(keyword)})] += 1
+    return np.log((1 + len(reference)) / (1 + document_frequency)) + 1.0
+
+
+def _singular(token: str) -> str:
+    return token[:-1] if len(token) > 3 and token.endswith("s") else token
+
+
+def _nested(left: str, right: str) -> bool:
+    """
+    Whether one canonical keyword only narrows or extends the other: a proper
+    token subset ("java" / "java ee", "spring" / "spring boot") or a string
+    prefix other than a plural ending ("type" / "typescript"). Such pairs are
+    related skills, not synonyms.
+    """
+    left_tokens = {_singular(token) for token in left.split()}
+    right_tokens = {_singular(token) for token in right.split()}
+    if left_tokens != right_tokens and (left_tokens <= right_tokens or right_tokens <= left_tokens):
+        return True
+    shorter, longer = sorted((left, right), key=len)
+    return longer.startswith(shorter) and longer[len(shorter):] not in ("", "s", "es")
+
+
+class SemanticMatcher:
+    """
+    Resolve near-synonym keywords ("REST API" / "RESTful API", "led team" /
+    "managed team") without an LLM call
+
+    Keywords are canonicalized (utils/keywords.py), split into padded
+    character 2-4-grams hashed into a sparse vector, weighted by TF-IDF with
+    a fixed IDF (see _reference_idf) and L2-normalized, so one sparse product
+    gives all pairwise cosine similarities. A target keyword with no exact
+    match counts as matched by the most similar resume keyword at or above
+    `threshold`, unless either is shorter than SEMANTIC_MIN_CHARS, one only
+    narrows the other (Java / Java EE) or the pair is a known false friend
+    (Java / JavaScript).
+
+    `enabled` only decides whether local_score() (the scoring fallbacks)
+    matches fuzzily; score() and match_batch() always do.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = SEMANTIC_MATCHING,
+        threshold: float = SEMANTIC_MATCH_THRESHOLD,
+        blocklist: FrozenSet[FrozenSet[str]] = FALSE_FRIENDS
+    ):
+        self.enabled = enabled
+        self.threshold = threshold
+        self.blocklist = blocklist
+        self._false_friends: Dict[str, Set[str]] = {}
+        for pair in blocklist:
+            for keyword in pair:
+                self._false_friends.setdefault(keyword, set()).update(pair - {keyword})
+
+    def _vectorize(self, canonical_keywords: Sequence[str]) -> sparse.csr_matrix:
+        """TF-IDF rows for canonical keywords"""
+        rows: List[int] = []
+        columns: List[int] = []
+        for row, keyword in enumerate(canonical_keywords):
+            for ngram in _ngrams(keyword):
+                rows.append(row)
+                columns.append(_feature(ngram))
+        counts = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, columns)),
+            shape=(len(canonical_keywords), N_FEATURES)
+        )
+        counts.sum_duplicates()
+        counts.data = (1.0 + np.log(counts.data)) * _reference_idf()[counts.indices]
+
+        norms = np.sqrt(np.asarray(counts.multiply(counts).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        return sparse.csr_matrix(sparse.diags(1.0 / norms) @ counts)
+
+    def similarity(self, left: Sequence[str], right: Sequence[str]) -> np.ndarray:
+        """
+        Cosine similarity between two keyword lists
+
+        Args:
+            left: Keywords (rows)
+            right: Keywords (columns)
+
+        Returns:
+            np.ndarray: len(left) x len(right) similarities in [0, 1]
+        """
+        canonical = [canonicalize_keyword(k) for k in left] + [canonicalize_keyword(k) for k in right]
+        vectors = self._vectorize(canonical)
+        return (vectors[:len(left)] @ vectors[len(left):].T).toarray()
+
+    def _eligible(self, canonical: str) -> bool:
+        return len(canonical) >= SEMANTIC_MIN_CHARS
+
+    def _blocked(self, resume: str, target: str) -> bool:
+        return resume in self._false_friends.get(target, ()) or _nested(resume, target)
+
+    def match_batch(
+        self,
+        resume_keyword_lists: Sequence[Sequence[str]],
+        target_keywords: Sequence[str]
+    ) -> List[Dict[str, str]]:
+        """
+        Fuzzy matches for many resumes against one job, vectorizing each distinct keyword once
+
+        Args:
+            resume_keyword_lists: One keyword list per resume
+            target_keywords: Keywords extracted from the job description
+
+        Returns:
+            List (per resume) of {target keyword: resume keyword that matches it},
+            covering only targets without an exact canonical match
+        """
+        targets = canonical_keyword_map(target_keywords)
+        candidates = [canonical for canonical in targets if self._eligible(canonical)]
+        if not candidates:
+            return [{} for _ in resume_keyword_lists]
+
+        resume_maps = [canonical_keyword_map(keywords) for keywords in resume_keyword_lists]
+        vocabulary = list(dict.fromkeys(
+            canonical for mapping in resume_maps for canonical in mapping if self._eligible(canonical)
+        ))
+        if not vocabulary:
+            return [{} for _ in resume_keyword_lists]
+
+        vectors = self._vectorize(vocabulary + candidates)
+        similarities = (vectors[:len(vocabulary)] @ vectors[len(vocabulary):].T).toarray()
+        # Only pairs that would match need the (Python-level) blocklist check
+        for row, column in zip(*np.nonzero(similarities >= self.threshold)):
+            if self._blocked(vocabulary[row], candidates[column]):
+                similarities[row, column] = 0.0
+        row_of = {keyword: row for row, keyword in enumerate(vocabulary)}
+
+        matches = []
+        for mapping in resume_maps:
+            rows = [row_of[canonical] for canonical in mapping if canonical in row_of]
+            found: Dict[str, str] = {}
+            if rows:
+                block = similarities[rows]
+                best = block.argmax(axis=0)
+                for column, target in enumerate(candidates):
+                    if target in mapping:
+                        continue  # exact match already
+                    if block[best[column], column] >= self.threshold:
+                        found[targets[target]] = mapping[vocabulary[rows[best[column]]]]
+            matches.append(found)
+        return matches
+
+    def fuzzy_matches(self, resume_keywords: Sequence[str], target_keywords: Sequence[str]) -> Dict[str, str]:
+        """{target keyword: resume keyword} for targets matched only approximately"""
+        return self.match_batch([resume_keywords], target_keywords)[0]
+
+    def score(self, resume_keywords: List[str], target_keywords: List[str]) -> Dict[str, object]:
+        """
+        score_keywords with approximate matches counted as matched
+
+        Args:
+            resume_keywords: Keywords extracted from the resume
+            target_keywords: Keywords extracted from the job description
+
+        Returns:
+            Dict with matched_keywords, missing_keywords, match_score and
+            fuzzy_matches ({target keyword: resume keyword})
+        """
+        fuzzy = self.fuzzy_matches(resume_keywords, target_keywords)
+        scores = score_keywords(list(resume_keywords) + list(fuzzy), target_keywords)
+        scores["fuzzy_matches"] = fuzzy
+        if fuzzy:
+            logger.debug("Fuzzy keyword matches: %s", fuzzy)
+        return scores
+
+    def local_score(self, resume_keywords: List[str], target_keywords: List[str]) -> Dict[str, object]:
+        """score() for the local scoring fallbacks: exact matching only unless `enabled`"""
+        if self.enabled:
+            return self.score(resume_keywords, target_keywords)
+        return {**score_keywords(resume_keywords, target_keywords), "fuzzy_matches": {}}
+
+    def expand(self, resume_keyword_lists: Sequence[Sequence[str]], target_keywords: Sequence[str]) -> List[List[str]]:
+        """Add each resume's fuzzily matched target keywords to its list (for matrix scoring)"""
+        return [
+            list(keywords) + list(fuzzy)
+            for keywords, fuzzy in zip(resume_keyword_lists, self.match_batch(resume_keyword_lists, target_keywords))
+        ]
+
+
+# Create singleton instance
+semantic_matcher = SemanticMatcher()
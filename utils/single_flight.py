@@ -0,0 +1,87 @@
+"""
+Single-flight execution: collapse concurrent identical calls into one
+"""
+import hashlib
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Tuple
+
+
+def make_flight_key(*parts: str) -> str:
+    """
+    Build a collision-safe key from several strings
+
+    Each part is length-prefixed before hashing so ("ab", "c") and ("a", "bc")
+    produce different keys.
+
+    Args:
+        parts: Strings identifying the call
+
+    Returns:
+        str: sha256 hex digest
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        encoded = part.encode("utf-8")
+        digest.update(len(encoded).to_bytes(8, "big"))
+        digest.update(encoded)
+    return digest.hexdigest()
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time; concurrent callers with the same key
+    wait for the in-progress call and receive its result (or its exception)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[str, Future] = {}
+        self.executions = 0
+        self.collapsed = 0
+
+    def do(self, key: str, fn: Callable[..., Any], *args, **kwargs) -> Tuple[Any, bool]:
+        """
+        Execute fn for key, or join an identical call already in flight
+
+        Args:
+            key: Call identity (see make_flight_key)
+            fn: Function to execute
+            args, kwargs: Arguments for fn
+
+        Returns:
+            tuple: (result, shared) where shared is True if this caller joined
+                   another caller's execution
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                self.collapsed += 1
+                leader = False
+            else:
+                future = Future()
+                self._calls[key] = future
+                self.executions += 1
+                leader = True
+
+        if not leader:
+            return future.result(), True
+
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+        return future.result(), False
+
+    def stats(self) -> Dict[str, int]:
+        """Return execution counters"""
+        with self._lock:
+            return {
+                "executions": self.executions,
+                "collapsed": self.collapsed,
+                "in_flight": len(self._calls),
+            }
@@ -0,0 +1,159 @@
+"""
+Skill lexicon: local extraction when the LLM backend is unavailable, and keyword lookup in text
+"""
+import re
+from functools import lru_cache
+from typing import Dict, List, Pattern, Tuple
+
+from utils.keywords import SYNONYMS, canonicalize_keyword
+
+# Display name -> extra spellings. Matching is case-insensitive unless the
+# display name is listed in CASE_SENSITIVE; synonyms also fold through
+# utils.keywords.SYNONYMS so results score the same as LLM-extracted keywords.
+SKILLS: Dict[str, Tuple[str, ...]] = {
+    # Languages
+    "Python": (),
+    "Java": (),
+    "JavaScript": ("JS",),
+    "TypeScript": ("TS",),
+    "Go": ("Golang",),
+    "Rust": (),
+    "C++": ("CPP",),
+    "C#": ("C Sharp",),
+    "Ruby": (),
+    "PHP": (),
+    "Kotlin": (),
+    "Swift": (),
+    "Scala": (),
+    "R": (),
+    "SQL": (),
+    "Bash": ("Shell scripting",),
+    # Frameworks and libraries
+    "React": ("React.js", "ReactJS"),
+    "Angular": (),
+    "Vue.js": ("Vue", "VueJS"),
+    "Node.js": ("Node", "NodeJS"),
+    "Django": (),
+    "Flask": (),
+    "FastAPI": (),
+    "Spring Boot": ("Spring",),
+    ".NET": ("dotnet", "ASP.NET"),
+    "Pandas": (),
+    "NumPy": (),
+    "scikit-learn": ("sklearn",),
+    "PyTorch": (),
+    "TensorFlow": (),
+    "LangChain": (),
+    "LangGraph": (),
+    "GraphQL": (),
+    "REST API": ("RESTful API", "RESTful APIs", "REST APIs"),
+    # Data and infrastructure
+    "PostgreSQL": ("Postgres",),
+    "MySQL": (),
+    "MongoDB": ("Mongo",),
+    "Redis": (),
+    "Elasticsearch": (),
+    "Kafka": (),
+    "Spark": ("Apache Spark", "PySpark"),
+    "Airflow": ("Apache Airflow",),
+    "Snowflake": (),
+    "AWS": ("Amazon Web Services",),
+    "GCP": ("Google Cloud Platform", "Google Cloud"),
+    "Azure": (),
+    "Docker": (),
+    "Kubernetes": ("K8s",),
+    "Terraform": (),
+    "Ansible": (),
+    "Linux": (),
+    "Git": (),
+    "CI/CD": ("Continuous Integration", "Continuous Deployment", "Continuous Delivery"),
+    "Microservices": (),
+    # Practices and domains
+    "Machine Learning": ("ML",),
+    "Deep Learning": (),
+    "Artificial Intelligence": ("AI",),
+    "Natural Language Processing": ("NLP",),
+    "Computer Vision": (),
+    "Data Analysis": (),
+    "Agile": ("Scrum",),
+    "Project Management": (),
+}
+
+# Short names that are ordinary words (or letters) in other casings
+CASE_SENSITIVE = {"Go", "R", "Swift", "Rust", "Spark", "Spring", "Node", "AI", "ML", "TS", "JS", "Git"}
+
+
+@lru_cache(maxsize=4096)
+def _term_pattern(term: str) -> Pattern:
+    # \b fails next to symbols like "+", "#" and ".", so use explicit lookarounds
+    flags = 0 if term in CASE_SENSITIVE else re.IGNORECASE
+    escaped = re.escape(term).replace(r"\ ", r"\s+")
+    return re.compile(rf"(?<![\w+#.]){escaped}(?![\w+#]|\.\w)", flags)
+
+
+@lru_cache(maxsize=1)
+def _compiled_lexicon() -> List[Tuple[str, List[Pattern]]]:
+    return [
+        (display, [_term_pattern(term) for term in (display,) + aliases])
+        for display, aliases in SKILLS.items()
+    ]
+
+
+def extract_skills(text: str) -> List[str]:
+    """
+    Find lexicon skills mentioned in a text
+
+    Args:
+        text: Resume or job description text
+
+    Returns:
+        List[str]: Display names in order of first mention, one per canonical skill
+    """
+    found = []
+    for display, patterns in _compiled_lexicon():
+        positions = [match.start() for pattern in patterns for match in [pattern.search(text)] if match]
+        if positions:
+            found.append((min(positions), display))
+
+    skills = []
+    seen = set()
+    for _, display in sorted(found):
+        canonical = canonicalize_keyword(display)
+        if canonical not in seen:
+            seen.add(canonical)
+            skills.append(display)
+    return skills
+
+
+@lru_cache(maxsize=4096)
+def _spellings(canonical: str) -> Tuple[str, ...]:
+    """Known spellings of a canonical keyword, from the lexicon and the synonym table"""
+    spellings = {alias for alias, target in SYNONYMS.items() if target == canonical}
+    in_lexicon = False
+    for display, aliases in SKILLS.items():
+        if canonicalize_keyword(display) == canonical:
+            in_lexicon = True
+            spellings.add(display)
+            spellings.update(aliases)
+    if not in_lexicon:
+        # The lexicon's display casing keeps case-sensitive names like "Go" from matching "go"
+        spellings.add(canonical)
+    return tuple(sorted(spellings))
+
+
+def mentions(text: str, keyword: str) -> bool:
+    """
+    Whether a text mentions a keyword under any known spelling
+
+    Args:
+        text: Text to search (e.g. one resume section)
+        keyword: Keyword as extracted ("Kubernetes" also matches "K8s")
+
+    Returns:
+        bool: True if the keyword or one of its synonyms appears as a whole term
+    """
+    canonical = canonicalize_keyword(keyword)
+    if not canonical:
+        return False
+    terms = {keyword.strip()} | set(_spellings(canonical))
+    return any(_term_pattern(term).search(text) for term in terms)
@@ -0,0 +1,238 @@
+"""
+Sparse resume x skill matrix scoring for bulk screening
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+
+from utils.keywords import canonical_keyword_map, canonicalize_keyword
+
+
+class SkillVocabulary:
+    """Stable mapping between canonical skills and matrix columns"""
+
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.skills: List[str] = []
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def add(self, canonical_skill: str) -> int:
+        """Return the column of a canonical skill, adding it if unseen"""
+        column = self._index.get(canonical_skill)
+        if column is None:
+            column = len(self.skills)
+            self._index[canonical_skill] = column
+            self.skills.append(canonical_skill)
+        return column
+
+    def get(self, canonical_skill: str) -> Optional[int]:
+        """Return the column of a canonical skill, or None if unseen"""
+        return self._index.get(canonical_skill)
+
+
+@dataclass
+class BatchScores:
+    """Vectorized scoring output for one job against many resumes"""
+    target_keywords: List[str]
+    match_scores: np.ndarray
+    matched_counts: np.ndarray
+    missing_counts: np.ndarray
+    skill_coverage: np.ndarray
+    target_matrix: sparse.csr_matrix
+
+
+def build_resume_matrix(
+    resume_keyword_lists: Sequence[Sequence[str]],
+    vocabulary: SkillVocabulary
+) -> sparse.csr_matrix:
+    """
+    Encode resumes as a sparse binary resume x skill matrix
+
+    Args:
+        resume_keyword_lists: One keyword list per resume
+        vocabulary: Vocabulary to register skills in (extended in place)
+
+    Returns:
+        sparse.csr_matrix: float32 matrix of shape (n_resumes, len(vocabulary))
+    """
+    rows: List[int] = []
+    columns: List[int] = []
+    for row, keywords in enumerate(resume_keyword_lists):
+        for keyword in keywords:
+            canonical = canonicalize_keyword(keyword)
+            if canonical:
+                rows.append(row)
+                columns.append(vocabulary.add(canonical))
+
+    data = np.ones(len(rows), dtype=np.float32)
+    matrix = sparse.csr_matrix(
+        (data, (rows, columns)),
+        shape=(len(resume_keyword_lists), len(vocabulary)),
+        dtype=np.float32
+    )
+    # Duplicate keywords within a resume must not count twice
+    matrix.sum_duplicates()
+    matrix.data[:] = 1.0
+    return matrix
+
+
+def build_job_vector(
+    target_keywords: Sequence[str],
+    vocabulary: SkillVocabulary,
+    keyword_weights: Optional[Dict[str, float]] = None
+) -> tuple[np.ndarray, List[str], List[int]]:
+    """
+    Encode a job description as a weighted skill vector
+
+    Args:
+        target_keywords: Keywords extracted from the job description
+        vocabulary: Vocabulary to register skills in (extended in place)
+        keyword_weights: Optional weight per target keyword (default 1.0)
+
+    Returns:
+        tuple: (weight vector over the vocabulary, original target keywords,
+                vocabulary columns of those keywords)
+    """
+    weights = {canonicalize_keyword(k): float(w) for k, w in (keyword_weights or {}).items()}
+    targets = canonical_keyword_map(target_keywords)
+
+    columns = [vocabulary.add(canonical) for canonical in targets]
+    vector = np.zeros(len(vocabulary), dtype=np.float64)
+    for canonical, column in zip(targets, columns):
+        vector[column] = weights.get(canonical, 1.0)
+
+    return vector, list(targets.values()), columns
+
+
+def score_resumes(
+    resume_keyword_lists: Sequence[Sequence[str]],
+    target_keywords: Sequence[str],
+    keyword_weights: Optional[Dict[str, float]] = None
+) -> BatchScores:
+    """
+    Score many resumes against one job with a single sparse matrix-vector product
+
+    match_score = sum(weights of matched skills) / sum(all target weights), which
+    reduces to matched_count / target_count when no weights are given.
+
+    Args:
+        resume_keyword_lists: One keyword list per resume
+        target_keywords: Keywords extracted from the job description
+        keyword_weights: Optional weight per target keyword
+
+    Returns:
+        BatchScores: Per-resume scores and counts, per-skill coverage
+    """
+    vocabulary = SkillVocabulary()
+    job_vector, targets, target_columns = build_job_vector(target_keywords, vocabulary, keyword_weights)
+    resume_matrix = build_resume_matrix(resume_keyword_lists, vocabulary)
+    # The resume pass may have grown the vocabulary
+    job_vector = np.pad(job_vector, (0, len(vocabulary) - job_vector.shape[0]))
+
+    n_resumes = resume_matrix.shape[0]
+    total_weight = float(job_vector.sum())
+
+    target_matrix = resume_matrix[:, target_columns].tocsr()
+    matched_counts = np.asarray(target_matrix.sum(axis=1)).ravel().astype(np.int64)
+    matched_weight = resume_matrix @ job_vector
+
+    if total_weight > 0:
+        match_scores = np.round(matched_weight / total_weight, 4)
+    else:
+        match_scores = np.zeros(n_resumes, dtype=np.float64)
+
+    if n_resumes:
+        skill_coverage = np.asarray(target_matrix.sum(axis=0)).ravel() / n_resumes
+    else:
+        skill_coverage = np.zeros(len(targets), dtype=np.float64)
+
+    return BatchScores(
+        target_keywords=targets,
+        match_scores=match_scores,
+        matched_counts=matched_counts,
+        missing_counts=len(targets) - matched_counts,
+        skill_coverage=skill_coverage,
+        target_matrix=target_matrix,
+    )
+
+
+@dataclass
+class JobMatrix:
+    """Stored jobs encoded once, for scoring one resume against all of them"""
+    vocabulary: SkillVocabulary
+    weights: sparse.csr_matrix  # jobs x skills, weight of each target keyword
+    indicators: sparse.csr_matrix  # jobs x skills, 1 where the skill is a target
+    total_weights: np.ndarray
+    target_counts: np.ndarray
+
+
+def build_job_matrix(
+    job_target_lists: Sequence[Sequence[str]],
+    job_keyword_weights: Optional[Sequence[Optional[Dict[str, float]]]] = None
+) -> JobMatrix:
+    """
+    Encode many jobs' target keywords as a sparse weighted job x skill matrix
+
+    Args:
+        job_target_lists: Target keywords per job
+        job_keyword_weights: Optional weight per target keyword, per job (default 1.0)
+
+    Returns:
+        JobMatrix: Matrices and per-job totals for score_jobs
+    """
+    vocabulary = SkillVocabulary()
+    rows: List[int] = []
+    columns: List[int] = []
+    data: List[float] = []
+    for row, target_keywords in enumerate(job_target_lists):
+        keyword_weights = job_keyword_weights[row] if job_keyword_weights else None
+        weights = {canonicalize_keyword(k): float(w) for k, w in (keyword_weights or {}).items()}
+        for canonical in canonical_keyword_map(target_keywords):
+            rows.append(row)
+            columns.append(vocabulary.add(canonical))
+            data.append(weights.get(canonical, 1.0))
+
+    shape = (len(job_target_lists), len(vocabulary))
+    weight_matrix = sparse.csr_matrix((np.asarray(data, dtype=np.float64), (rows, columns)), shape=shape)
+    indicators = weight_matrix.copy()
+    indicators.data[:] = 1.0
+    return JobMatrix(
+        vocabulary=vocabulary,
+        weights=weight_matrix,
+        indicators=indicators,
+        total_weights=np.asarray(weight_matrix.sum(axis=1)).ravel(),
+        target_counts=np.asarray(indicators.sum(axis=1)).ravel().astype(np.int64),
+    )
+
+
+def score_jobs(job_matrix: JobMatrix, resume_keywords: Sequence[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Score one resume against every job in a JobMatrix with two sparse products
+
+    Uses the same match_score definition as score_resumes. Resume skills no
+    job asks for are ignored, so the stored vocabulary is never extended.
+
+    Args:
+        job_matrix: Jobs encoded by build_job_matrix
+        resume_keywords: Keywords extracted from the resume
+
+    Returns:
+        tuple: (match score per job, matched target count per job)
+    """
+    resume_vector = np.zeros(len(job_matrix.vocabulary), dtype=np.float64)
+    for keyword in resume_keywords:
+        column = job_matrix.vocabulary.get(canonicalize_keyword(keyword))
+        if column is not None:
+            resume_vector[column] = 1.0
+
+    matched_weight = job_matrix.weights @ resume_vector
+    matched_counts = (job_matrix.indicators @ resume_vector).astype(np.int64)
+    totals = job_matrix.total_weights
+    match_scores = np.round(
+        np.divide(matched_weight, totals, out=np.zeros_like(matched_weight), where=totals > 0), 4
+    )
+    return match_scores, matched_counts